@@ -17,6 +17,15 @@ The functionality includes:
         - how much all of the text should be indented
         - how much text on subsequent lines after the first line should be 
         indented
+    - printing a file of formatted text (print_formatted_file()) while it is
+        read in large blocks, so that files of any size can be printed 
+        without reading all of the file into memory (see 
+        terminal_printer_stream). MessageConverter.feed() converts each part
+        of the text and keeps the line being filled between the parts.
+    - 'python -m terminal_printer' prints text from files or standard input
+        with the formatting commands, for use in a pipeline (see 
+        terminal_printer_cli). Options choose the width, the indents, the
+        colors printed and whether each line or each file is a message.
     - printing headings (print_heading()) which is a specific version of printing 
         formatted text where the text for the heading is provide and a bordering 
         character can be chosen. A line of the bordering character will be printed 
@@ -27,7 +36,48 @@ The functionality includes:
     - convert_message() will convert a string with formatting commands into a
         string that is printable using the print() method and the formatting will
         be applied.
-    - clears the terminal screen (clear_screen()).
+    - MessageConverter objects store the state used by convert_message(). 
+        Converters are kept in a pool and reused rather than being created
+        for every message.
+    - all text is printed through a single TerminalOutput object (output) 
+        so that text printed by a loading thread is never printed in the 
+        middle of a line of text. output.start_background_writer() allows
+        text to be written by a background thread so that print_formatted()
+        does not wait for slow terminals. output.flush() and output.close() 
+        wait until all text has been written.
+    - showing a loading message while a block of code runs using 
+        'with printer.loading("Fetching"):' or '@printer.loading("Fetching")'.
+        Nested loading messages change the text of the active loading 
+        message.
+    - clears the terminal screen (clear_screen()) with an escape sequence 
+        rather than starting a new process. screen is a ScreenControl (see 
+        terminal_printer_screen) which also moves the cursor, clears 
+        regions of the screen, hides the cursor and switches to the 
+        alternate screen, with several changes printed in a single write.
+    - FrameRenderer (see terminal_printer_frame) draws frames of formatted 
+        text, such as a dashboard, printing only the parts of the screen 
+        that changed since the previous frame.
+    - incremental_writer() returns an IncrementalWriter (see 
+        terminal_printer_incremental) which prints text that arrives a few 
+        words at a time. Only the new characters are printed and only the 
+        last line is printed again when a word moves to the next line.
+    - live_region() returns a LiveRegion (see terminal_printer_live) which 
+        keeps status lines at the bottom of the terminal, updated at most a 
+        chosen number of times per second, while other text scrolls above 
+        them.
+    - page_file() shows a large file of formatted text one screen at a time
+        (see terminal_printer_pager). Only the lines on the screen are 
+        converted and the file is memory mapped, with an index of the 
+        positions and formatting of every few hundred lines, so moving 
+        through the file and searching do not read all of it into memory.
+    - print_table() prints a table of formatted text (see 
+        terminal_printer_table). Column widths are found from the first rows
+        or from every row and wide cells are wrapped. Rows can come from a 
+        generator and are printed as they are read.
+    - print_status() prints status messages at most a chosen number of 
+        times per second (see terminal_printer_throttle). Only the latest 
+        message for each channel is printed and the last one is printed when
+        the program exits.
     - applying a pause for a designated time period (pause_before_proceeding())
     - get_input() method allow you to prompt the user for input through the 
         terminal. The functionality includes choosing the preferred input type 
@@ -40,209 +90,176 @@ The functionality includes:
         selection list and only a integer from the list items or "details" will 
         be accepted. If an incorrect input is received then the method will 
         prompt the user to reenter the input until a valid input is received.
+        A timeout can be set for each input and a single key press can be 
+        accepted without waiting for enter (see terminal_printer_keys). Tab
+        completion from the selection list is available with COMPLETION. The 
+        rules for an input are prepared once by an InputValidator (see 
+        get_input_validator()) which can be reused for repeated prompts. 
+        Answers can be taken from a list, file or pipe instead of the User
+        (see get_batch_answers()).
+    - get_input_form() returns an InputForm which asks for several inputs
+        together, checks all of the answers together and asks again only for
+        the inputs with answers that were not valid.
 
 Last modified: 22 January 2024
 """
 
-import os
+# _thread.allocate_lock() gives the same lock as threading.Lock() without
+# importing threading, which would add to the time taken to import this module
+import _thread
+import sys
 import time
-import threading
-import terminal_printer_loading_thread
+import terminal_printer_output
 
-class TerminalPrinter:
+# NOTE threading, terminal_printer_loading_thread and terminal_printer_scheduler
+# are only imported when a loading thread is first started so that short 
+# programs that only print text start quickly
+
+class LazyClassAttribute:
 
     """
-    public variables
-    tables with codes for text colors
+    Class attribute whose value is an attribute of a module that is only 
+    imported the first time the class attribute is used. After the first use
+    the value replaces this object on the class so there is no further cost.
     """
 
-    basic_color_codes = {
-        'gray': '90',
-        'red': '91',
-        'green': '92',
-        'yellow': '93',
-        'blue': '94',
-        'purple': '95',
-        'teal': '96',
-        'white': '97'
-    }
-    
-    
-    color_codes = {
-        'aliceblue': '240;248;255',
-        'antiquewhite': '250;235;215',
-        'aqua': '0;255;255',
-        'aquamarine': '127;255;212',
-        'azure': '240;255;255',
-        'beige': '245;245;220',
-        'bisque': '255;228;196',
-        'black': '0;0;0',
-        'blanchedalmond': '255;235;205',
-        'blue': '0;0;255',
-        'blueviolet': '138;43;226',
-        'brown': '165;42;42',
-        'burlywood': '222;184;135',
-        'cadetblue': '95;158;160',
-        'chartreuse': '127;255;0',
-        'chocolate': '210;105;30',
-        'coral': '255;127;80',
-        'cornflowerblue': '100;149;237',
-        'cornsilk': '255;248;220',
-        'crimson': '220;20;60',
-        'cyan': '0;255;255',
-        'darkblue': '0;0;139',
-        'darkcyan': '0;139;139',
-        'darkgoldenrod': '184;134;11',
-        'darkgray': '169;169;169',
-        'darkgreen': '0;100;0',
-        'darkgrey': '169;169;169',
-        'darkkhaki': '189;183;107',
-        'darkmagenta': '139;0;139',
-        'darkolivegreen': '85;107;47',
-        'darkorange': '255;140;0',
-        'darkorchid': '153;50;204',
-        'darkred': '139;0;0',
-        'darksalmon': '233;150;122',
-        'darkseagreen': '143;188;143',
-        'darkslateblue': '72;61;139',
-        'darkslategray': '47;79;79',
-        'darkslategrey': '47;79;79',
-        'darkturquoise': '0;206;209',
-        'darkviolet': '148;0;211',
-        'deeppink': '255;20;147',
-        'deepskyblue': '0;191;255',
-        'dimgray': '105;105;105',
-        'dimgrey': '105;105;105',
-        'dodgerblue': '30;144;255',
-        'firebrick': '178;34;34',
-        'floralwhite': '255;250;240',
-        'forestgreen': '34;139;34',
-        'fuchsia': '255;0;255',
-        'gainsboro': '220;220;220',
-        'ghostwhite': '248;248;255',
-        'gold': '255;215;0',
-        'goldenrod': '218;165;32',
-        'gray': '128;128;128',
-        'green': '0;128;0',
-        'greenyellow': '173;255;47',
-        'grey': '128;128;128',
-        'honeydew': '240;255;240',
-        'hotpink': '255;105;180',
-        'indianred': '205;92;92',
-        'indigo': '75;0;130',
-        'ivory': '255;255;240',
-        'khaki': '240;230;140',
-        'lavender': '230;230;250',
-        'lavenderblush': '255;240;245',
-        'lawngreen': '124;252;0',
-        'lemonchiffon': '255;250;205',
-        'lightblue': '173;216;230',
-        'lightcoral': '240;128;128',
-        'lightcyan': '224;255;255',
-        'lightgoldenrodyellow': '250;250;210',
-        'lightgray': '211;211;211',
-        'lightgreen': '144;238;144',
-        'lightgrey': '211;211;211',
-        'lightpink': '255;182;193',
-        'lightsalmon': '255;160;122',
-        'lightseagreen': '32;178;170',
-        'lightskyblue': '135;206;250',
-        'lightslategray': '119;136;153',
-        'lightslategrey': '119;136;153',
-        'lightsteelblue': '176;196;222',
-        'lightyellow': '255;255;224',
-        'lime': '0;255;0',
-        'limegreen': '50;205;50',
-        'linen': '250;240;230',
-        'magenta': '255;0;255',
-        'maroon': '128;0;0',
-        'mediumaquamarine': '102;205;170',
-        'mediumblue': '0;0;205',
-        'mediumorchid': '186;85;211',
-        'mediumpurple': '147;112;219',
-        'mediumseagreen': '60;179;113',
-        'mediumslateblue': '123;104;238',
-        'mediumspringgreen': '0;250;154',
-        'mediumturquoise': '72;209;204',
-        'mediumvioletred': '199;21;133',
-        'midnightblue': '25;25;112',
-        'mintcream': '245;255;250',
-        'mistyrose': '255;228;225',
-        'moccasin': '255;228;181',
-        'navajowhite': '255;222;173',
-        'navy': '0;0;128',
-        'oldlace': '253;245;230',
-        'olive': '128;128;0',
-        'olivedrab': '107;142;35',
-        'orange': '255;165;0',
-        'orangered': '255;69;0',
-        'orchid': '218;112;214',
-        'palegoldenrod': '238;232;170',
-        'palegreen': '152;253;152',
-        'paleturquoise': '175;238;238',
-        'palevioletred': '219;112;147',
-        'papayawhip': '255;239;213',
-        'peachpuff': '255;218;185',
-        'peru': '205;133;63',
-        'pink': '255;192;205',
-        'plum': '221;160;221',
-        'powderblue': '176;224;230',
-        'purple': '128;0;128',
-        'red': '255;0;0',
-        'rosybrown': '188;143;143',
-        'royalblue': '65;105;225',
-        'saddlebrown': '139;69;19',
-        'salmon': '250;128;114',
-        'sandybrown': '244;164;96',
-        'seagreen': '46;139;87',
-        'seashell': '255;245;238',
-        'sienna': '160;82;45',
-        'silver': '192;192;192',
-        'skyblue': '135;206;235',
-        'slateblue': '106;90;205',
-        'slategray': '112;128;144',
-        'slategrey': '112;128;144',
-        'snow': '255;250;250',
-        'springgreen': '0;255;127',
-        'steelblue': '70;130;180',
-        'tan': '210;180;140',
-        'teal': '0;128;128',
-        'thistle': '216;191;216',
-        'tomato': '255;99;71',
-        'turquoise': '64;224;208',
-        'saddlebrown': '139;69;19',
-        'violet': '238;130;238',
-        'wheat': '245;222;179',
-        'white': '255;255;255',
-        'whitesmoke': '245;245;245',
-        'yellow': '255;255;0',
-        'yellowgreen': '154;205;50'
-    }
+    def __init__(self, module_name: str, attribute_name: str) -> None:
+
+        self.__module_name = module_name
+        self.__attribute_name = attribute_name
+        self.__name = attribute_name
+
+    def __set_name__(self, owner, name) -> None:
+
+        # record the name used for this attribute in the owning class
+        self.__name = name
+
+    def __get__(self, instance, owner):
+
+        import importlib
+
+        # import module and get value
+        value = getattr(importlib.import_module(self.__module_name),
+            self.__attribute_name)
+
+        # replace this object on the class with the value
+        setattr(owner, self.__name, value)
+
+        return value
+
+class MessageConverter:
+
+    """
+    Stores the state used to convert a message with formatting instructions 
+    into printable lines. TerminalPrinter.convert_message() uses a 
+    MessageConverter so that a TerminalPrinter object, with its loading 
+    thread variables, does not have to be created for every message.\n
+    A MessageConverter can be reused after calling reset(). Converters that 
+    are not in use are kept in a pool. acquire() takes a converter from the 
+    pool and release() resets a converter and returns it to the pool so that
+    converting a message does not create a new object.\n
+    A message can also be converted in parts, for example while it is read 
+    from a file, with start_lines(), feed() for each part and finish(). The 
+    line that is being filled and its indent are kept between the parts.
+    """
+
+    __slots__ = ('buffer', 'bold', 'italics', 'strikethrough', 'underline',
+        'color', 'starting_bracket_index_value', 'paragraph_width', 
+        'text_indent', 'following_line_indent', 'current_indent', 
+        'current_line', 'num_chars_current_line', 'num_lines_finished')
+
+    # converters that are not in use. list.append() and list.pop() are atomic
+    # so the pool can be shared by threads without a lock and a converter 
+    # taken by one thread can not be taken by another thread
+    pool = []
+    POOL_MAX_SIZE = 16
+
+    # buffer entries for characters that are not part of a formatting 
+    # instruction. Buffer entries are never changed so the entry for each 
+    # character is shared by all converters
+    entry_dict = {}
+    ENTRY_DICT_MAX_SIZE = 4096
 
     def __init__(self) -> None:
 
         # variables for use as a buffer
-        self.__buffer = []
-        self.__bold = False
-        self.__italics = False
-        self.__strikethrough = False
-        self.__underline = False
-        self.__color = 'none'
-        self.__starting_bracket_index_value = -1 # -1 signifies no open bracket
+        self.buffer = []
+        self.reset()
 
-        # variables for printing loading message with dots at time intervals
-        self.__loading_thread = None # thread to display message while loading 
-        self.loading_thread_stop_event = threading.Event() # event to stop the
-        # loading thread 
-        self.__loading_thread_max_active_time = 5
-    
-    def __buffer_add_char(self, new_char) -> bool:
+    @classmethod
+    def acquire(cls):
+
+        """
+        Returns a MessageConverter from the pool or a new MessageConverter if 
+        the pool is empty
+        """
+
+        try:
+            return cls.pool.pop()
+        except IndexError:
+            return cls()
+
+    @classmethod
+    def release(cls, converter) -> bool:
+
+        """
+        Resets converter and returns it to the pool. Returns False if the 
+        pool was full and converter was discarded
+        """
+
+        converter.reset()
+
+        if len(cls.pool) >= cls.POOL_MAX_SIZE:
+            return False
+
+        cls.pool.append(converter)
+
+        return True
+
+    def copy(self):
+
+        """
+        Returns a MessageConverter from the pool with the same state as this
+        converter, so that a message being converted with feed() can be 
+        finished by the copy without changing this converter. The copy 
+        should be released when it is no longer needed
+        """
+
+        converter = MessageConverter.acquire()
+
+        for name in self.__slots__:
+            setattr(converter, name, getattr(self, name))
+
+        # buffer entries are never changed so the list can be copied
+        converter.buffer = list(self.buffer)
+
+        return converter
+
+    def reset(self) -> bool:
+
+        """
+        Clears the buffer and all formatting styles so that the converter can 
+        be used for a new message
+        """
+
+        self.buffer.clear()
+        self.bold = False
+        self.italics = False
+        self.strikethrough = False
+        self.underline = False
+        self.color = 'none'
+        self.starting_bracket_index_value = -1 # -1 signifies no open bracket
+        self.start_lines()
+
+        return True
+
+    def buffer_add_char(self, new_char) -> bool:
 
         """
-        adds new_char to __buffer.\n
+        adds new_char to buffer.\n
         Checks if new_char is the last character in a formatting instruction 
         (for example [b]) and, if so, then method will pop the other formatting 
-        instruction characters from __buffer and append characters to __buffer 
+        instruction characters from buffer and append characters to buffer 
         that will implement the formatting instruction
         """
 
@@ -251,11 +268,11 @@ class TerminalPrinter:
             return False
         
         # set buffer length and index value for starting bracket
-        BUFFER_LENGTH = len(self.__buffer)
-        INDEX_VALUE = self.__starting_bracket_index_value
+        BUFFER_LENGTH = len(self.buffer)
+        INDEX_VALUE = self.starting_bracket_index_value
         
         # process new_char
-        if self.__starting_bracket_index_value != -1 and new_char == ']':
+        if self.starting_bracket_index_value != -1 and new_char == ']':
                 
             # a potential opening bracket has been found and new_char could 
             # be a closing bracket of a formatting instruction
@@ -270,25 +287,25 @@ class TerminalPrinter:
 
             # determine type of formatting instruction, if applicable
             if (INDEX_VALUE + 2 == BUFFER_LENGTH
-                and self.__buffer[INDEX_VALUE + 1]['char']
+                and self.buffer[INDEX_VALUE + 1]['char']
                 in ['b', 'i', 'n', 's', 'u']):
 
                 # formatting instruction was 3 characters long and is
                 # [b], [i], [n], [s] or [u]
 
                 # set formatting_instruction
-                if self.__buffer[INDEX_VALUE + 1]['char'] == 'n':
+                if self.buffer[INDEX_VALUE + 1]['char'] == 'n':
                     formatting_instruction = '\n'
                 else:
-                    formatting_instruction = self.__buffer_toggle_formatting(
-                        self.__buffer[INDEX_VALUE + 1]['char'],
-                        self.__bold, self.__italics, self.__strikethrough,
-                        self.__underline, self.__color) 
+                    formatting_instruction = self.buffer_toggle_formatting(
+                        self.buffer[INDEX_VALUE + 1]['char'],
+                        self.bold, self.italics, self.strikethrough,
+                        self.underline, self.color) 
 
             elif (INDEX_VALUE + 4 == BUFFER_LENGTH
-                and self.__buffer[INDEX_VALUE + 1]['char'] in ['i', 't']
-                and self.__buffer[INDEX_VALUE + 2]['char'].isdigit()
-                and self.__buffer[INDEX_VALUE + 3]['char'].isdigit()):
+                and self.buffer[INDEX_VALUE + 1]['char'] in ['i', 't']
+                and self.buffer[INDEX_VALUE + 2]['char'].isdigit()
+                and self.buffer[INDEX_VALUE + 3]['char'].isdigit()):
 
                 # formatting instruction is 5 characters long and is in the
                 # format [ixx] or [txx] (where 'xx' is a number between 0 
@@ -297,9 +314,9 @@ class TerminalPrinter:
                 # set formatting_instruction to initial text values in buffer
                 # plus ']' at the end
                 formatting_instruction = ('[' 
-                    + self.__buffer[INDEX_VALUE + 1]['char']
-                    + self.__buffer[INDEX_VALUE + 2]['char']
-                    + self.__buffer[INDEX_VALUE + 3]['char'] 
+                    + self.buffer[INDEX_VALUE + 1]['char']
+                    + self.buffer[INDEX_VALUE + 2]['char']
+                    + self.buffer[INDEX_VALUE + 3]['char'] 
                     + ']')
                 
                 # set formatting_instruction_type to 'special_formatting_char' 
@@ -310,27 +327,27 @@ class TerminalPrinter:
                 formatting_instruction_type = 'special_formatting_char'
 
             elif (INDEX_VALUE + 7 == BUFFER_LENGTH
-                and self.__buffer[INDEX_VALUE + 1]['char'] == 'c'
-                and self.__buffer[INDEX_VALUE + 2]['char'] == '-'
-                and self.__buffer[INDEX_VALUE + 3]['char'] == 'n'
-                and self.__buffer[INDEX_VALUE + 4]['char'] == 'o'
-                and self.__buffer[INDEX_VALUE + 5]['char'] == 'n'
-                and self.__buffer[INDEX_VALUE + 6]['char'] == 'e'):
+                and self.buffer[INDEX_VALUE + 1]['char'] == 'c'
+                and self.buffer[INDEX_VALUE + 2]['char'] == '-'
+                and self.buffer[INDEX_VALUE + 3]['char'] == 'n'
+                and self.buffer[INDEX_VALUE + 4]['char'] == 'o'
+                and self.buffer[INDEX_VALUE + 5]['char'] == 'n'
+                and self.buffer[INDEX_VALUE + 6]['char'] == 'e'):
 
-                # update __color value to 'none'
-                self.__color = 'none'
+                # update color value to 'none'
+                self.color = 'none'
 
                 # append text to clear all styles to formatting_instruction
-                formatting_instruction += self.get_formatting_clear_formatting()
+                formatting_instruction += TerminalPrinter.get_formatting_clear_formatting()
 
                 # append text to set all existing styles to formatting_instruction
-                formatting_instruction += self.get_formatting_start_formatting(
-                    self.__bold, self.__italics, self.__strikethrough,
-                    self.__underline, self.__color) 
+                formatting_instruction += TerminalPrinter.get_formatting_start_formatting(
+                    self.bold, self.italics, self.strikethrough,
+                    self.underline, self.color) 
 
             elif (INDEX_VALUE + 5 < BUFFER_LENGTH
-                and self.__buffer[INDEX_VALUE + 1]['char'] == 'c'
-                and self.__buffer[INDEX_VALUE + 2]['char'] == '-'):
+                and self.buffer[INDEX_VALUE + 1]['char'] == 'c'
+                and self.buffer[INDEX_VALUE + 2]['char'] == '-'):
 
                 # formatting instruction is at least 7 characters long and 
                 # starts with '[c-'
@@ -340,10 +357,10 @@ class TerminalPrinter:
 
                 # populate new_color
                 for i in range(INDEX_VALUE + 3, BUFFER_LENGTH):
-                    new_color += self.__buffer[i]['char']
+                    new_color += self.buffer[i]['char']
                 
                 # check current_color is a valid code
-                color_code_text = self.get_formatting_color_code_text(new_color)
+                color_code_text = TerminalPrinter.get_formatting_color_code_text(new_color)
 
                 # if color_code was valid then append formatting code otherwise
                 # do not change return_text
@@ -351,62 +368,125 @@ class TerminalPrinter:
                     
                     formatting_instruction += color_code_text
 
-                    # update __color value to 'none'
-                    self.__color = new_color
+                    # update color value to 'none'
+                    self.color = new_color
 
-            # update __buffer if formatting_instruction was created
+            # update buffer if formatting_instruction was created
             if formatting_instruction:
 
-                # pop all elements from __starting_bracket_index_value,
-                # i.e. '[' onwards, from __buffer as they will be replaced
+                # pop all elements from starting_bracket_index_value,
+                # i.e. '[' onwards, from buffer as they will be replaced
                 # with characters to implement the formatting instruction
-                while (len(self.__buffer)
+                while (len(self.buffer)
                     > INDEX_VALUE):
 
-                    # pop last element from __buffer
-                    self.__buffer.pop()
+                    # pop last element from buffer
+                    self.buffer.pop()
 
-                # __buffer is ready for formatting instruction characters
+                # buffer is ready for formatting instruction characters
 
                 # append new formatting_instruction to buffer
                 for i in range(len(formatting_instruction)):
-                    self.__buffer.append({'char': formatting_instruction[i],
+                    self.buffer.append({'char': formatting_instruction[i],
                     'type': formatting_instruction_type})
 
             else:
 
-                # ']' is a normal character so can be appended to __buffer
-                self.__buffer.append({'char': ']', 'type': 'standard_char'})
+                # ']' is a normal character so can be appended to buffer
+                self.buffer.append({'char': ']', 'type': 'standard_char'})
 
-            # update __starting_bracket_index_value to -1 as a closing 
+            # update starting_bracket_index_value to -1 as a closing 
             # bracket, ']', was encountered
-            self.__starting_bracket_index_value = -1    
+            self.starting_bracket_index_value = -1    
 
         else:
 
-            # if new_char is a '[' then update __starting_bracket_index_value
-            # as the length of __buffer before adding the character (i.e. its
+            # if new_char is a '[' then update starting_bracket_index_value
+            # as the length of buffer before adding the character (i.e. its
             # index position)
             if new_char == '[':
-                self.__starting_bracket_index_value = len(self.__buffer)
+                self.starting_bracket_index_value = len(self.buffer)
 
-            # append new_char details to __buffer
+            # append new_char details to buffer
             if new_char.isspace():
 
                 # new_char is a space
 
-                # append ' ' to __buffer
-                self.__buffer.append({'char': ' ', 'type': 'space_char'})
+                # append ' ' to buffer
+                self.buffer.append({'char': ' ', 'type': 'space_char'})
             
             else:
 
                 # new_char is a standard character
 
-                # append new_char to __buffer
-                self.__buffer.append({'char': new_char, 'type': 'standard_char'})
+                # append new_char to buffer
+                self.buffer.append({'char': new_char, 'type': 'standard_char'})
 
         # new_char processed
         return True
+
+    def buffer_add_text(self, text_to_add) -> bool:
+
+        """
+        adds each character of text_to_add to buffer.\n
+        Only '[' and ']' can start or finish a formatting instruction so they
+        are passed to buffer_add_char() and the characters between them are 
+        added to buffer together
+        """
+
+        # only strings are split, anything else is added one item at a time
+        if not isinstance(text_to_add, str):
+
+            for char in text_to_add:
+                self.buffer_add_char(char)
+
+            return True
+
+        entry_dict = MessageConverter.entry_dict
+        get_buffer_entry = MessageConverter.get_buffer_entry
+
+        for part_number, part in enumerate(text_to_add.split('[')):
+
+            # each part after the first follows a '['
+            if part_number:
+                self.buffer_add_char('[')
+
+            for text_number, text in enumerate(part.split(']')):
+
+                # each text after the first follows a ']'
+                if text_number:
+                    self.buffer_add_char(']')
+
+                if text:
+                    self.buffer.extend([entry_dict.get(char) 
+                        or get_buffer_entry(char) for char in text])
+
+        return True
+
+    @classmethod
+    def get_buffer_entry(cls, char) -> dict:
+
+        """
+        Returns the buffer entry for char when it is not part of a formatting
+        instruction, for example {'char': 'T', 'type': 'standard_char'}
+        """
+
+        entry = cls.entry_dict.get(char)
+
+        if entry is None:
+
+            if char.isspace():
+                entry = {'char': ' ', 'type': 'space_char'}
+            else:
+                entry = {'char': char, 'type': 'standard_char'}
+
+            # empty the entries when there are too many
+            if len(cls.entry_dict) >= cls.ENTRY_DICT_MAX_SIZE:
+                cls.entry_dict.clear()
+
+            cls.entry_dict[char] = entry
+
+        return entry
     
     def buffer_clear(self) -> bool:
 
@@ -415,22 +495,22 @@ class TerminalPrinter:
         from the buffer and returns True when done
         """
 
-        self.__buffer.clear()
+        self.buffer.clear()
 
         return True
 
-    def __buffer_is_empty(self) -> bool:
+    def buffer_is_empty(self) -> bool:
 
         """
-        Returns True if self.__buffer is empty otherwise returns True
+        Returns True if self.buffer is empty otherwise returns True
         """
 
-        if self.__buffer:
+        if self.buffer:
             return False
         else:
             return True
         
-    def __buffer_load_message(self, message_to_convert) -> bool:
+    def buffer_load_message(self, message_to_convert) -> bool:
 
         """
         Receives a string which may have formatting instructions embedded within
@@ -440,24 +520,72 @@ class TerminalPrinter:
         into the buffer and can be retrieved using return_test_from_buffer().
         """
 
-        # append each character into __buffer
-        for char in message_to_convert:
-            self.__buffer_add_char(char)
+        # append each character into buffer
+        self.buffer_add_text(message_to_convert)
+
+        self.buffer_finish_message()
+
+    def buffer_finish_message(self) -> bool:
+
+        """
+        Adds characters to the end of the buffer to clear the formatting of 
+        the message, if there is any formatting
+        """
 
         # check if there is any formatting in message stored in buffer and, 
         # if so, then add characters to clear the formatting.
-        if (self.__bold or self.__italics or self.__strikethrough 
-            or self.__underline or self.__color):
+        if (self.bold or self.italics or self.strikethrough 
+            or self.underline or self.color):
 
             # get text to clear formatting
-            clear_formatting_text = self.get_formatting_clear_formatting()
+            clear_formatting_text = TerminalPrinter.get_formatting_clear_formatting()
 
-            # append clear_formatting_text to __buffer
+            # append clear_formatting_text to buffer
             for char in clear_formatting_text:
 
-                self.__buffer.append({'char': char, 'type': 'formatting_char'})
+                self.buffer.append({'char': char, 'type': 'formatting_char'})
+
+        return True
+
+    def buffer_get_num_unfinished(self, MAX_NUM_CHARACTERS=1000) -> int:
+
+        """
+        Returns the number of entries at the end of the buffer that could 
+        still change when more characters of the message are added. These are
+        the entries from an opening bracket that has not been closed, which 
+        could become a formatting instruction, and the block of characters of
+        the same type before it, which more characters could make longer. 
+        Whole portions of MAX_NUM_CHARACTERS characters of a long block will 
+        not change so they are not counted.
+        """
+
+        # entries from an open bracket onwards could still change
+        if self.starting_bracket_index_value != -1:
+            end_index = self.starting_bracket_index_value
+        else:
+            end_index = len(self.buffer)
+
+        if not end_index:
+            return len(self.buffer)
+
+        # find start of the last block of characters of the same type
+        block_type = self.buffer[end_index - 1]['type']
+        start_index = end_index - 1
+
+        while (start_index 
+            and self.buffer[start_index - 1]['type'] == block_type):
+
+            start_index -= 1
+
+        # text and spaces are returned in portions of MAX_NUM_CHARACTERS so 
+        # whole portions are finished
+        if block_type in ['standard_char', 'space_char']:
+            start_index += ((end_index - start_index - 1) 
+                // MAX_NUM_CHARACTERS * MAX_NUM_CHARACTERS)
 
-    def __buffer_return_text_portion(self, MAX_NUM_CHARACTERS=1000):
+        return len(self.buffer) - start_index
+
+    def buffer_return_text_portion(self, MAX_NUM_CHARACTERS=1000):
 
         """
         return tuples consisting of a string up to MAX_NUM_CHARACTERS in length 
@@ -468,77 +596,69 @@ class TerminalPrinter:
         essentially unlimited as it is much longer than any word.
         """
 
-        # check that there are entries in the buffer
-        if not self.__buffer:
+        # read the block from the start of the buffer and remove it
+        return_string, num_non_formatting_chars, block_type, end_index = (
+            self.buffer_read_text_portion(0, MAX_NUM_CHARACTERS))
+        del self.buffer[:end_index]
 
-            # there are no entries in __buffer
+        # return characters in return_string and number of non-formatting 
+        # characters
+        return return_string, num_non_formatting_chars, block_type
 
-            return '', 0, ''
+    def buffer_read_text_portion(self, start_index, MAX_NUM_CHARACTERS=1000):
 
-        # set variable for type of characters to be returned in this block
-        block_type = self.__buffer[0]['type']
-        
-        # set list of types that will cause the method to stop appending
-        # characters from the buffer if encountered
-        stopping_type_list = ['formatting_char', 'space_char', 
-            'special_formatting_char', 'standard_char']
-        
-        # remove type of first character in buffer
-        stopping_type_list.remove(block_type)
-        
-        # set variable to count the number of non formatting_char characters
-        # being returned
-        num_non_formatting_chars = 0
+        """
+        Reads the block of characters that buffer_return_text_portion() would
+        return if the buffer started at start_index, without removing it from
+        the buffer. Returns a tuple of the string, the number of characters 
+        of text, the type of characters and the index after the block so 
+        that the buffer can be read in order and the entries removed 
+        together afterwards rather than popped from its front one at a time
+        """
 
-        
+        buffer = self.buffer
+        BUFFER_LENGTH = len(buffer)
 
-        
-        """
-        # check first entry in buffer that is not of type 'formatting_char' and 
-        # update stopping_type_list to reflect current type of character
-        for i in range(len(self.__buffer)):
-            
-            # check that this 
-            if self.__buffer[i]['type'] in stopping_type_list:
-                
-                # remove this type from stopping_type_list so that other 
-                # characters with this type can be returned by this method
-                stopping_type_list.remove(self.__buffer[i]['type'])
+        # check that there are entries in the buffer
+        if start_index >= BUFFER_LENGTH:
 
-                # update block_type
-                block_type = self.__buffer[i]['type']
+            # there are no entries in buffer
 
-                # break for i loop
-                break 
-        """           
+            return '', 0, '', start_index
 
-        # set string to be returned
-        return_string = '' 
+        # set variable for type of characters to be returned in this block
+        block_type = buffer[start_index]['type']
 
-        # append characters into return_string until character in 
-        # stopping_type_list is reached, MAX_NUM_CHARACTERS is reached or 
-        # there are no more characters in the buffer
-        while (self.__buffer 
-            and self.__buffer[0]['type'] not in stopping_type_list
-            and num_non_formatting_chars < MAX_NUM_CHARACTERS):
-            
-            # pop first entry from buffer
-            buffer_entry = self.__buffer.pop(0)
+        # formatting characters are not counted so their blocks are not 
+        # limited by MAX_NUM_CHARACTERS
+        if block_type in ('formatting_char', 'special_formatting_char'):
+            is_text = False
+            MAX_END_INDEX = BUFFER_LENGTH
+        else:
+            is_text = True
+            MAX_END_INDEX = min(BUFFER_LENGTH, 
+                start_index + MAX_NUM_CHARACTERS)
 
-            # append popped character to return_string
-            return_string += buffer_entry['char']
+        # find the end of the block of characters of block_type
+        end_index = start_index
 
-            # increment num_non_formatting_chars if not 'formatting_char' as type
-            if (buffer_entry['type'] 
-                not in ['formatting_char', 'special_formatting_char']):
-                
-                num_non_formatting_chars += 1
+        while (end_index < MAX_END_INDEX 
+            and buffer[end_index]['type'] == block_type):
 
-        # return characters in return_string and number of non-formatting 
-        # characters
-        return return_string, num_non_formatting_chars, block_type 
+            end_index += 1
+
+        return_string = ''.join([buffer_entry['char'] 
+            for buffer_entry in buffer[start_index:end_index]])
+
+        # set number of characters returned, excluding formatting characters
+        if is_text:
+            num_non_formatting_chars = end_index - start_index
+        else:
+            num_non_formatting_chars = 0
+
+        return return_string, num_non_formatting_chars, block_type, end_index
 
-    def __buffer_toggle_formatting(self, formatting_type, current_bold, current_italics,
+    def buffer_toggle_formatting(self, formatting_type, current_bold, current_italics,
         current_strikethrough, current_underline, current_color) -> str:
 
         """
@@ -561,7 +681,7 @@ class TerminalPrinter:
             if formatting_type == 'b':
 
                 # update current_bold to True
-                self.__bold = True
+                self.bold = True
                 
                 # append text to turn on bold formatting style
                 return_text += '\033[1m'
@@ -569,7 +689,7 @@ class TerminalPrinter:
             elif formatting_type == 'i':
 
                 # update current_italics to True
-                self.__italics = True
+                self.italics = True
 
                 # append text to turn on italics formatting style
                 return_text += '\033[3m'
@@ -577,7 +697,7 @@ class TerminalPrinter:
             elif formatting_type == 's':
 
                 # update current_strikethrough to True
-                self.__strikethrough = True
+                self.strikethrough = True
 
                 # append text to turn on italics formatting style
                 return_text += '\033[9m'
@@ -585,7 +705,7 @@ class TerminalPrinter:
             else:
 
                 # update current_underline to True
-                self.__underline = True
+                self.underline = True
 
                 # append text to turn on underline formatting style
                 return_text += '\033[4m'
@@ -597,311 +717,193 @@ class TerminalPrinter:
             # set chosen formatting style to False
             if formatting_type == 'b':
 
-                self.__bold = False
+                self.bold = False
                 current_bold = False
 
             elif formatting_type == 'i':
 
-                self.__italics = False
+                self.italics = False
                 current_italics = False
 
             elif formatting_type == 's':
 
-                self.__strikethrough = False
+                self.strikethrough = False
                 current_strikethrough = False
             
             else:
 
-                self.__underline = False
+                self.underline = False
                 current_underline = False
 
             # append text to clear all styles
-            return_text += self.get_formatting_clear_formatting()
+            return_text += TerminalPrinter.get_formatting_clear_formatting()
 
             # append other formatting text
-            return_text += self.get_formatting_start_formatting(current_bold,
+            return_text += TerminalPrinter.get_formatting_start_formatting(current_bold,
                 current_italics, current_strikethrough, current_underline, 
                 current_color)
 
         return return_text
 
-    def loading_thread_active(self) -> bool:
+    def convert(self, message_to_convert, PARAGRAPH_WIDTH=80, TEXT_INDENT=0,
+        FOLLOWING_LINE_INDENT=0) -> list:
 
         """
-        Checks whether there is currently a loading thread active and, if so,
-        returns True otherwise returns False
+        Converts message_to_convert into a list of printable lines. See 
+        TerminalPrinter.convert_message() for details of the parameters. 
+        The converter should be reset before converting another message.
         """
 
-        if not self.__loading_thread or not self.__loading_thread.is_alive():
-            return False
-        else:
-            return True
-
-    def loading_thread_finish(self):
+        # set line variables
+        self.start_lines(PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, 
+            TEXT_INDENT=TEXT_INDENT, 
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
 
-        """
-        Terminates an existing thread that was printing a loading message
-        """
+        # load message_to_convert into buffer
+        self.buffer_load_message(message_to_convert)
 
-        # Notify the thread to terminate
-        self.loading_thread_stop_event.set()
+        # retrieve all characters from buffer
+        return self.buffer_return_lines(FINISH=True)
 
-        # Wait for the thread to finish
-        self.__loading_thread.join()
-    
-    def loading_thread_start(self, starting_text: str = "Loading", 
-        time_between_dots: float = 0.5, time_before_start: float = 0.25):
+    def start_lines(self, PARAGRAPH_WIDTH=80, TEXT_INDENT=0, 
+        FOLLOWING_LINE_INDENT=0) -> bool:
 
         """
-        Creates a thread that prints starting_text and then prints a "." at
-        time_between time intervals until the thread is terminated.
-
-        parameters: 
-        starting_text is the text to be printed at the beginning of the text,
-        such as "Loading" 
-        time_between is the time in seconds between "." being printed.
+        Sets the line variables for a new message that will be converted with
+        feed() and finish(). See TerminalPrinter.convert_message() for details
+        of the parameters
         """
 
-        # check if there is currently a loading thread running
-        if self.__loading_thread:
-
-            # finish existing loading_thread
-            self.loading_thread_stop_event.set()
+        self.paragraph_width = PARAGRAPH_WIDTH
+        self.text_indent = TEXT_INDENT
+        self.following_line_indent = FOLLOWING_LINE_INDENT
+        self.current_indent = max(TEXT_INDENT, 0) # set current indent value.
+        #ensures that current_indent is positive
+        self.current_line = ' ' * self.current_indent # string to store 
+        # current line of converted text
+        self.num_chars_current_line = self.current_indent # number of 
+        # printable characters on current line
+        self.num_lines_finished = 0 # number of lines returned so far
 
-            # wait until loading_thread has terminated
-            self.__loading_thread.join()
+        # update current_indent to include FOLLOWING_LINE_INDENT
+        self.current_indent += FOLLOWING_LINE_INDENT
 
-            # reset loading_thread_stop_event
-            self.loading_thread_stop_event.clear()
-        
-        # reset loading_thread_stop_event, if required
-        if self.loading_thread_stop_event.is_set():
-            self.loading_thread_stop_event.clear()
-        
-        # create new loading thread and start the tread
-        self.__loading_thread = terminal_printer_loading_thread.LoadingThread(
-            self.loading_thread_stop_event, starting_text=starting_text,
-            time_before_start=time_before_start,
-            time_between_dots=time_between_dots,
-            max_time_alive=self.__loading_thread_max_active_time)
-        self.__loading_thread.start()
+        return True
 
-    @classmethod
-    def get_basic_color_codes(cls) -> dict:
+    def feed(self, text_to_convert) -> list:
 
         """
-        Returns dictionary containing basic_color_codes (name and number)
+        Adds text_to_convert, the next part of a message, to the buffer and 
+        returns a list of the printable lines that were finished. The end of
+        the text is kept in the buffer if it could still change, for example
+        a word that continues in the next part. start_lines() must be called
+        before the first part and finish() after the last part.\n
+        The buffer is emptied from the front so the parts should be short, 
+        up to a few thousand characters.
         """
 
-        return TerminalPrinter.basic_color_codes
-    
-    @classmethod
-    def get_color_codes(cls) -> dict:
-
-        """
-        Returns dictionary containing color_codes (name and RGB code)
-        """
+        # append each character into buffer
+        self.buffer_add_text(text_to_convert)
 
-        return TerminalPrinter.color_codes
+        return self.buffer_return_lines(
+            NUM_KEPT=self.buffer_get_num_unfinished())
 
-    @staticmethod
-    def clear_screen() -> bool:
+    def finish(self) -> list:
 
         """
-        Clears the terminal screen
+        Finishes a message converted with feed() and returns a list of the 
+        remaining printable lines
         """
 
-        os.system('cls')
+        self.buffer_finish_message()
 
-        return True
-    
-    @staticmethod
-    def combine_list_into_text(list_to_combine, joiner_word='and'):
+        return self.buffer_return_lines(FINISH=True)
 
-        """
-        combines the elements of a list into "element1, element2, and element 3"
-
-        joiner_word is either 'and' or 'or'
+    def buffer_return_lines(self, NUM_KEPT=0, FINISH=False) -> list:
 
-        This function uses an Oxford comma
+        """
+        Retrieves blocks of text from the buffer and returns a list of the 
+        printable lines that were finished. The last NUM_KEPT entries are left
+        in the buffer. If FINISH is True then all entries are retrieved and 
+        the last line is returned even if it is not full.
         """
 
-        # check the number of entries
-        if not list_to_combine:
+        # set variables
+        return_text_list = [] # list of strings to return with converted message
+        NUM_BUFFER_ENTRIES = len(self.buffer)
+        buffer_index = 0 # index of the next entry of the buffer to retrieve.
+        # The retrieved entries are removed together when finished
+
+        # copy line variables for faster access
+        PARAGRAPH_WIDTH = self.paragraph_width
+        TEXT_INDENT = self.text_indent
+        FOLLOWING_LINE_INDENT = self.following_line_indent
+        current_indent = self.current_indent
+        current_line = self.current_line
+        num_chars_current_line = self.num_chars_current_line
 
-            return ""
+        # set variable for whether a new line command was received
+        new_line_received = False
 
-        elif len(list_to_combine) == 1:
+        # retrieve blocks of text from buffer until buffer is empty, or until
+        # only NUM_KEPT entries are left
+        while True:
 
-            return str(list_to_combine[0])
+            # stop before the entries that are kept
+            if not FINISH and NUM_BUFFER_ENTRIES - buffer_index <= NUM_KEPT:
+                break
 
-        elif len(list_to_combine) == 2:
+            # get block of converted text from buffer
+            new_text, num_chars_new_text, new_text_type, buffer_index = (
+                self.buffer_read_text_portion(buffer_index))
 
-            # prepare string
-            return_text = (str(list_to_combine[0]) + " " + joiner_word + " " 
-                + str(list_to_combine[1]))
+            # process depending on new_text_type
+            if new_text_type == 'standard_char':
 
-            return return_text
+                # check if new_text will fit on current_line
+                if (num_chars_new_text + num_chars_current_line 
+                    <= PARAGRAPH_WIDTH):
 
-        else:
+                    # append new_text to current_lien
+                    current_line += new_text
 
-            # set text_list to store portions of text
-            text_list = []
+                    # update num_chars_current_line
+                    num_chars_current_line += num_chars_new_text
 
-            # populate text_list
-            for i in range(len(list_to_combine)):
+                else:
 
-                # check that this is not the first or last entries
-                if i:
+                    # new_text is too long to fit on the current_line
 
-                    # this is not the first so append ", "
-                    text_list.append(", ")
+                    # check if new_text is too large to fully fit on a single line
+                    if num_chars_new_text + current_indent > PARAGRAPH_WIDTH:
 
-                if i == len(list_to_combine) - 1:
+                        # new_text will not fit on a line anyway so split over 
+                        # multiple lines
 
-                    # this is the last entry so append ", and "
-                    text_list.append(joiner_word + " ")
+                        # fill current_line with as much text from new_text as 
+                        # possible
+                        last_index_value = (PARAGRAPH_WIDTH 
+                            - num_chars_current_line) 
+                        current_line += new_text[:last_index_value]
+                        num_chars_current_line = (num_chars_current_line 
+                            + last_index_value)
+                        
+                        # remove characters appended to current_line from 
+                        # new_text
+                        new_text = new_text[last_index_value:]
 
-                # append the names from list_to_combine
-                text_list.append(str(list_to_combine[i]))
+                        # append current_line to return_text_list
+                        return_text_list.append(current_line)
 
-            # combine text_list into a string
-            final_text = ''.join(text_list)
+                        # reset current_line and num_chars_current_line
+                        current_line = ''
+                        num_chars_current_line = 0
+                        
+                        # fill additional lines of text with remaining new_text
+                        while len(new_text):
 
-            # return combined text
-            return final_text
-
-    @staticmethod
-    def convert_message(message_to_convert, PARAGRAPH_WIDTH=80, 
-        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0) -> list:
-
-        """
-        Converts a string into a printable message by converting embedded
-        formatting instructions
-
-        Returns list of strings that can be printed by Python with the embedded 
-        formatting.
-
-        PARAGRAPH_WIDTH is the maximum number of characters that will be printed
-        on a row of text.\n
-        NEW_LINE is whether the curser should go to a new line after the end
-        of all of the text is printed.\n
-        TEXT_INDENT is the number of blank spaces that should appear before every
-        line of text. This amount will count towards the paragraph width, e.g.
-        if TEXT_INDENT is 10 and PARAGRAPH_WIDTH is 80 then the first 10 
-        characters of every line will be 10 blank spaces followed by up to 70
-        characters.\n
-        FOLLOWING_LINE_INDENT is the number of blank spaces (in additional to 
-        any blank spaces for TEXT_INDENT) that should appear before every line
-        of text after the first line of text. This amount will count towards the 
-        paragraph width.\n
-        There are additional formatting instructions that can appear in the 
-        message being converted and they will be between square brackets([]).
-        These are\n:
-        [txx] - tab of size xx. Use two digits. 05 is 5.\n
-        [n] - new line.\n
-        [ixx] - is an additional indent value for the next new line. Note that
-        [i00] will reset the indent value to the text_indent and 
-        following_line_indent values.\n
-        [b] - toggles bold text.\n
-        [i] - toggles italics text.\n
-        [u] - toggles underline text.\n
-        [s] - toggles strikethrough text.\n
-        There are various colors for text. They will be in square brackets with 
-        'c-' followed by the name of the color, the rgb color with 3 numbers 
-        between 0 and 255 each separated by ; or 'none' to clear the color.\n 
-        The color names include: gray, red, green, yellow, blue, purple, teal 
-        and white    
-        """
-
-        # check that message has characters otherwise return and empty string
-        if message_to_convert.isspace():
-
-            return []
-
-        # set variables
-        return_text_list = [] # list of strings to return with converted message
-        current_indent = max(TEXT_INDENT, 0) # set current indent value.
-        #ensures that current_indent is positive
-        current_line = ' ' * current_indent # string to store current line of 
-        # converted text
-        num_chars_current_line = current_indent # number of printable characters 
-        # on current line    
-        
-        # update current_indent to include FOLLOWING_LINE_INDENT
-        current_indent += FOLLOWING_LINE_INDENT   
-                
-        # create text buffer object
-        text_buffer = TerminalPrinter()
-
-        """
-        load message_to_convert into __buffer
-        """
-        
-        # load message_to_convert into text_buffer
-        text_buffer.__buffer_load_message(message_to_convert)
-
-        """
-        retrieve characters from __buffer
-        """
-
-        # set variable for whether a new line command was received
-        new_line_received = False
-
-        # retrieve blocks of text from text_buffer until text_buffer is empty
-        while True:
-
-            # get block of converted text from text_buffer
-            new_text, num_chars_new_text, new_text_type = (
-                text_buffer.__buffer_return_text_portion())
-
-            # process depending on new_text_type
-            if new_text_type == 'standard_char':
-
-                # check if new_text will fit on current_line
-                if (num_chars_new_text + num_chars_current_line 
-                    <= PARAGRAPH_WIDTH):
-
-                    # append new_text to current_lien
-                    current_line += new_text
-
-                    # update num_chars_current_line
-                    num_chars_current_line += num_chars_new_text
-
-                else:
-
-                    # new_text is too long to fit on the current_line
-
-                    # check if new_text is too large to fully fit on a single line
-                    if num_chars_new_text + current_indent > PARAGRAPH_WIDTH:
-
-                        # new_text will not fit on a line anyway so split over 
-                        # multiple lines
-
-                        # fill current_line with as much text from new_text as 
-                        # possible
-                        last_index_value = (PARAGRAPH_WIDTH 
-                            - num_chars_current_line) 
-                        current_line += new_text[:last_index_value]
-                        num_chars_current_line = (num_chars_current_line 
-                            + last_index_value)
-                        
-                        # remove characters appended to current_line from 
-                        # new_text
-                        new_text = new_text[last_index_value:]
-
-                        # append current_line to return_text_list
-                        return_text_list.append(current_line)
-
-                        # reset current_line and num_chars_current_line
-                        current_line = ''
-                        num_chars_current_line = 0
-                        
-                        # fill additional lines of text with remaining new_text
-                        while len(new_text):
-
-                            if (len(new_text) 
-                                > PARAGRAPH_WIDTH - current_indent):
+                            if (len(new_text) 
+                                > PARAGRAPH_WIDTH - current_indent):
 
                                 # append new line with as much of the text as 
                                 # will fit on a line to return_text_list
@@ -953,7 +955,8 @@ class TerminalPrinter:
                 # spaces will not be added to the start of a line when there are 
                 # no other characters on that line already
                 
-                if (not len(return_text_list)
+                if ((not len(return_text_list) 
+                    and not self.num_lines_finished)
                     or (len(current_line) and not current_line.isspace())):
 
                     # Either this is the start of the text and spaces are required 
@@ -1064,7 +1067,7 @@ class TerminalPrinter:
                 return_text_list.append(current_line)
 
                 # reset current_line and num_chars_current_line
-                if text_buffer.__buffer_is_empty():
+                if buffer_index == NUM_BUFFER_ENTRIES:
 
                     # the is no more text in the buffer so set current_line
                     # to an empty string
@@ -1085,8 +1088,8 @@ class TerminalPrinter:
                 if new_line_received:
                     new_line_received = False
             
-            # check if __buffer is empty and go to next line if applicable
-            if text_buffer.__buffer_is_empty():
+            # check if buffer is empty and go to next line if applicable
+            if FINISH and buffer_index == NUM_BUFFER_ENTRIES:
 
                 # text has been converted
 
@@ -1103,1533 +1106,3337 @@ class TerminalPrinter:
                 # all text has been converted so break while True loop
                 break
                 
+        # remove the retrieved entries from buffer
+        del self.buffer[:buffer_index]
+
+        # store line variables for the next part of the message
+        self.current_indent = current_indent
+        self.current_line = current_line
+        self.num_chars_current_line = num_chars_current_line
+        self.num_lines_finished += len(return_text_list)
+
+        # an open bracket moves forward by the number of entries retrieved
+        if FINISH:
+            self.starting_bracket_index_value = -1
+        elif self.starting_bracket_index_value != -1:
+            self.starting_bracket_index_value -= (NUM_BUFFER_ENTRIES 
+                - len(self.buffer))
+
         # return list of printable lines
         return return_text_list
 
-    @staticmethod
-    def get_formatting_clear_formatting() -> str:
+class LoadingScope:
 
-        """
-        Returns string that will clear all existing formatting when passed to 
-        print()
-        """
-        return '\x1b[0m'
-    
-    @staticmethod
-    def get_formatting_start_formatting(bold, italics, strikethrough, underline, 
-            color_text) -> str:
+    """
+    Shows a loading message from a TerminalPrinter while a block of code 
+    runs. Returned by TerminalPrinter.loading() and used as either a context
+    manager:\n
+        with printer.loading("Fetching"):\n
+            ...\n
+    or a decorator:\n
+        @printer.loading("Fetching")\n
+        def fetch():\n
+            ...\n
+    The loading message is finished when the block finishes, including when
+    an exception is raised. Scopes can be nested. A nested scope changes the 
+    text of the loading message that is already active rather than starting
+    a new one and the previous text is used again when the nested scope 
+    finishes.
+    """
 
-        """
-        Returns string that implements the chosen formatting styles\n
+    def __init__(self, printer, starting_text: str = "Loading",
+        time_between_dots: float = 0.5, time_before_start: float = 0.25,
+        style: str = 'dots'):
 
-        bold, italics, underline and strikethrough are to implement those 
-        formatting styles and are boolean values.\n
-        color_text is a string value and is either 'none' (if there is no text 
-        color), a color name or an rgb value formatted as three integers 
-        between 0 and 255 inclusive separated by ';'.\n 
-        Returns a string that can be passed to the print function to implement
-        the chosen formatting.
-        """
+        self.__printer = printer
+        self.__starting_text = starting_text
+        self.__time_between_dots = time_between_dots
+        self.__time_before_start = time_before_start
+        self.__style = style
+        self.__entries = [] # entry tokens for this scope, one for each time
+        # the scope has been entered and not exited
 
-        # set string to store all formatting text
-        return_text = ''
+    def __enter__(self):
 
-        # prepare formatting text for bold, italics, underline and strikethrough
-        if bold:
-            return_text += '\033[1m'
-        if italics:
-            return_text += '\033[3m'
-        if strikethrough:
-            return_text += '\033[9m'
-        if underline:
-            return_text += '\033[4m'
-        
-        # prepare formatting text for text color
-        # NOTE 'none' will return an empty string when passed to 
-        # get_formatting_color_code_text so no need to check separately
-        color_code_text = TerminalPrinter.get_formatting_color_code_text(color_text)
-        if color_code_text:
-            return_text += color_code_text
+        self.__entries.append(self.__printer.loading_scope_enter(
+            self.__starting_text, self.__time_between_dots, 
+            self.__time_before_start, self.__style))
 
-        # all formatting text has been added
-        return return_text
-    
-    @staticmethod
-    def get_formatting_color_code_text(color_text) -> str:
+        return self
 
-        """
-        Receives a string for the color required. Checks that the string is 
-        valid and returns the code for that color.
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
 
-        returns color_code        
-        """
+        self.__printer.loading_scope_exit(self.__entries.pop())
 
-        RGB_NUM_PARTS = 3
+        # exceptions are not suppressed
+        return False
 
-        # set color_code to store result
-        color_code = ''
+    def __call__(self, function):
 
-        # check if color_text is a word or a rgb code
-        if color_text.isalpha():
+        import functools
 
-            # color_text is a word
-            
-            if color_text in TerminalPrinter.basic_color_codes:
-                color_code = TerminalPrinter.basic_color_codes[color_text] 
-            elif color_text in TerminalPrinter.color_codes:
-                color_code = '38;2;' + TerminalPrinter.color_codes[color_text]
-        
-        else:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
 
-            # color_text is not a word. 
+            with self:
+                return function(*args, **kwargs)
 
-            # check that color_text is in valid rgb format
+        return wrapper
 
-            # set variable for current_color being a valid code
-            current_color_valid = False
+class TerminalPrinter:
 
-            # split current_color using ';' as the separator. Should
-            # receive a list with 3 integers between 0 and 255
-            color_code_list = color_text.split(';')
+    """
+    public variables
+    tables with codes for text colors
+    """
 
-            # check color_code_list
-            if len(color_code_list) == RGB_NUM_PARTS:
+    basic_color_codes = {
+        'gray': '90',
+        'red': '91',
+        'green': '92',
+        'yellow': '93',
+        'blue': '94',
+        'purple': '95',
+        'teal': '96',
+        'white': '97'
+    }
+    
+    
+    # the full table of named colors is only loaded the first time it is used
+    color_codes = LazyClassAttribute('terminal_printer_color_codes', 
+        'color_codes')
 
-                # correct number of entries for rgb
+    # single writer used for all text printed to the terminal, including the
+    # text printed by loading threads
+    output = terminal_printer_output.TerminalOutput()
 
-                # check that the 3 sections of code are valid
-                for i in range(RGB_NUM_PARTS):
+    # escape sequences for controlling the screen, printed through output. 
+    # Only loaded the first time it is used
+    screen = LazyClassAttribute('terminal_printer_screen', 'default_screen')
 
-                    # check if entry is not an integer between 0 and 255,
-                    # i.e. it is not valid
-                    if (color_code_list[i].isnumeric() == False
-                        or int(color_code_list[i]) < 0
-                        or int(color_code_list[i]) > 255):
+    # StatusThrottle used by print_status(). Only loaded the first time it is
+    # used
+    status_throttle = LazyClassAttribute('terminal_printer_throttle', 
+        'default_throttle')
 
-                        # incorrect format for integer between 0 and 255
-                        # break for loop (and current_color_valid remains
-                        # false)
-                        break
+    def __init__(self, loading_thread_max_active_time: float = 5,
+        loading_thread_heartbeat_interval: float = 30) -> None:
 
-                    # correct format for this entry
+        """
+        loading_thread_max_active_time is the default maximum time in seconds
+        that a loading message is printed for
 
-                    # if this is the last entry then all entries were 
-                    # correct and color_text is a valid string
-                    if i == len(color_code_list) - 1:
+        loading_thread_heartbeat_interval is the default time in seconds 
+        between heartbeat lines for loading messages printed when the output
+        is not a terminal
+        """
 
-                        # update current_color_valid to True
-                        current_color_valid = True
-            
-            # append text color details if current_color_valid
-            if current_color_valid:
+        # converter for use as a buffer
+        self.__converter = MessageConverter()
 
-                # set color_code
-                color_code = '38;2;' + color_text
+        # variables for printing loading message with dots at time intervals
+        self.__loading_thread = None # LoadingIndicator to display message 
+        # while loading. Created the first time a loading message is started 
+        # and then reused
+        self.__loading_thread_max_active_time = loading_thread_max_active_time
+        self.__loading_thread_heartbeat_interval = \
+            loading_thread_heartbeat_interval
+        self.__loading_scope_entries = [] # (token, starting_text) for each
+        # LoadingScope that has been entered and not exited. A plain lock is
+        # used so that threading is not imported until a loading message is
+        # started
+        self.__loading_scope_lock = _thread.allocate_lock()
+
+    @property
+    def loading_thread_stop_event(self):
 
-        # combine color_code with formatting text, if valid color_text
-        if color_code:
-            
-            # set color_code_text to string for changing text color
-            color_code_text = '\x1b[' + color_code + 'm'
-        
-        else:
+        """
+        Deprecated. Returns an object with the methods of threading.Event 
+        (see terminal_printer_loading_thread.LoadingStopEvent) whose set() 
+        finishes the loading message. Use loading_thread_finish() instead
+        """
 
-            # color_text was invalid
-            
-            # set color_code_text to an empty string
-            color_code_text = ''
+        import warnings
 
-        return color_code_text
+        warnings.warn('loading_thread_stop_event is deprecated, use '
+            'loading_thread_finish() instead.', DeprecationWarning, 
+            stacklevel=2)
 
-    @staticmethod
-    def get_input(input_message, INPUT_TYPE='string', LOWER_LIMIT=0.0,
-            UPPER_LIMIT=0.0, IGNORE_ENTER=False, SELECTION_LIST=[],
-            PARAGRAPH_WIDTH=80, TEXT_INDENT=0,
-            FOLLOWING_LINE_INDENT=0):
+        # import loading thread module the first time it is used
+        import terminal_printer_loading_thread
+
+        return terminal_printer_loading_thread.LoadingStopEvent(self)
+
+    def buffer_clear(self) -> bool:
 
         """
-        Function prints input_message and receives an input from the User in the
-        appropriate format.\n
-        Function returns tuple (bool, string). The boolean value is whether an
-        input was successfully received and the string is the input received. 
-        The function will only return false where the PARAGRAPH_WIDTH is less
-        than TEXT_INDENT and FOLLOWING_LINE_INDENT.\n 
-        input_message is the message prompt to be displayed for the User.\n
-        INPUT_TYPE is the desired format of the input and will be either 
-        'string', 'integer', or 'float'. NOTE that the returned value will be a 
-        string.\n
-        LOWER_LIMIT and UPPER_LIMIT are floats. These are only relevent when the
-        desired input is a float or an integer. The range is inclusive of the
-        LOWER_LIMIT and UPPER_LIMIT.\n
-        IGNORE_ENTER allows the User to press enter without entering an input
-        and this will be a valid response. An empty string is returned.\n
-        SELECTION_LIST is a list of strings that can be accepted as input. Only
-        inputs that are in SELECTION_LIST (or an empty string if IGNORE_ENTER is
-        true) will be accepted.\n
-        PARAGRAPH_WIDTH is the width of the text to be displayed to receive the 
-        input.\n
-        TEXT_INDENT is the minimum number of spaces that all of the text should 
-        be indented.\n
-        FOLLOWING_LINE_INDENT is the number of additional spaces that the text 
-        on all lines after the first line should be indented.\n
-        All formatting commands for print_formatted function are accepted. 
+        Clears all dictionaries (e.g. {'char': 'T', 'type': 'standard_char'}) 
+        from the buffer and returns True when done
         """
-        width_ok = True
-        error_msg_portions_list = []
-
-        # check that after required indents are applied that there are spaces
-        # left for text to be printed on a line
-        if PARAGRAPH_WIDTH <= TEXT_INDENT:
-
-            # ERROR - TEXT_INDENT does not leave space for text to be printed
-            width_ok = False
-            error_msg_portions_list.append('ERROR. TEXT_INDENT is greater than'
-                + ' or equal to PARAGRAPH_WIDTH hence there is no space to print'
-                + ' the text.')
-            
-        elif PARAGRAPH_WIDTH <= TEXT_INDENT + FOLLOWING_LINE_INDENT:
 
-            # ERROR - TEXT_INDENT and FOLLOWING_LINE_INDENT leaves no space for
-            # tet to be printed on a line
-            width_ok = False
-            error_msg_portions_list.append('ERROR. TEXT_INDENT plus'
-                + ' FOLLOWING_LINE_INDENT is greater than or equal to'
-                + ' PARAGRAPH_WIDTH hence there is no space to print the text.')
-            
-        # print message
-        if width_ok:
+        return self.__converter.buffer_clear()
 
-            # get input
-            while True:
+    def loading(self, starting_text: str = "Loading", 
+        time_between_dots: float = 0.5, 
+        time_before_start: float = 0.25, 
+        style: str = 'dots') -> LoadingScope:
 
-                input_valid = True
+        """
+        Returns a LoadingScope that shows a loading message while a block of 
+        code runs. It can be used with 'with' or as a decorator. See 
+        LoadingScope and loading_thread_start() for details.
+        """
 
-                # print input message without going to a new line as this
-                # will replace the message for input()
-                TerminalPrinter.print_formatted(input_message, 
-                    PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, NEW_LINE=False,
-                    TEXT_INDENT=TEXT_INDENT, 
-                    FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
-                
-                # get input from User
-                input_received = input('')
+        return LoadingScope(self, starting_text=starting_text,
+            time_between_dots=time_between_dots, 
+            time_before_start=time_before_start, style=style)
 
-                if input_received:
+    def loading_scope_enter(self, starting_text, time_between_dots, 
+        time_before_start, style='dots'):
 
-                    # check input is valid
-                    try:
+        """
+        Called by LoadingScope when a scope is entered. Starts a loading 
+        message if none is active for a scope, otherwise changes the text of 
+        the active loading message. Returns a token for loading_scope_exit()
+        """
 
-                        if (SELECTION_LIST 
-                            and input_received not in SELECTION_LIST):
+        token = object()
 
-                            # input_received must be in SELECTION_LIST but
-                            # wasn't
+        with self.__loading_scope_lock:
 
-                            if IGNORE_ENTER:
-                                additional_text = ' or you can just press enter'
-                            else:
-                                additional_text = ''
+            if self.__loading_scope_entries and self.loading_thread_active():
+                self.__loading_thread.set_starting_text(starting_text)
+            else:
+                self.loading_thread_start(starting_text=starting_text,
+                    time_between_dots=time_between_dots,
+                    time_before_start=time_before_start, style=style)
 
-                            raise ValueError('Text must be one of the'
-                                + ' following: '
-                                + TerminalPrinter.combine_list_into_text(
-                                SELECTION_LIST, 'or') + additional_text + '.')
-                        
-                        elif INPUT_TYPE == 'float':
+            self.__loading_scope_entries.append((token, starting_text))
 
-                            # check that input_received can be converted into a 
-                            # float
+        return token
 
-                            # convert input_received to a float. If unsuccessful
-                            # then error will be thrown
-                            float(input_received)
+    def loading_scope_exit(self, token) -> bool:
 
-                            # check that input_received is within the UPPER_LIMIT
-                            # and LOWER_LIMIT
-                            if (float(input_received) < min(LOWER_LIMIT, 
-                                UPPER_LIMIT)
-                                or float(input_received) > max(LOWER_LIMIT,
-                                UPPER_LIMIT)):
+        """
+        Called by LoadingScope when a scope is exited. Finishes the loading 
+        message if no other scopes are active, otherwise changes the text of
+        the loading message back to the text of the most recent active scope
+        """
 
-                                # input_received outside range
-                                
-                                if IGNORE_ENTER:
-                                    additional_text = ' or you can just press enter'
-                                else:
-                                    additional_text = ''
-
-                                raise ValueError(input_received
-                                    + ' was given but value must be between '
-                                    + str(float(min(LOWER_LIMIT, UPPER_LIMIT)))
-                                    + ' and '
-                                    + str(float(max(LOWER_LIMIT, UPPER_LIMIT)))
-                                    + additional_text
-                                    + '.')
-
-                        elif INPUT_TYPE == 'integer':
-
-                            # check that input_received can be converted into an 
-                            # integer
-
-                            # convert input_received to an integer. If unsuccessful
-                            # then error will be thrown
-                            int(input_received)
-
-                            # check that input_received can be converted into an
-                            # integer
-                            if (int(input_received) < min(int(LOWER_LIMIT),
-                                int(UPPER_LIMIT))
-                                or int(input_received) > max(int(LOWER_LIMIT),
-                                int(UPPER_LIMIT))):
-
-                                # input_received outside range
-                                
-                                if IGNORE_ENTER:
-                                    additional_text = ' or you can just press enter'
-                                else:
-                                    additional_text = ''
-
-                                raise ValueError(input_received
-                                    + ' was given but value must be between '
-                                    + str(int(min(LOWER_LIMIT, UPPER_LIMIT)))
-                                    + ' and '
-                                    + str(int(max(LOWER_LIMIT, UPPER_LIMIT)))
-                                    + additional_text
-                                    + '.')
-
-                    except ValueError as ve:
-
-                        # print messages for error
-                        TerminalPrinter.print_formatted('ERROR. Incorrect input'
-                            + ' type was received. ' + str(ve.args[0]))
-                        input("Try again.\nPress any key to continue.")
-                        TerminalPrinter.clear_screen()
+        with self.__loading_scope_lock:
 
-                        # set input_valid to False as incorrect input
-                        input_valid = False
+            # remove entry for token. Scopes used by different threads may not
+            # exit in the same order that they were entered
+            for i in range(len(self.__loading_scope_entries) - 1, -1, -1):
 
-                    except Exception as e:
+                if self.__loading_scope_entries[i][0] is token:
 
-                        TerminalPrinter.print_formatted('ERROR. An exception of'
-                            + ' type ' 
-                            + str(type(e).__name__) 
-                            + 'occurred. Arguments: '
-                            + str(e.args))
-                        input("Try again.\nPress any key to continue.")
-                        TerminalPrinter.clear_screen()
+                    del self.__loading_scope_entries[i]
+                    break
 
+            if self.__loading_scope_entries:
 
-                elif not input_received and not IGNORE_ENTER:
+                if self.__loading_thread:
+                    self.__loading_thread.set_starting_text(
+                        self.__loading_scope_entries[-1][1])
 
-                    # input wasn't received but it was required
+            else:
 
-                    # print error message for User
-                    TerminalPrinter.print_formatted('Input is required but'
-                        + ' no input was received.')
-                    input('Try again.\nPress any key to continue.')
-                    TerminalPrinter.clear_screen()
+                self.loading_thread_finish()
 
-                    # set input_valid to False as no input was received
-                    input_valid = False
+        return True
 
-                if input_valid:
-                    
-                    break # break while True loop
+    def loading_thread_active(self) -> bool:
 
-            # return True as successful and input_received as a string
-            return True, input_received
+        """
+        Checks whether there is currently a loading thread active and, if so,
+        returns True otherwise returns False
+        """
 
+        if not self.__loading_thread or not self.__loading_thread.is_active():
+            return False
         else:
+            return True
 
-            # width was not ok
-            
-            error_msg_text = '\n'.join(error_msg_portions_list)
+    def loading_thread_finish(self) -> bool:
 
-            TerminalPrinter.print_formatted(error_msg_text)
+        """
+        Finishes the loading message that is being printed. Returns False if
+        there was no loading message active
+        """
 
-            # an error occured. text_to_print was not printed
-            return False, ''
+        # check that a loading thread has been created
+        if not self.__loading_thread:
+            return False
 
-    @staticmethod
-    def pause_before_proceeding(seconds_to_pause = 1.5) -> bool:
+        # finish loading message. The thread remains available for the next
+        # loading message
+        return self.__loading_thread.end()
+    
+    def loading_thread_start(self, starting_text: str = "Loading", 
+        time_between_dots: float = 0.5, time_before_start: float = 0.25,
+        max_time_alive: float = None, style: str = 'dots',
+        heartbeat_interval: float = None):
 
         """
-        Pauses for a number of seconds equal to seconds_to_pause
+        Prints starting_text and then prints a "." at time_between time 
+        intervals until loading_thread_finish() is called. Any loading 
+        message that is active is finished first.
+
+        parameters: 
+        starting_text is the text to be printed at the beginning of the text,
+        such as "Loading" 
+        time_between is the time in seconds between "." being printed.
+        time_before_start is the time in seconds before starting_text is 
+        printed. Nothing is printed if the loading message is finished before
+        then.
+        max_time_alive is the time in seconds after which the loading message
+        finishes even if loading_thread_finish() has not been called. By 
+        default the value given when creating the TerminalPrinter is used.
+        style is one of 'dots', 'spinner', 'elapsed' or 'bar'. 'dots' prints
+        a "." at each interval. The other styles redraw the line in place at 
+        each interval, with a spinning character, the number of seconds since
+        starting_text was printed or a bouncing bar, and the line is erased 
+        when the loading message finishes.
+        When the output is not a terminal, such as a log file, a line with 
+        the time and starting_text is printed instead, followed by a 
+        heartbeat line every heartbeat_interval seconds and a line saying 
+        "done in X s" when the loading message finishes. By default the 
+        value given when creating the TerminalPrinter is used.
         """
 
-        time.sleep(seconds_to_pause)
+        # create loading indicator the first time it is used
+        if not self.__loading_thread:
+
+            # import loading thread module the first time it is used
+            import terminal_printer_loading_thread
+
+            self.__loading_thread = terminal_printer_loading_thread.LoadingIndicator(
+                output=TerminalPrinter.output)
+
+        # use maximum active time for this TerminalPrinter, if applicable
+        if max_time_alive is None:
+            max_time_alive = self.__loading_thread_max_active_time
+        if heartbeat_interval is None:
+            heartbeat_interval = self.__loading_thread_heartbeat_interval
+
+        # start loading message
+        self.__loading_thread.begin(starting_text=starting_text,
+            time_before_start=time_before_start,
+            time_between_dots=time_between_dots,
+            max_time_alive=max_time_alive, style=style,
+            heartbeat_interval=heartbeat_interval)
 
         return True
 
+    @classmethod
+    def get_basic_color_codes(cls) -> dict:
+
+        """
+        Returns dictionary containing basic_color_codes (name and number)
+        """
+
+        return TerminalPrinter.basic_color_codes
+    
+    @classmethod
+    def get_color_codes(cls) -> dict:
+
+        """
+        Returns dictionary containing color_codes (name and RGB code)
+        """
+
+        return TerminalPrinter.color_codes
+
     @staticmethod
-    def print_formatted(text_to_print, PARAGRAPH_WIDTH=80, NEW_LINE=True,
-        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0) -> bool:
+    def clear_screen() -> bool:
 
         """
-        Function receives text (text_to_print) and then prints the text in the 
-        desired format.
+        Clears the terminal screen. Nothing is printed if the output is not a
+        terminal, for example when it is piped to a file
+        """
 
-        Commands within square brackets in the text (e.g. [b]) allow different
-        formatting features.
+        if TerminalPrinter.output.is_terminal():
+            TerminalPrinter.screen.clear_screen()
 
-        Note where a command requires 2 digits (i.e. xx) but the desired value 
-        is less that 10 then put a zero at the front. For example a tab of 5 
-        spaces would be [t05].
+        return True
+    
+    @staticmethod
+    def combine_list_into_text(list_to_combine, joiner_word='and'):
 
-        List of commands:
-            [n] - go to new line\n
-            [b] - toggle bold\n
-            [i] - toggle italics\n
-            [u] - toggle underline\n
-            [s] - toggle strikethrough\n
-            [ixx] - apply additional indent of xx for next line onwards\n
-            [i00] - reset additional indents. TEXT_INDENT and 
-                FOLLOWING_LINE_INDENT still apply.\n
-            [txx] - applies a tab of xx spaces.\n
-            [c-none] - removes text color.\n
-            [c-red] - applies named text color\n
-            [c-0;255;255] - applies rgb text color\n
+        """
+        combines the elements of a list into "element1, element2, and element 3"
 
-        Tabs
+        joiner_word is either 'and' or 'or'
 
-            Tabs are not split over lines. The remaining spaces will not be 
-            applied to the new line. 
+        This function uses an Oxford comma
         """
 
-        width_ok = True
-        error_msg_portions_list = []
+        # check the number of entries
+        if not list_to_combine:
 
-        # check that after required indents are applied that there are spaces
-        # left for text to be printed on a line
-        if PARAGRAPH_WIDTH <= TEXT_INDENT:
+            return ""
 
-            # ERROR - TEXT_INDENT does not leave space for text to be printed
-            width_ok = False
-            error_msg_portions_list.append('ERROR. TEXT_INDENT is greater than'
-                + ' or equal to PARAGRAPH_WIDTH hence there is no space to print'
-                + ' the text.')
-            
-        elif PARAGRAPH_WIDTH <= TEXT_INDENT + FOLLOWING_LINE_INDENT:
+        elif len(list_to_combine) == 1:
 
-            # ERROR - TEXT_INDENT and FOLLOWING_LINE_INDENT leaves no space for
-            # tet to be printed on a line
-            width_ok = False
-            error_msg_portions_list.append('ERROR. TEXT_INDENT plus'
-                + ' FOLLOWING_LINE_INDENT is greater than or equal to'
-                + ' PARAGRAPH_WIDTH hence there is no space to print the text.')
-            
-        # print message
-        if width_ok:
+            return str(list_to_combine[0])
 
-            printable_lines = TerminalPrinter.convert_message(text_to_print,
-                PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, TEXT_INDENT=TEXT_INDENT,
-                FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
-            
-            for i in range(len(printable_lines)):
+        elif len(list_to_combine) == 2:
 
-                if i == len(printable_lines) - 1 and not NEW_LINE:
-                    print(printable_lines[i], end='')
-                else:
-                    print(printable_lines[i])
-            
-            # all ok
-            return True
+            # prepare string
+            return_text = (str(list_to_combine[0]) + " " + joiner_word + " " 
+                + str(list_to_combine[1]))
+
+            return return_text
 
         else:
 
-            error_msg_text = '\n'.join(error_msg_portions_list)
+            # set text_list to store portions of text
+            text_list = []
 
-            TerminalPrinter.print_formatted(error_msg_text)
+            # populate text_list
+            for i in range(len(list_to_combine)):
 
-            # an error occured. text_to_print was not printed
-            return False
+                # check that this is not the first or last entries
+                if i:
 
-    @staticmethod
-    def print_heading(heading_text, border_character = '-', PARAGRAPH_WIDTH=80, 
-        NEW_LINE=True, TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0):
+                    # this is not the first so append ", "
+                    text_list.append(", ")
 
-        """
-        Prints heading with '-' above and below each letter in heading_text.
-        
-        See print_formatted for details of parameters.
-        """
+                if i == len(list_to_combine) - 1:
 
-        TerminalPrinter.print_formatted(border_character * len(heading_text),
-            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, NEW_LINE=NEW_LINE, 
-            TEXT_INDENT=TEXT_INDENT, FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
-        
-        TerminalPrinter.print_formatted(heading_text,
-            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, NEW_LINE=NEW_LINE, 
-            TEXT_INDENT=TEXT_INDENT, FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+                    # this is the last entry so append ", and "
+                    text_list.append(joiner_word + " ")
 
-        TerminalPrinter.print_formatted(border_character * len(heading_text),
-            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, NEW_LINE=NEW_LINE, 
-            TEXT_INDENT=TEXT_INDENT, FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+                # append the names from list_to_combine
+                text_list.append(str(list_to_combine[i]))
+
+            # combine text_list into a string
+            final_text = ''.join(text_list)
+
+            # return combined text
+            return final_text
 
     @staticmethod
-    def testing():
+    def convert_message(message_to_convert, PARAGRAPH_WIDTH=80, 
+        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0) -> list:
 
         """
-        This method tests all of the methods used by an instance of TerminalPrinter
-        """
+        Converts a string into a printable message by converting embedded
+        formatting instructions
 
-        UI_object = TerminalPrinter()
+        Returns list of strings that can be printed by Python with the embedded 
+        formatting.
 
-        all_tests_passed = True
-        
-        # print heading for testing getters and setters
-        print("\n" + "=" * 80 + "\nTESTING USER INTERFACE\n" 
-            + "=" * 80 + "")
-        
+        PARAGRAPH_WIDTH is the maximum number of characters that will be printed
+        on a row of text.\n
+        NEW_LINE is whether the curser should go to a new line after the end
+        of all of the text is printed.\n
+        TEXT_INDENT is the number of blank spaces that should appear before every
+        line of text. This amount will count towards the paragraph width, e.g.
+        if TEXT_INDENT is 10 and PARAGRAPH_WIDTH is 80 then the first 10 
+        characters of every line will be 10 blank spaces followed by up to 70
+        characters.\n
+        FOLLOWING_LINE_INDENT is the number of blank spaces (in additional to 
+        any blank spaces for TEXT_INDENT) that should appear before every line
+        of text after the first line of text. This amount will count towards the 
+        paragraph width.\n
+        There are additional formatting instructions that can appear in the 
+        message being converted and they will be between square brackets([]).
+        These are\n:
+        [txx] - tab of size xx. Use two digits. 05 is 5.\n
+        [n] - new line.\n
+        [ixx] - is an additional indent value for the next new line. Note that
+        [i00] will reset the indent value to the text_indent and 
+        following_line_indent values.\n
+        [b] - toggles bold text.\n
+        [i] - toggles italics text.\n
+        [u] - toggles underline text.\n
+        [s] - toggles strikethrough text.\n
+        There are various colors for text. They will be in square brackets with 
+        'c-' followed by the name of the color, the rgb color with 3 numbers 
+        between 0 and 255 each separated by ; or 'none' to clear the color.\n 
+        The color names include: gray, red, green, yellow, blue, purple, teal 
+        and white    
         """
-        TESTING __buffer_is_empty()
+
+        # check that message has characters otherwise return and empty string
+        if message_to_convert.isspace():
+
+            return []
+
+        # convert message with a converter from the pool
+        converter = MessageConverter.acquire()
+
+        try:
+
+            return converter.convert(message_to_convert, 
+                PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, TEXT_INDENT=TEXT_INDENT,
+                FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+        finally:
+
+            # return converter to the pool
+            MessageConverter.release(converter)
+
+    @staticmethod
+    def get_formatting_clear_formatting() -> str:
+
+        """
+        Returns string that will clear all existing formatting when passed to 
+        print()
+        """
+        return '\x1b[0m'
+    
+    @staticmethod
+    def get_formatting_start_formatting(bold, italics, strikethrough, underline, 
+            color_text) -> str:
+
+        """
+        Returns string that implements the chosen formatting styles\n
+
+        bold, italics, underline and strikethrough are to implement those 
+        formatting styles and are boolean values.\n
+        color_text is a string value and is either 'none' (if there is no text 
+        color), a color name or an rgb value formatted as three integers 
+        between 0 and 255 inclusive separated by ';'.\n 
+        Returns a string that can be passed to the print function to implement
+        the chosen formatting.
         """
+
+        # set string to store all formatting text
+        return_text = ''
+
+        # prepare formatting text for bold, italics, underline and strikethrough
+        if bold:
+            return_text += '\033[1m'
+        if italics:
+            return_text += '\033[3m'
+        if strikethrough:
+            return_text += '\033[9m'
+        if underline:
+            return_text += '\033[4m'
         
-        # test __buffer_is_empty() with no elements in buffer
-        print("\nTesting __buffer_is_empty() for new UI.")
-        if UI_object.__buffer_is_empty():
+        # prepare formatting text for text color
+        # NOTE 'none' will return an empty string when passed to 
+        # get_formatting_color_code_text so no need to check separately
+        color_code_text = TerminalPrinter.get_formatting_color_code_text(color_text)
+        if color_code_text:
+            return_text += color_code_text
+
+        # all formatting text has been added
+        return return_text
+    
+    @staticmethod
+    def get_formatting_color_code_text(color_text) -> str:
+
+        """
+        Receives a string for the color required. Checks that the string is 
+        valid and returns the code for that color.
+
+        returns color_code        
+        """
+
+        RGB_NUM_PARTS = 3
+
+        # set color_code to store result
+        color_code = ''
+
+        # check if color_text is a word or a rgb code
+        if color_text.isalpha():
+
+            # color_text is a word
             
-            print("{:<15}{}".format('CORRECT','__buffer_is_empty() returned'
-                + ' True when empty'))
+            if color_text in TerminalPrinter.basic_color_codes:
+                color_code = TerminalPrinter.basic_color_codes[color_text] 
+            elif color_text in TerminalPrinter.color_codes:
+                color_code = '38;2;' + TerminalPrinter.color_codes[color_text]
         
         else:
+
+            # color_text is not a word. 
+
+            # check that color_text is in valid rgb format
+
+            # set variable for current_color being a valid code
+            current_color_valid = False
+
+            # split current_color using ';' as the separator. Should
+            # receive a list with 3 integers between 0 and 255
+            color_code_list = color_text.split(';')
+
+            # check color_code_list
+            if len(color_code_list) == RGB_NUM_PARTS:
+
+                # correct number of entries for rgb
+
+                # check that the 3 sections of code are valid
+                for i in range(RGB_NUM_PARTS):
+
+                    # check if entry is not an integer between 0 and 255,
+                    # i.e. it is not valid
+                    if (color_code_list[i].isnumeric() == False
+                        or int(color_code_list[i]) < 0
+                        or int(color_code_list[i]) > 255):
+
+                        # incorrect format for integer between 0 and 255
+                        # break for loop (and current_color_valid remains
+                        # false)
+                        break
+
+                    # correct format for this entry
+
+                    # if this is the last entry then all entries were 
+                    # correct and color_text is a valid string
+                    if i == len(color_code_list) - 1:
+
+                        # update current_color_valid to True
+                        current_color_valid = True
             
-            print("{:<15}{}".format('INCORRECT','__buffer_is_empty() returned'
-                + '  False when empty'))
-            
-            if all_tests_passed:
-                all_tests_passed = False
+            # append text color details if current_color_valid
+            if current_color_valid:
 
-        """ manually append entries in UI """
-        character_list = ['T', 'e', 's', 't']
-        for char in character_list:
-            UI_object.__buffer.append({'char': char, 'type': 'standard_char'})
+                # set color_code
+                color_code = '38;2;' + color_text
 
-        # test __buffer_is_empty() with 4 elements in buffer
-        print("\nTesting __buffer_is_empty() after 'Test' characters were"
-            + " appended.")
-        if UI_object.__buffer_is_empty() == False:
+        # combine color_code with formatting text, if valid color_text
+        if color_code:
             
-            print("{:<15}{}".format('CORRECT','__buffer_is_empty() returned'
-                + ' False when __buffer has elements.'))
+            # set color_code_text to string for changing text color
+            color_code_text = '\x1b[' + color_code + 'm'
         
         else:
+
+            # color_text was invalid
             
-            print("{:<15}{}".format('INCORRECT','__buffer_is_empty() returned'
-                + '  True when __buffer has elements'))
-            
-            if all_tests_passed:
-                all_tests_passed = False
+            # set color_code_text to an empty string
+            color_code_text = ''
 
-        # test buffer_clear() to clear buffer
-        UI_object.buffer_clear()
+        return color_code_text
 
-        # test __buffer_is_empty() with no elements in buffer
-        print("\nTesting buffer_clear() by calling __buffer_is_empty()"
-            + " afterwards.")
-        if UI_object.__buffer_is_empty():
-            
-            print("{:<15}{}".format('CORRECT','buffer is empty after'
-                + ' buffer_clear()'))
-        
-        else:
+    @staticmethod
+    def get_input(input_message, INPUT_TYPE='string', LOWER_LIMIT=0.0,
+            UPPER_LIMIT=0.0, IGNORE_ENTER=False, SELECTION_LIST=[],
+            PARAGRAPH_WIDTH=80, TEXT_INDENT=0,
+            FOLLOWING_LINE_INDENT=0, TIMEOUT=None, SINGLE_KEY=False,
+            VALIDATOR=None, ANSWERS=None, COMPLETION=False):
+
+        """
+        Function prints input_message and receives an input from the User in the
+        appropriate format.\n
+        Function returns tuple (bool, string). The boolean value is whether an
+        input was successfully received and the string is the input received. 
+        The function will only return false where the PARAGRAPH_WIDTH is less
+        than TEXT_INDENT and FOLLOWING_LINE_INDENT or where TIMEOUT seconds 
+        pass without an input being received.\n 
+        input_message is the message prompt to be displayed for the User.\n
+        INPUT_TYPE is the desired format of the input and will be either 
+        'string', 'integer', or 'float'. NOTE that the returned value will be a 
+        string.\n
+        LOWER_LIMIT and UPPER_LIMIT are floats. These are only relevent when the
+        desired input is a float or an integer. The range is inclusive of the
+        LOWER_LIMIT and UPPER_LIMIT.\n
+        IGNORE_ENTER allows the User to press enter without entering an input
+        and this will be a valid response. An empty string is returned.\n
+        SELECTION_LIST is a list of strings that can be accepted as input. Only
+        inputs that are in SELECTION_LIST (or an empty string if IGNORE_ENTER is
+        true) will be accepted.\n
+        VALIDATOR is an InputValidator from get_input_validator(). If it is 
+        provided then it is used instead of INPUT_TYPE, LOWER_LIMIT, 
+        UPPER_LIMIT, IGNORE_ENTER and SELECTION_LIST so that the rules are only
+        prepared once for prompts that are repeated.\n
+        ANSWERS is a BatchAnswers from get_batch_answers(). If it is provided
+        then the next answer is taken from it instead of the User. Nothing is
+        printed and an InvalidInputError (see terminal_printer_input) is 
+        raised if the answer is not valid.\n
+        PARAGRAPH_WIDTH is the width of the text to be displayed to receive the 
+        input.\n
+        TEXT_INDENT is the minimum number of spaces that all of the text should 
+        be indented.\n
+        FOLLOWING_LINE_INDENT is the number of additional spaces that the text 
+        on all lines after the first line should be indented.\n
+        TIMEOUT is the number of seconds to wait for each input (and for a key
+        to be pressed after an incorrect input) before giving up. None waits 
+        until an input is received.\n
+        SINGLE_KEY accepts the input as soon as a single key is pressed 
+        without waiting for enter. It is intended for use with a 
+        SELECTION_LIST of single characters, such as ['y', 'n'].\n
+        COMPLETION allows tab to be pressed to complete the input from the 
+        entries of SELECTION_LIST. If nothing can be added then the entries 
+        starting with the text typed so far are listed.\n
+        All formatting commands for print_formatted function are accepted. 
+        """
+        width_ok = True
+        key_reader = None # KeyReader used if TIMEOUT, SINGLE_KEY or 
+        # COMPLETION is set
+        error_msg_portions_list = []
+
+        # check that after required indents are applied that there are spaces
+        # left for text to be printed on a line
+        if PARAGRAPH_WIDTH <= TEXT_INDENT:
+
+            # ERROR - TEXT_INDENT does not leave space for text to be printed
+            width_ok = False
+            error_msg_portions_list.append('ERROR. TEXT_INDENT is greater than'
+                + ' or equal to PARAGRAPH_WIDTH hence there is no space to print'
+                + ' the text.')
             
-            print("{:<15}{}".format('INCORRECT','buffer is not empty after'
-                + '  buffer_clear()'))
+        elif PARAGRAPH_WIDTH <= TEXT_INDENT + FOLLOWING_LINE_INDENT:
+
+            # ERROR - TEXT_INDENT and FOLLOWING_LINE_INDENT leaves no space for
+            # tet to be printed on a line
+            width_ok = False
+            error_msg_portions_list.append('ERROR. TEXT_INDENT plus'
+                + ' FOLLOWING_LINE_INDENT is greater than or equal to'
+                + ' PARAGRAPH_WIDTH hence there is no space to print the text.')
             
+        # print message
+        if width_ok:
+
+            # prepare the rules for the input once
+            if VALIDATOR is None:
+                VALIDATOR = TerminalPrinter.get_input_validator(
+                    INPUT_TYPE=INPUT_TYPE, LOWER_LIMIT=LOWER_LIMIT, 
+                    UPPER_LIMIT=UPPER_LIMIT, IGNORE_ENTER=IGNORE_ENTER,
+                    SELECTION_LIST=SELECTION_LIST)
+
+            # take answer from ANSWERS without printing or waiting for the User
+            if ANSWERS is not None:
+                return True, ANSWERS.answer(input_message, VALIDATOR)
+
+            # convert input message once as it is printed again each time an
+            # incorrect input is received
+            prompt_text = '\n'.join(TerminalPrinter.convert_message(
+                input_message, PARAGRAPH_WIDTH=PARAGRAPH_WIDTH,
+                TEXT_INDENT=TEXT_INDENT, 
+                FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT))
+
+            # get input
+            while True:
+
+                input_valid = True
+
+                # print input message without going to a new line as this
+                # will replace the message for input()
+                if prompt_text:
+                    TerminalPrinter.output.write(prompt_text)
+                
+                # get input from User
+                if TIMEOUT is None and not SINGLE_KEY and not COMPLETION:
+
+                    input_received = TerminalPrinter.__read_input_line()
+
+                else:
+
+                    # use the key reader shared by every prompt so that text
+                    # read ahead is kept for the next prompt
+                    if key_reader is None:
+
+                        import terminal_printer_keys
+
+                        key_reader = terminal_printer_keys.default_key_reader
+
+                    if SINGLE_KEY:
+
+                        input_received = key_reader.read_key(TIMEOUT)
+
+                        # enter is the same as no input. The key is printed
+                        # as the terminal does not print it
+                        if input_received in ('\r', '\n'):
+                            input_received = ''
+                        if input_received is not None:
+                            TerminalPrinter.output.write(input_received 
+                                + '\n')
+
+                    elif COMPLETION:
+
+                        input_received = key_reader.read_completed_line(
+                            VALIDATOR.get_trie(), TerminalPrinter.output, 
+                            prompt_text=prompt_text, timeout=TIMEOUT)
+
+                    else:
+
+                        input_received = key_reader.read_line(TIMEOUT)
+
+                    if input_received is None:
+
+                        # no input was received before TIMEOUT
+                        TerminalPrinter.output.write('\n')
+
+                        return False, ''
+
+                # check input is valid
+                try:
+
+                    input_valid, value, error_message = VALIDATOR.parse(
+                        input_received)
+
+                    if not input_valid:
+
+                        # print message for error
+                        TerminalPrinter.print_formatted(error_message)
+                        if not TerminalPrinter.__wait_for_key(key_reader, 
+                            TIMEOUT):
+                            return False, ''
+                        TerminalPrinter.clear_screen()
+
+                except Exception as e:
+
+                    TerminalPrinter.print_formatted('ERROR. An exception of'
+                        + ' type ' 
+                        + str(type(e).__name__) 
+                        + 'occurred. Arguments: '
+                        + str(e.args))
+                    if not TerminalPrinter.__wait_for_key(key_reader, TIMEOUT):
+                        return False, ''
+                    TerminalPrinter.clear_screen()
+
+                if input_valid:
+                    
+                    break # break while True loop
+
+            # return True as successful and input_received as a string
+            return True, input_received
+
+        else:
+
+            # width was not ok
+            
+            error_msg_text = '\n'.join(error_msg_portions_list)
+
+            TerminalPrinter.print_formatted(error_msg_text)
+
+            # an error occured. text_to_print was not printed
+            return False, ''
+
+    @staticmethod
+    def get_input_validator(INPUT_TYPE='string', LOWER_LIMIT=0.0, 
+        UPPER_LIMIT=0.0, IGNORE_ENTER=False, SELECTION_LIST=[]):
+
+        """
+        Returns an InputValidator (see terminal_printer_input) with the rules
+        for an input. It can be passed to get_input() as VALIDATOR so that the
+        rules are prepared once and reused. See get_input() for details of 
+        parameters.
+        """
+
+        # import input module the first time it is used
+        import terminal_printer_input
+
+        return terminal_printer_input.InputValidator(INPUT_TYPE=INPUT_TYPE,
+            LOWER_LIMIT=LOWER_LIMIT, UPPER_LIMIT=UPPER_LIMIT, 
+            IGNORE_ENTER=IGNORE_ENTER, SELECTION_LIST=SELECTION_LIST)
+
+    @staticmethod
+    def get_batch_answers(answers=None):
+
+        """
+        Returns a BatchAnswers (see terminal_printer_input) that can be passed
+        to get_input() as ANSWERS. answers is a list or any iterable of 
+        strings, such as an open file, and None means the lines piped to 
+        stdin. Use terminal_printer_input.BatchAnswers.from_file() to read the
+        answers from a file name.
+        """
+
+        # import input module the first time it is used
+        import terminal_printer_input
+
+        return terminal_printer_input.BatchAnswers(answers)
+
+    @staticmethod
+    def get_input_form():
+
+        """
+        Returns an empty InputForm (see terminal_printer_input). Fields are 
+        added with add_field() and the answers are received with ask()
+        """
+
+        # import input module the first time it is used
+        import terminal_printer_input
+
+        return terminal_printer_input.InputForm()
+
+    @staticmethod
+    def __wait_for_key(key_reader, TIMEOUT) -> bool:
+
+        """
+        Asks the User to try again and waits for a key to be pressed. 
+        key_reader is None when input() is used to receive input. Returns 
+        False if TIMEOUT seconds pass without a key being pressed
+        """
+
+        if key_reader is None:
+
+            TerminalPrinter.__read_input_line(
+                "Try again.\nPress any key to continue.")
+
+            return True
+
+        TerminalPrinter.output.write("Try again.\nPress any key to continue.")
+        key = key_reader.read_key(TIMEOUT)
+        TerminalPrinter.output.write('\n')
+
+        return key is not None
+
+    @staticmethod
+    def __read_input_line(prompt_text: str = '') -> str:
+
+        """
+        Returns the next line of input like input(prompt_text). If the key 
+        reader has been used then text that it read ahead is used first
+        """
+
+        # the key reader can only have read text if its module was imported
+        terminal_printer_keys = sys.modules.get('terminal_printer_keys')
+
+        if terminal_printer_keys is None:
+            return input(prompt_text)
+
+        return terminal_printer_keys.read_input_line(prompt_text)
+
+    @staticmethod
+    def incremental_writer(PARAGRAPH_WIDTH=80, TEXT_INDENT=0,
+        FOLLOWING_LINE_INDENT=0):
+
+        """
+        Returns an IncrementalWriter (see terminal_printer_incremental) that
+        prints text added a part at a time with append(), such as text 
+        generated a word at a time. See print_formatted() for details of the
+        parameters. Use it with 'with' or call finish() at the end of the 
+        text
+        """
+
+        # import incremental module the first time it is used
+        import terminal_printer_incremental
+
+        return terminal_printer_incremental.IncrementalWriter(
+            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, TEXT_INDENT=TEXT_INDENT,
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+    @staticmethod
+    def live_region(num_lines: int = 1, MAX_REFRESH_RATE: float = 10,
+        CLEAR_ON_STOP: bool = True):
+
+        """
+        Returns a LiveRegion (see terminal_printer_live) with num_lines status
+        lines kept at the bottom of the terminal. Use it with 'with' and 
+        change the lines with set_line(). The lines are printed at most 
+        MAX_REFRESH_RATE times per second. CLEAR_ON_STOP is whether the lines
+        are cleared when the LiveRegion stops
+        """
+
+        # import live region module the first time it is used
+        import terminal_printer_live
+
+        return terminal_printer_live.LiveRegion(num_lines=num_lines,
+            MAX_REFRESH_RATE=MAX_REFRESH_RATE, CLEAR_ON_STOP=CLEAR_ON_STOP)
+
+    @staticmethod
+    def page_file(file_path, PARAGRAPH_WIDTH=None, ENCODING='utf-8') -> bool:
+
+        """
+        Shows file_path, a file of text with formatting commands, one screen
+        at a time until 'q' is pressed (see terminal_printer_pager for the 
+        keys). PARAGRAPH_WIDTH is the width that lines are wrapped to, by 
+        default the width of the terminal. When the output is not a terminal
+        the whole file is printed
+        """
+
+        # import pager module the first time it is used
+        import terminal_printer_pager
+
+        with terminal_printer_pager.Pager(file_path, 
+            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, ENCODING=ENCODING) as pager:
+
+            return pager.show()
+
+    @staticmethod
+    def pause_before_proceeding(seconds_to_pause = 1.5) -> bool:
+
+        """
+        Pauses for a number of seconds equal to seconds_to_pause
+        """
+
+        time.sleep(seconds_to_pause)
+
+        return True
+
+    @staticmethod
+    def print_formatted(text_to_print, PARAGRAPH_WIDTH=80, NEW_LINE=True,
+        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0, channel=None) -> bool:
+
+        """
+        Function receives text (text_to_print) and then prints the text in the 
+        desired format.
+
+        Commands within square brackets in the text (e.g. [b]) allow different
+        formatting features.
+
+        Note where a command requires 2 digits (i.e. xx) but the desired value 
+        is less that 10 then put a zero at the front. For example a tab of 5 
+        spaces would be [t05].
+
+        List of commands:
+            [n] - go to new line\n
+            [b] - toggle bold\n
+            [i] - toggle italics\n
+            [u] - toggle underline\n
+            [s] - toggle strikethrough\n
+            [ixx] - apply additional indent of xx for next line onwards\n
+            [i00] - reset additional indents. TEXT_INDENT and 
+                FOLLOWING_LINE_INDENT still apply.\n
+            [txx] - applies a tab of xx spaces.\n
+            [c-none] - removes text color.\n
+            [c-red] - applies named text color\n
+            [c-0;255;255] - applies rgb text color\n
+
+        Tabs
+
+            Tabs are not split over lines. The remaining spaces will not be 
+            applied to the new line. 
+
+        channel names the kind of text printed, such as a status line. When 
+        the background writer of output uses the 'collapse' policy, older 
+        text with the same channel that is still waiting in the full queue is
+        discarded.
+        """
+
+        width_ok = True
+        error_msg_portions_list = []
+
+        # check that after required indents are applied that there are spaces
+        # left for text to be printed on a line
+        if PARAGRAPH_WIDTH <= TEXT_INDENT:
+
+            # ERROR - TEXT_INDENT does not leave space for text to be printed
+            width_ok = False
+            error_msg_portions_list.append('ERROR. TEXT_INDENT is greater than'
+                + ' or equal to PARAGRAPH_WIDTH hence there is no space to print'
+                + ' the text.')
+            
+        elif PARAGRAPH_WIDTH <= TEXT_INDENT + FOLLOWING_LINE_INDENT:
+
+            # ERROR - TEXT_INDENT and FOLLOWING_LINE_INDENT leaves no space for
+            # tet to be printed on a line
+            width_ok = False
+            error_msg_portions_list.append('ERROR. TEXT_INDENT plus'
+                + ' FOLLOWING_LINE_INDENT is greater than or equal to'
+                + ' PARAGRAPH_WIDTH hence there is no space to print the text.')
+            
+        # print message
+        if width_ok:
+
+            printable_lines = TerminalPrinter.convert_message(text_to_print,
+                PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, TEXT_INDENT=TEXT_INDENT,
+                FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+            
+            # print all lines with a single write so that text printed by a
+            # loading thread can not appear between the lines
+            if printable_lines:
+
+                if NEW_LINE:
+                    printable_lines.append('')
+
+                TerminalPrinter.output.write('\n'.join(printable_lines),
+                    channel=channel)
+            
+            # all ok
+            return True
+
+        else:
+
+            error_msg_text = '\n'.join(error_msg_portions_list)
+
+            TerminalPrinter.print_formatted(error_msg_text)
+
+            # an error occured. text_to_print was not printed
+            return False
+
+    @staticmethod
+    def print_formatted_file(input_file, PARAGRAPH_WIDTH=80, TEXT_INDENT=0,
+        FOLLOWING_LINE_INDENT=0, sink=None, ENCODING='utf-8') -> dict:
+
+        """
+        Prints the text of input_file, a file path or a file object opened 
+        for reading, with the formatting commands of print_formatted(). The 
+        whole file is printed as one message, in the same way as 
+        print_formatted() would print it, but it is read and converted in 
+        large blocks so that memory use does not grow with the size of the 
+        file.\n
+        sink is any object with a writelines() method that the lines are 
+        written to instead of TerminalPrinter.output.\n
+        Returns a dictionary with 'num_bytes' read, 'num_lines' written, 
+        'seconds' taken and 'mb_per_second'. Raises ValueError if the indents
+        leave no space for text.
+        """
+
+        # import stream module the first time it is used
+        import terminal_printer_stream
+
+        return terminal_printer_stream.format_stream(input_file, sink=sink,
+            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, TEXT_INDENT=TEXT_INDENT,
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT, ENCODING=ENCODING)
+
+    @staticmethod
+    def print_status(text_to_print, channel='status', PARAGRAPH_WIDTH=80,
+        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0) -> bool:
+
+        """
+        Prints text_to_print like print_formatted() but at most 
+        status_throttle.set_max_rate() times per second (10 by default). If a
+        message for the same channel is waiting to be printed then 
+        text_to_print replaces it and the waiting message is never printed.
+        The waiting messages are printed when the program exits or when 
+        status_throttle.flush() is called.
+        """
+
+        return TerminalPrinter.status_throttle.set_status(text_to_print,
+            channel=channel, PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, 
+            TEXT_INDENT=TEXT_INDENT, 
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+    @staticmethod
+    def print_table(rows, header_list=None, MODE='streaming', SAMPLE_SIZE=100,
+        MAX_COLUMN_WIDTH=40, PARAGRAPH_WIDTH=80, SEPARATOR=' | ') -> bool:
+
+        """
+        Prints a table. rows is an iterable of rows, each a list of cells, 
+        and cells can include the formatting commands of print_formatted().
+        header_list is a list with the heading of each column.\n
+        MODE is 'streaming', where the column widths are found from the first 
+        SAMPLE_SIZE rows, or 'exact', where they are found from every row. 
+        In 'exact' mode rows must be a list or a function that returns the 
+        rows. See terminal_printer_table.TableRenderer for details of the 
+        other parameters.\n
+        The lines are written in groups of up to 256 lines so that memory use
+        does not grow with the number of rows.
+        """
+
+        LINES_PER_WRITE = 256
+
+        # import table module the first time it is used
+        import itertools
+        import terminal_printer_table
+
+        renderer = terminal_printer_table.TableRenderer(header_list, 
+            MODE=MODE, SAMPLE_SIZE=SAMPLE_SIZE, 
+            MAX_COLUMN_WIDTH=MAX_COLUMN_WIDTH, PARAGRAPH_WIDTH=PARAGRAPH_WIDTH,
+            SEPARATOR=SEPARATOR)
+
+        line_iterator = renderer.render(rows)
+
+        while True:
+
+            line_list = list(itertools.islice(line_iterator, LINES_PER_WRITE))
+
+            if not line_list:
+                break
+
+            line_list.append('')
+            TerminalPrinter.output.write('\n'.join(line_list))
+
+        return True
+
+    @staticmethod
+    def print_heading(heading_text, border_character = '-', PARAGRAPH_WIDTH=80, 
+        NEW_LINE=True, TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0):
+
+        """
+        Prints heading with '-' above and below each letter in heading_text.
+        
+        See print_formatted for details of parameters.
+        """
+
+        TerminalPrinter.print_formatted(border_character * len(heading_text),
+            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, NEW_LINE=NEW_LINE, 
+            TEXT_INDENT=TEXT_INDENT, FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+        
+        TerminalPrinter.print_formatted(heading_text,
+            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, NEW_LINE=NEW_LINE, 
+            TEXT_INDENT=TEXT_INDENT, FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+        TerminalPrinter.print_formatted(border_character * len(heading_text),
+            PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, NEW_LINE=NEW_LINE, 
+            TEXT_INDENT=TEXT_INDENT, FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+    @staticmethod
+    def testing():
+
+        """
+        This method tests all of the methods used by an instance of TerminalPrinter
+        """
+
+        UI_object = MessageConverter()
+
+        all_tests_passed = True
+        
+        # print heading for testing getters and setters
+        print("\n" + "=" * 80 + "\nTESTING USER INTERFACE\n" 
+            + "=" * 80 + "")
+        
+        """
+        TESTING __buffer_is_empty()
+        """
+        
+        # test __buffer_is_empty() with no elements in buffer
+        print("\nTesting __buffer_is_empty() for new UI.")
+        if UI_object.buffer_is_empty():
+            
+            print("{:<15}{}".format('CORRECT','__buffer_is_empty() returned'
+                + ' True when empty'))
+        
+        else:
+            
+            print("{:<15}{}".format('INCORRECT','__buffer_is_empty() returned'
+                + '  False when empty'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        """ manually append entries in UI """
+        character_list = ['T', 'e', 's', 't']
+        for char in character_list:
+            UI_object.buffer.append({'char': char, 'type': 'standard_char'})
+
+        # test __buffer_is_empty() with 4 elements in buffer
+        print("\nTesting __buffer_is_empty() after 'Test' characters were"
+            + " appended.")
+        if UI_object.buffer_is_empty() == False:
+            
+            print("{:<15}{}".format('CORRECT','__buffer_is_empty() returned'
+                + ' False when __buffer has elements.'))
+        
+        else:
+            
+            print("{:<15}{}".format('INCORRECT','__buffer_is_empty() returned'
+                + '  True when __buffer has elements'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        # test buffer_clear() to clear buffer
+        UI_object.buffer_clear()
+
+        # test __buffer_is_empty() with no elements in buffer
+        print("\nTesting buffer_clear() by calling __buffer_is_empty()"
+            + " afterwards.")
+        if UI_object.buffer_is_empty():
+            
+            print("{:<15}{}".format('CORRECT','buffer is empty after'
+                + ' buffer_clear()'))
+        
+        else:
+            
+            print("{:<15}{}".format('INCORRECT','buffer is not empty after'
+                + '  buffer_clear()'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        """
+        TESTING __add_char()
+        """
+
+        # update character_list - 'New'
+        character_list = ['N', 'e', 'w']
+
+        for char in character_list:
+            UI_object.buffer_add_char(char)
+        
+        for entry in UI_object.buffer:
+            print("")
+            for key, value in entry.items():
+                print("{}: {}".format(key, value))
+        print("\nEntered: 'New' into buffer")
+        if (len(UI_object.buffer) == len(character_list)  
+            and (UI_object.buffer[0]['char'] == character_list[0] 
+                and UI_object.buffer[0]['type'] == 'standard_char') 
+            and (UI_object.buffer[1]['char'] == character_list[1] 
+                and UI_object.buffer[1]['type'] == 'standard_char') 
+            and (UI_object.buffer[2]['char'] == character_list[2] 
+                and UI_object.buffer[2]['type'] == 'standard_char')):
+            
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+            
+        # update character_list - 'a pig'
+        character_list = ['A', ' ', 'p', 'i', 'g']
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for char in character_list:
+            UI_object.buffer_add_char(char)
+        
+        for entry in UI_object.buffer:
+            print("")
+            for key, value in entry.items():
+                print("{}: {}".format(key, value))
+        print("\nEntered: 'A pig' into buffer")
+        if (len(UI_object.buffer) == len(character_list) 
+            and (UI_object.buffer[0]['char'] == character_list[0] 
+                and UI_object.buffer[0]['type'] == 'standard_char') 
+            and (UI_object.buffer[1]['char'] == character_list[1] 
+                and UI_object.buffer[1]['type'] == 'space_char') 
+            and (UI_object.buffer[2]['char'] == character_list[2] 
+                and UI_object.buffer[2]['type'] == 'standard_char') 
+            and (UI_object.buffer[3]['char'] == character_list[3] 
+                and UI_object.buffer[3]['type'] == 'standard_char') 
+            and (UI_object.buffer[4]['char'] == character_list[4] 
+                and UI_object.buffer[4]['type'] == 'standard_char')):
+            
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+            
+        """ test tab instruction """
+        
+        # update character_list - 'A[t03]B'
+        character_list = ['A', '[', 't', '0', '3', ']', 'B']
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for char in character_list:
+            UI_object.buffer_add_char(char)
+        
+        for entry in UI_object.buffer:
+            print("")
+            for key, value in entry.items():
+                print("{}: {}".format(key, value))
+        print("\nEntered: 'A[t03]B' into buffer")
+        if (len(UI_object.buffer) == len(character_list)
+            and (UI_object.buffer[0]['char'] == character_list[0]
+                and UI_object.buffer[0]['type'] == 'standard_char') 
+            and (UI_object.buffer[1]['char'] == character_list[1] 
+                and UI_object.buffer[1]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[2]['char'] == character_list[2]
+                and UI_object.buffer[2]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[3]['char'] == character_list[3]
+                and UI_object.buffer[3]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[4]['char'] == character_list[4]
+                and UI_object.buffer[4]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[5]['char'] == character_list[5]
+                and UI_object.buffer[5]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[6]['char'] == character_list[6]
+                and UI_object.buffer[6]['type'] == 'standard_char')):
+            
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+            
+        """ test indent instruction """
+        
+        # update character_list - 'A[t03]B'
+        character_list = ['A', '[', 'i', '1', '0', ']', 'B']
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for char in character_list:
+            UI_object.buffer_add_char(char)
+        
+        for entry in UI_object.buffer:
+            print("")
+            for key, value in entry.items():
+                print("{}: {}".format(key, value))
+        print("\nEntered: 'A[i10]B' into buffer")
+        if (len(UI_object.buffer) == len(character_list)
+            and (UI_object.buffer[0]['char'] == character_list[0]
+                and UI_object.buffer[0]['type'] == 'standard_char') 
+            and (UI_object.buffer[1]['char'] == character_list[1] 
+                and UI_object.buffer[1]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[2]['char'] == character_list[2]
+                and UI_object.buffer[2]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[3]['char'] == character_list[3]
+                and UI_object.buffer[3]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[4]['char'] == character_list[4]
+                and UI_object.buffer[4]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[5]['char'] == character_list[5]
+                and UI_object.buffer[5]['type'] == 'special_formatting_char') 
+            and (UI_object.buffer[6]['char'] == character_list[6]
+                and UI_object.buffer[6]['type'] == 'standard_char')):
+            
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        """ test color instructions """
+        
+        # test color by name
+
+        # update character_list - 'A[c-red]B' 
+        character_list = ['A', '[', 'c', '-', 'r', 'e', 'd', ']', 'B']
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for char in character_list:
+            UI_object.buffer_add_char(char)
+        
+        for entry in UI_object.buffer:
+            print("")
+            for key, value in entry.items():
+                print("{}: {}".format(key, value))
+        print("\nEntered: 'A#[91mB' into buffer where # is a special character")
+        if (len(UI_object.buffer) == 7
+            and (UI_object.buffer[0]['char'] == character_list[0]
+                and UI_object.buffer[0]['type'] == 'standard_char')
+            and (UI_object.buffer[2]['char'] == '['
+                and UI_object.buffer[2]['type'] == 'formatting_char') 
+            and (UI_object.buffer[3]['char'] == '9'
+                and UI_object.buffer[3]['type'] == 'formatting_char') 
+            and (UI_object.buffer[4]['char'] == '1'
+                and UI_object.buffer[4]['type'] == 'formatting_char') 
+            and (UI_object.buffer[5]['char'] == 'm'
+                and UI_object.buffer[5]['type'] == 'formatting_char') 
+            and (UI_object.buffer[6]['char'] == 'B'
+                and UI_object.buffer[6]['type'] == 'standard_char')
+            and UI_object.color == 'red'):
+            
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        """ manually change __color and test removing color """
+        UI_object.color = 'blue'
+
+        # update character_list - 'A[t03]B'
+        character_list = ['A', '[', 'c', '-', 'n', 'o', 'n', 'e', ']', 'B']
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for char in character_list:
+            UI_object.buffer_add_char(char)
+        
+        for entry in UI_object.buffer:
+            print("")
+            for key, value in entry.items():
+                print("{}: {}".format(key, value))
+        print("\nEntered: 'A#[0mB' into buffer where # is a special character")
+        if (len(UI_object.buffer) == 6
+            and (UI_object.buffer[0]['char'] == character_list[0]
+                and UI_object.buffer[0]['type'] == 'standard_char')
+            and (UI_object.buffer[2]['char'] == '['
+                and UI_object.buffer[2]['type'] == 'formatting_char') 
+            and (UI_object.buffer[3]['char'] == '0'
+                and UI_object.buffer[3]['type'] == 'formatting_char') 
+            and (UI_object.buffer[4]['char'] == 'm'
+                and UI_object.buffer[4]['type'] == 'formatting_char') 
+            and (UI_object.buffer[5]['char'] == 'B'
+                and UI_object.buffer[5]['type'] == 'standard_char')
+            and UI_object.color == 'none'):
+            
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        # test color instruction by rgb values
+        
+        # update character_list - 'A[t03]B'
+        character_list = ['A', '[', 'c', '-', '2', '5', '5', ';', '2', '5', '5', 
+            ';', '2', '5', '5', ']', 'B']
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for char in character_list:
+            UI_object.buffer_add_char(char)
+        
+        for entry in UI_object.buffer:
+            print("")
+            for key, value in entry.items():
+                print("{}: {}".format(key, value))
+        print("\nEntered: 'A#[38;2;255;255;255mB' into buffer where # is a special character")
+        if (len(UI_object.buffer) == 21
+            and (UI_object.buffer[0]['char'] == character_list[0]
+                and UI_object.buffer[0]['type'] == 'standard_char')
+            and UI_object.buffer[1]['type'] == 'formatting_char'
+            and (UI_object.buffer[2]['char'] == '['
+                and UI_object.buffer[2]['type'] == 'formatting_char') 
+            and (UI_object.buffer[3]['char'] == '3'
+                and UI_object.buffer[3]['type'] == 'formatting_char') 
+            and (UI_object.buffer[4]['char'] == '8'
+                and UI_object.buffer[4]['type'] == 'formatting_char') 
+            and (UI_object.buffer[5]['char'] == ';'
+                and UI_object.buffer[5]['type'] == 'formatting_char') 
+            and (UI_object.buffer[6]['char'] == '2'
+                and UI_object.buffer[6]['type'] == 'formatting_char') 
+            and (UI_object.buffer[7]['char'] == ';'
+                and UI_object.buffer[7]['type'] == 'formatting_char') 
+            and (UI_object.buffer[8]['char'] == '2'
+                and UI_object.buffer[8]['type'] == 'formatting_char') 
+            and (UI_object.buffer[9]['char'] == '5'
+                and UI_object.buffer[9]['type'] == 'formatting_char') 
+            and (UI_object.buffer[10]['char'] == '5'
+                and UI_object.buffer[10]['type'] == 'formatting_char') 
+            and (UI_object.buffer[11]['char'] == ';'
+                and UI_object.buffer[11]['type'] == 'formatting_char') 
+            and (UI_object.buffer[12]['char'] == '2'
+                and UI_object.buffer[12]['type'] == 'formatting_char') 
+            and (UI_object.buffer[13]['char'] == '5'
+                and UI_object.buffer[13]['type'] == 'formatting_char') 
+            and (UI_object.buffer[14]['char'] == '5'
+                and UI_object.buffer[14]['type'] == 'formatting_char') 
+            and (UI_object.buffer[15]['char'] == ';'
+                and UI_object.buffer[15]['type'] == 'formatting_char') 
+            and (UI_object.buffer[16]['char'] == '2'
+                and UI_object.buffer[16]['type'] == 'formatting_char') 
+            and (UI_object.buffer[17]['char'] == '5'
+                and UI_object.buffer[17]['type'] == 'formatting_char') 
+            and (UI_object.buffer[18]['char'] == '5'
+                and UI_object.buffer[18]['type'] == 'formatting_char') 
+            and (UI_object.buffer[19]['char'] == 'm'
+                and UI_object.buffer[19]['type'] == 'formatting_char')
+            and (UI_object.buffer[20]['char'] == 'B'
+                and UI_object.buffer[20]['type'] == 'standard_char')
+            and UI_object.color == '255;255;255'):
+            
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        """ test bold, italics, underline and strikethrough toggling on """
+
+        # test bold - toggle on
+        
+        print("\nTesting [b] instruction.")
+        
+        # set starting string and processed character list
+        starting_string = 'A[b]B'
+        processed_character_list = [
+            {'char': 'A', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '1', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'B', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        # test [i]
+        print("\nTesting [i] instruction.")
+        
+        # set starting string and processed character list
+        starting_string = 'A[i]B'
+        processed_character_list = [
+            {'char': 'A', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '3', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'B', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+        
+        # test [s]
+        print("\nTesting [s] instruction.")
+        
+        # set starting string and processed character list
+        starting_string = 'A[s]B'
+        processed_character_list = [
+            {'char': 'A', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '9', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'B', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+        
+        # test [u]
+        print("\nTesting [u] instruction.")
+        
+        # set starting string and processed character list
+        starting_string = 'A[u]B'
+        processed_character_list = [
+            {'char': 'A', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '4', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'B', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        print("After toggling on bold, italics, underline, and strikethrough"
+            + " the attributes are:")
+        print("Bold: {}".format(UI_object.bold))
+        print("Italics: {}".format(UI_object.italics))
+        print("Underline: {}".format(UI_object.underline))
+        print("Strikethrough: {}".format(UI_object.strikethrough))
+        input("Press any key to continue")
+
+        """ test bold, italics, underline and strikethrough toggling off """
+
+        # test bold - toggle off
+        
+        print("\nTesting [b] instruction for toggle off.")
+        
+        # set starting string and processed character list
+        starting_string = 'C[b]D'
+        processed_character_list = [
+            {'char': 'C', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '0', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '3', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '9', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '4', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '3', 'type': 'formatting_char'},
+            {'char': '8', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'D', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+        
+        # test italics - toggle off
+        
+        print("\nTesting [i] instruction for toggle off.")
+        
+        # set starting string and processed character list
+        starting_string = 'C[i]D'
+        processed_character_list = [
+            {'char': 'C', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '0', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '9', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '4', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '3', 'type': 'formatting_char'},
+            {'char': '8', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'D', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+        
+        # test strikethrough - toggle off
+        
+        print("\nTesting [s] instruction for toggle off.")
+        
+        # set starting string and processed character list
+        starting_string = 'C[s]D'
+        processed_character_list = [
+            {'char': 'C', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '0', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '4', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '3', 'type': 'formatting_char'},
+            {'char': '8', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'D', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+        
+        # test strikethrough - toggle off
+        
+        print("\nTesting [u] instruction for toggle off.")
+        
+        # set starting string and processed character list
+        starting_string = 'C[u]D'
+        processed_character_list = [
+            {'char': 'C', 'type': 'standard_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '0', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': '#', 'type': 'formatting_char'},
+            {'char': '[', 'type': 'formatting_char'},
+            {'char': '3', 'type': 'formatting_char'},
+            {'char': '8', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': ';', 'type': 'formatting_char'},
+            {'char': '2', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': '5', 'type': 'formatting_char'},
+            {'char': 'm', 'type': 'formatting_char'},
+            {'char': 'D', 'type': 'standard_char'}
+        ]
+
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # add characters to __buffer
+        for i in range(len(starting_string)):
+            UI_object.buffer_add_char(starting_string[i])
+
+        # set variable for current test result
+        current_test_passed = True
+
+        print("Characters after processing are: ", end='')
+        
+        # check characters in the buffer
+        for i in range(len(processed_character_list)):
+            
+            print(processed_character_list[i]['char'], end='')
+            
+            if not ((processed_character_list[i]['char'] == '#'
+                    and UI_object.buffer[i]['type'] 
+                    == 'formatting_char')
+                or (processed_character_list[i]['char'] != '#'
+                    and UI_object.buffer[i]['char'] 
+                        == processed_character_list[i]['char']
+                    and UI_object.buffer[i]['type']
+                        == processed_character_list[i]['type'])):
+                
+                # update current_test_passed to False as test failed
+                if current_test_passed:
+                    current_test_passed = False
+        
+        print("")
+
+        # print results of current test
+        if current_test_passed:
+        
+            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
+            
+        else:
+
+            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
+                + ' correct.'))
+            
+            if all_tests_passed:
+                all_tests_passed = False
+
+        
+        # print values for bold, italics, underline and strikethrough attributes
+        print("After toggling on bold, italics, underline, and strikethrough"
+            + " the attributes are:")
+        print("Bold: {}".format(UI_object.bold))
+        print("Italics: {}".format(UI_object.italics))
+        print("Underline: {}".format(UI_object.underline))
+        print("Strikethrough: {}".format(UI_object.strikethrough))
+        input("Press any key to continue")
+
+        """ clear text color so all formatting was removed """
+        UI_object.color = 'none'
+
+        """
+        Test convert_message and buffer_load_message
+        """
+
+        new_message = ('Test message using bold[b], blue text[c-blue], indent 10'
+            + '[i10] then a new line[n]removing bold[b] and changing color to white'
+            + '[c-255;255;255] before having a tab 5[t05] and removing color'
+            + '[c-none] to finish.')
+        
+        # clear buffer
+        UI_object.buffer_clear()
+
+        # load new_message into buffer
+        UI_object.buffer_load_message(new_message)
+
+        print("\nAfter adding characters to buffer, buffer is: ")
+
+        # print text in buffer
+        for i in range(len(UI_object.buffer)):
+
+            if UI_object.buffer[i]['char'] == '\x1b':
+                print('#', end='')
+            else:
+                print(UI_object.buffer[i]['char'], end='')
+        
+        # get text from buffer and print details received
+        print("\nTesting __buffer_return_text_portion()")
+
+        while UI_object.buffer:
+
+            # get text portion from buffer
+            text_portion, num_chars, text_type = UI_object.buffer_return_text_portion()
+
+            print("Returned: '{}' with {} characters of type {}".format(
+                text_portion, num_chars, text_type))
+        
+        print("Buffer is empty {}".format(UI_object.buffer_is_empty()))
+
+        message_to_test_printing = ('0123456789012345678901234567890123456789'
+            + '0123456789012345678901234567890123456789'
+            + ' 0123456789012345678901234567890123456789'
+            + '0123456789012345678901234567890123456789'
+            + 'Test message. No indents or formatting. Indent 10[i10] for next line'
+            + ' while making bold[b] and then underlined[u] and blue.[c-blue]'
+            + ' Now change[b] to white[c-255;255;255] using rgb. Make strikethrough'
+            + ' [s] before using a new line.[n] Now remove strikethrough[s] but'
+            + ' add italics[i] and use a tab of 5[t05]. Clear formatting[i][u][b]'
+            + '[c-none] so back to normal')
+        
+        printable_message_list = TerminalPrinter.convert_message(message_to_test_printing)
+        print("\nThe following message has numbers that fill the line followed"
+              + " by a space then numbers with 'test' appended that exceed"
+              + " a full line and should be split. Note that the space should"
+              + " not appear as it is at the beginning of a line without"
+              + " characters and should be ignored.\n")
+        for message in printable_message_list:
+            print(message)
+
+        printable_message_list_02 = TerminalPrinter.convert_message(
+            message_to_test_printing, PARAGRAPH_WIDTH=100, TEXT_INDENT=5, 
+            FOLLOWING_LINE_INDENT=10)
+        print("\nThe following text is the same as the previous text. Paragraph"
+            + " width has been increased by 20. All text has been indented 5 and"
+            + " an additional indent of 10 on each line after the first has"
+            + " also been applied.\n")
+        for i in range(len(printable_message_list_02)):
+            if i != len(printable_message_list_02) - 1:
+                print(printable_message_list_02[i])
+            else:
+                print(printable_message_list_02[i], end='')
+        print(" Text didn't have a new line at the end")
+
+            
+
+        
+        # print heading for testing the components used by TerminalPrinter
+        print("\n" + "=" * 80 + "\nTESTING COMPONENTS\n" + "=" * 80 + "")
+
+        """
+        TESTING TerminalOutput
+        """
+
+        import threading
+
+        class TerminalStream:
+
+            # terminal stream that records the text of each write
+            def __init__(self):
+                self.write_list = []
+
+            def write(self, text):
+                self.write_list.append(text)
+
+            def flush(self):
+                pass
+
+            def isatty(self):
+                return True
+
+        terminal_stream = TerminalStream()
+        test_output = terminal_printer_output.TerminalOutput(terminal_stream)
+        test_output.write_indicator('Loading')
+        test_output.write_indicator('.')
+        test_output.write('Line of text\n')
+        test_output.write_indicator('.')
+        test_output.finish_indicator(ERASE=True)
+
+        print("\nTesting TerminalOutput with text written while a loading"
+            + " tracker is shown.")
+        if terminal_stream.write_list == ['Loading', '.', 
+            '\r\x1b[KLine of text\nLoading.', '.', '\r\x1b[K']:
+
+            print("{:<15}{}".format('CORRECT','the loading tracker was removed'
+                + ' and printed again below the text in the same write'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','writes: ' 
+                + repr(terminal_stream.write_list)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+        # lines written by two threads at once are never mixed together
+        terminal_stream = TerminalStream()
+        test_output = terminal_printer_output.TerminalOutput(terminal_stream)
+        thread_list = [threading.Thread(target=lambda character=character: 
+            [test_output.write(character * 50 + '\n') for i in range(200)])
+            for character in 'ab']
+
+        for thread in thread_list:
+            thread.start()
+
+        for thread in thread_list:
+            thread.join()
+
+        print("\nTesting TerminalOutput with lines written by two threads.")
+        if (len(terminal_stream.write_list) == 400
+            and set(terminal_stream.write_list) 
+            == {'a' * 50 + '\n', 'b' * 50 + '\n'}):
+
+            print("{:<15}{}".format('CORRECT','each line was written whole in'
+                + ' a single write'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','some lines were mixed'
+                + ' together'))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING TerminalOutput background writer
+        """
+
+        class HeldStream:
+
+            # stream whose writes wait until release_event is set
+            def __init__(self):
+                self.text_list = []
+                self.release_event = threading.Event()
+
+            def write(self, text):
+                self.release_event.wait()
+                self.text_list.append(text)
+
+            def flush(self):
+                pass
+
+            def isatty(self):
+                return False
+
+        held_stream = HeldStream()
+        test_output = terminal_printer_output.TerminalOutput(held_stream)
+        test_output.start_background_writer(MAX_QUEUE_SIZE=2,
+            FULL_QUEUE_POLICY='collapse')
+
+        # release the stream after 2 seconds in case write() waits for space
+        release_timer = threading.Timer(2, held_stream.release_event.set)
+        release_timer.start()
+
+        test_output.write('first\n')
+        for i in range(1, 6):
+            test_output.write('status {}\n'.format(i), channel='status')
+
+        held_stream.release_event.set()
+        release_timer.cancel()
+        test_output.close()
+        written_text = ''.join(held_stream.text_list)
+
+        print("\nTesting 'collapse' policy with a full queue of status lines.")
+        if ('first' in written_text and 'status 5' in written_text
+            and 'status 1' not in written_text 
+            and test_output.get_num_dropped() >= 3):
+
+            print("{:<15}{}".format('CORRECT','older status lines were'
+                + ' discarded and the latest was written'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','status lines were not'
+                + ' collapsed: ' + repr(written_text)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+        # a stream that fails stops the writer and flush() raises the error
+        class ClosedStream:
+
+            def write(self, text):
+                raise ValueError('I/O operation on closed file.')
+
+            def flush(self):
+                pass
+
+        test_output = terminal_printer_output.TerminalOutput(ClosedStream())
+        test_output.start_background_writer()
+        test_output.write('text\n')
+
+        try:
+            test_output.flush()
+            flush_raised = False
+        except ValueError:
+            flush_raised = True
+
+        print("\nTesting background writer with a stream that fails.")
+        if flush_raised and test_output.close():
+
+            print("{:<15}{}".format('CORRECT','flush() raised the error and'
+                + ' close() returned True'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','the error of the stream was'
+                + ' not raised by flush()'))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING LoadingIndicator reuse
+        """
+
+        import warnings
+
+        # loading messages that finish before time_before_start print nothing
+        reuse_printer = TerminalPrinter()
+        reuse_printer.loading_thread_start(time_before_start=10)
+        num_threads = threading.active_count()
+
+        for i in range(20):
+            reuse_printer.loading_thread_start(time_before_start=10)
+            reuse_printer.loading_thread_finish()
+
+        reuse_printer.loading_thread_start(time_before_start=10)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            stop_event = reuse_printer.loading_thread_stop_event
+
+        stop_event_was_set = stop_event.is_set()
+        stop_event.set()
+
+        print("\nTesting 20 loading messages from one TerminalPrinter and"
+            + " loading_thread_stop_event.")
+        if (threading.active_count() == num_threads and not stop_event_was_set
+            and stop_event.is_set() and stop_event.wait(0)
+            and not reuse_printer.loading_thread_active()):
+
+            print("{:<15}{}".format('CORRECT','no threads were started and'
+                + ' set() finished the loading message'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','threads before: ' 
+                + str(num_threads) + ', after: ' 
+                + str(threading.active_count()) + ', stop event was set: '
+                + str(stop_event_was_set)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING LoadingScope
+        """
+
+        # TerminalPrinter.output writes to a terminal stream that records the
+        # text of each write while testing
+        terminal_stream = TerminalStream()
+        TerminalPrinter.output.set_stream(terminal_stream)
+        scope_printer = TerminalPrinter()
+        active_list = []
+
+        def wait_for_text(text):
+
+            # waits up to 2 seconds for the loading message to print text
+            end_time = time.monotonic() + 2
+
+            while (text not in ''.join(terminal_stream.write_list) 
+                and time.monotonic() < end_time):
+
+                time.sleep(0.01)
+
+        @scope_printer.loading('Outer', time_between_dots=10, 
+            time_before_start=0)
+        def load_outer():
+
+            wait_for_text('Outer.')
+
+            with scope_printer.loading('Inner'):
+                active_list.append(scope_printer.loading_thread_active())
+
+            active_list.append(scope_printer.loading_thread_active())
+
+            raise KeyError('error in the scope')
+
+        try:
+
+            load_outer()
+
+        except KeyError:
+
+            pass
+
+        finally:
+
+            TerminalPrinter.output.set_stream(None)
+
+        active_list.append(scope_printer.loading_thread_active())
+
+        print("\nTesting a loading() scope nested in a loading() decorator"
+            + " that raises an error.")
+        if (terminal_stream.write_list == ['Outer', '.', 
+            '\r\x1b[KInner.', '\r\x1b[KOuter.'] 
+            and active_list == [True, True, False]):
+
+            print("{:<15}{}".format('CORRECT','the nested scope changed the'
+                + ' text and the error finished the loading message'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','writes: ' 
+                + repr(terminal_stream.write_list) + ', active: ' 
+                + repr(active_list)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING Scheduler
+        """
+
+        import terminal_printer_scheduler
+
+        test_scheduler = terminal_printer_scheduler.Scheduler()
+        run_list = []
+        reported_error_list = []
+        all_run_event = threading.Event()
+
+        # errors are reported through sys.excepthook, which is replaced while
+        # testing so that the traceback is not printed
+        old_excepthook = sys.excepthook
+        sys.excepthook = lambda *exc_info: reported_error_list.append(
+            exc_info[0])
+
+        try:
+
+            test_scheduler.schedule(0.06, lambda: run_list.append('third'))
+            test_scheduler.schedule(0.02, lambda: run_list.append('first'))
+            test_scheduler.schedule(0.03, lambda: 1 / 0)
+            test_scheduler.schedule(0.04, lambda: run_list.append('second'))
+            test_scheduler.cancel(test_scheduler.schedule(0.05,
+                lambda: run_list.append('cancelled')))
+            test_scheduler.schedule(0.07, all_run_event.set)
+            all_run_event.wait(2)
+
+        finally:
+
+            sys.excepthook = old_excepthook
+
+        print("\nTesting Scheduler with a cancelled timer and a function that"
+            + " raises an error.")
+        if (run_list == ['first', 'second', 'third']
+            and reported_error_list == [ZeroDivisionError]):
+
+            print("{:<15}{}".format('CORRECT','functions were run in order,'
+                + ' the error was reported and the thread kept running'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','functions run: ' 
+                + repr(run_list) + ', errors reported: ' 
+                + repr(reported_error_list)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING LoadingIndicator styles
+        """
+
+        import terminal_printer_loading_thread
+
+        def wait_for_writes(text_list, num_writes):
+
+            # waits up to 2 seconds for num_writes items in text_list
+            end_time = time.monotonic() + 2
+
+            while (len(text_list) < num_writes 
+                and time.monotonic() < end_time):
+
+                time.sleep(0.005)
+
+        terminal_stream = TerminalStream()
+        style_indicator = terminal_printer_loading_thread.LoadingIndicator(
+            terminal_printer_output.TerminalOutput(terminal_stream))
+        style_indicator.begin('Loading', time_before_start=0, 
+            time_between_dots=0.01, style='spinner')
+        wait_for_writes(terminal_stream.write_list, 4)
+        style_indicator.end()
+        bar_frames = terminal_printer_loading_thread.LoadingIndicator\
+            .get_bar_frames()
+
+        print("\nTesting the 'spinner' style and the frames of the 'bar'"
+            + " style.")
+        if (terminal_stream.write_list[:4] == ['Loading |', 
+            '\r\x1b[KLoading /', '\r\x1b[KLoading -', '\r\x1b[KLoading \\']
+            and terminal_stream.write_list[-1] == '\r\x1b[K'
+            and len(set(len(frame) for frame in bar_frames)) == 1
+            and bar_frames[0] == '[===         ]'):
+
+            print("{:<15}{}".format('CORRECT','the line was redrawn in place'
+                + ' and erased at the end, and bar frames have one width'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','writes: ' 
+                + repr(terminal_stream.write_list) + ', bar frames: '
+                + repr(bar_frames)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING LoadingIndicator heartbeat lines
+        """
+
+        import io
+        import re
+
+        log_stream = io.StringIO()
+        heartbeat_indicator = terminal_printer_loading_thread.LoadingIndicator(
+            terminal_printer_output.TerminalOutput(log_stream))
+        heartbeat_indicator.begin('Backup', time_before_start=0, 
+            time_between_dots=0.01, heartbeat_interval=0.05)
+
+        # wait up to 2 seconds for the first line and two heartbeat lines
+        end_time = time.monotonic() + 2
+
+        while (log_stream.getvalue().count('\n') < 3 
+            and time.monotonic() < end_time):
+
+            time.sleep(0.005)
+
+        heartbeat_indicator.end()
+        log_line_list = log_stream.getvalue().splitlines()
+        time_pattern = re.compile(r'\[\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\] ')
+
+        print("\nTesting a loading message written to a stream that is not a"
+            + " terminal.")
+        if (len(log_line_list) >= 4
+            and all(time_pattern.match(line) for line in log_line_list)
+            and log_line_list[0].endswith('] Backup...')
+            and log_line_list[1].endswith(' s')
+            and ' Backup done in ' in log_line_list[-1]):
+
+            print("{:<15}{}".format('CORRECT','heartbeat lines with the time'
+                + ' were written instead of dots'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','lines: ' 
+                + repr(log_line_list)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING KeyReader
+        """
+
+        import os
+        import terminal_printer_keys
+
+        # text that is not from a terminal gives the keys one at a time
+        key_reader = terminal_printer_keys.KeyReader(
+            io.StringIO('ab\nline two\n'))
+        key_result_list = [key_reader.read_key(), key_reader.has_pending(),
+            key_reader.read_line(), key_reader.read_line()]
+
+        try:
+            key_reader.read_line()
+            key_result_list.append('no EOFError')
+        except EOFError:
+            key_result_list.append('EOFError')
+
+        print("\nTesting KeyReader.read_key() and read_line() with a StringIO.")
+        if key_result_list == ['a', True, 'b', 'line two', 'EOFError']:
+
+            print("{:<15}{}".format('CORRECT','the key, the rest of its line,'
+                + ' the next line and EOFError were returned'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','results: ' 
+                + repr(key_result_list)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+        # select() can only wait for pipes on Linux and macOS
+        if os.name != 'nt':
+
+            read_descriptor, write_descriptor = os.pipe()
+            pipe_file = open(read_descriptor, 'r')
+            key_reader = terminal_printer_keys.KeyReader(pipe_file)
+
+            try:
+
+                key_result_list = [key_reader.read_line(timeout=0.05)]
+                os.write(write_descriptor, b'typed\nahead\n')
+                key_result_list.append(key_reader.read_line(timeout=1))
+                key_result_list.append(key_reader.read_line(timeout=1))
+                os.close(write_descriptor)
+
+                try:
+                    key_reader.read_line(timeout=1)
+                    key_result_list.append('no EOFError')
+                except EOFError:
+                    key_result_list.append('EOFError')
+
+            finally:
+
+                pipe_file.close()
+
+            print("\nTesting KeyReader.read_line() with a timeout and a pipe.")
+            if key_result_list == [None, 'typed', 'ahead', 'EOFError']:
+
+                print("{:<15}{}".format('CORRECT','None was returned before'
+                    + ' text was written, then both lines and EOFError'))
+
+            else:
+
+                print("{:<15}{}".format('INCORRECT','results: ' 
+                    + repr(key_result_list)))
+
+                if all_tests_passed:
+                    all_tests_passed = False
+
+
+        """
+        TESTING InputValidator
+        """
+
+        selection_validator = TerminalPrinter.get_input_validator(
+            INPUT_TYPE='integer', LOWER_LIMIT=1, UPPER_LIMIT=10000,
+            SELECTION_LIST=[str(number) for number in range(1, 5001)])
+        range_validator = TerminalPrinter.get_input_validator(
+            INPUT_TYPE='integer', UPPER_LIMIT=10, IGNORE_ENTER=True)
+
+        print("\nTesting InputValidator.parse() with a SELECTION_LIST of 5000"
+            + " entries and with a range.")
+        if (isinstance(selection_validator.selection_set, frozenset)
+            and selection_validator.parse('2500') == (True, 2500, '')
+            and selection_validator.parse('9999')[:2] == (False, '9999')
+            and range_validator.parse('7') == (True, 7, '')
+            and range_validator.parse('') == (True, '', '')
+            and 'between 0 and 10' in range_validator.parse('12')[2]
+            and not range_validator.parse('x')[0]):
+
+            print("{:<15}{}".format('CORRECT','entries were found in a'
+                + ' frozenset and numbers were checked against the range'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','results: ' 
+                + repr([selection_validator.parse('2500'), 
+                range_validator.parse('12'), range_validator.parse('')])))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING BatchAnswers
+        """
+
+        import terminal_printer_input
+
+        batch_answers = TerminalPrinter.get_batch_answers(['7\n', 5, 'x'])
+        result_list = [TerminalPrinter.get_input('Number: ', 
+            INPUT_TYPE='integer', UPPER_LIMIT=10, ANSWERS=batch_answers)
+            for i in range(2)]
+
+        try:
+            TerminalPrinter.get_input('Number: ', INPUT_TYPE='integer',
+                UPPER_LIMIT=10, ANSWERS=batch_answers)
+            error_answer_number = None
+        except terminal_printer_input.InvalidInputError as error:
+            error_answer_number = error.answer_number
+
+        print("\nTesting get_input() with BatchAnswers ['7\\n', 5, 'x'].")
+        if (result_list == [(True, '7'), (True, '5')] 
+            and error_answer_number == 3):
+
+            print("{:<15}{}".format('CORRECT','valid answers were returned and'
+                + ' InvalidInputError was raised for answer 3'))
+
+        else:
+
+            print("{:<15}{}".format('INCORRECT','answers returned: '
+                + repr(result_list) + ', answer with error: ' 
+                + repr(error_answer_number)))
+
             if all_tests_passed:
                 all_tests_passed = False
 
+
         """
-        TESTING __add_char()
+        TESTING PrefixTrie
         """
 
-        # update character_list - 'New'
-        character_list = ['N', 'e', 'w']
+        import terminal_printer_completion
 
-        for char in character_list:
-            UI_object.__buffer_add_char(char)
-        
-        for entry in UI_object.__buffer:
-            print("")
-            for key, value in entry.items():
-                print("{}: {}".format(key, value))
-        print("\nEntered: 'New' into buffer")
-        if (len(UI_object.__buffer) == len(character_list)  
-            and (UI_object.__buffer[0]['char'] == character_list[0] 
-                and UI_object.__buffer[0]['type'] == 'standard_char') 
-            and (UI_object.__buffer[1]['char'] == character_list[1] 
-                and UI_object.__buffer[1]['type'] == 'standard_char') 
-            and (UI_object.__buffer[2]['char'] == character_list[2] 
-                and UI_object.__buffer[2]['type'] == 'standard_char')):
-            
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
-        else:
+        test_trie = terminal_printer_completion.PrefixTrie(['apple', 
+            'apricot', 'application', 'banana', 'band'])
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
-            if all_tests_passed:
-                all_tests_passed = False
-            
-        # update character_list - 'a pig'
-        character_list = ['A', ' ', 'p', 'i', 'g']
+        print("\nTesting PrefixTrie with 5 entries.")
+        if (not test_trie.add('band') and test_trie.get_num_entries('ap') == 3
+            and test_trie.complete('app') == 'l' 
+            and test_trie.complete('ban') == ''
+            and test_trie.get_matches('ap', 2) == (['apple', 'application'], 3)
+            and test_trie.get_matches('q') == ([], 0)
+            and test_trie.get_longest_prefix('apz') == 'ap'):
 
-        # clear buffer
-        UI_object.buffer_clear()
+            print("{:<15}{}".format('CORRECT','entries were counted, completed'
+                + ' and matched in the order they were added'))
 
-        # add characters to __buffer
-        for char in character_list:
-            UI_object.__buffer_add_char(char)
-        
-        for entry in UI_object.__buffer:
-            print("")
-            for key, value in entry.items():
-                print("{}: {}".format(key, value))
-        print("\nEntered: 'A pig' into buffer")
-        if (len(UI_object.__buffer) == len(character_list) 
-            and (UI_object.__buffer[0]['char'] == character_list[0] 
-                and UI_object.__buffer[0]['type'] == 'standard_char') 
-            and (UI_object.__buffer[1]['char'] == character_list[1] 
-                and UI_object.__buffer[1]['type'] == 'space_char') 
-            and (UI_object.__buffer[2]['char'] == character_list[2] 
-                and UI_object.__buffer[2]['type'] == 'standard_char') 
-            and (UI_object.__buffer[3]['char'] == character_list[3] 
-                and UI_object.__buffer[3]['type'] == 'standard_char') 
-            and (UI_object.__buffer[4]['char'] == character_list[4] 
-                and UI_object.__buffer[4]['type'] == 'standard_char')):
-            
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','completions: '
+                + repr([test_trie.complete('app'), test_trie.complete('ban')])
+                + ', matches: ' + repr(test_trie.get_matches('ap', 2))))
+
             if all_tests_passed:
                 all_tests_passed = False
-            
-        """ test tab instruction """
-        
-        # update character_list - 'A[t03]B'
-        character_list = ['A', '[', 't', '0', '3', ']', 'B']
 
-        # clear buffer
-        UI_object.buffer_clear()
 
-        # add characters to __buffer
-        for char in character_list:
-            UI_object.__buffer_add_char(char)
-        
-        for entry in UI_object.__buffer:
-            print("")
-            for key, value in entry.items():
-                print("{}: {}".format(key, value))
-        print("\nEntered: 'A[t03]B' into buffer")
-        if (len(UI_object.__buffer) == len(character_list)
-            and (UI_object.__buffer[0]['char'] == character_list[0]
-                and UI_object.__buffer[0]['type'] == 'standard_char') 
-            and (UI_object.__buffer[1]['char'] == character_list[1] 
-                and UI_object.__buffer[1]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[2]['char'] == character_list[2]
-                and UI_object.__buffer[2]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[3]['char'] == character_list[3]
-                and UI_object.__buffer[3]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[4]['char'] == character_list[4]
-                and UI_object.__buffer[4]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[5]['char'] == character_list[5]
-                and UI_object.__buffer[5]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[6]['char'] == character_list[6]
-                and UI_object.__buffer[6]['type'] == 'standard_char')):
-            
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
-        else:
+        """
+        TESTING InputValidator suggestions
+        """
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
-            if all_tests_passed:
-                all_tests_passed = False
-            
-        """ test indent instruction """
-        
-        # update character_list - 'A[t03]B'
-        character_list = ['A', '[', 'i', '1', '0', ']', 'B']
+        suggestion_validator = TerminalPrinter.get_input_validator(
+            SELECTION_LIST=['host-' + name for name in ['alpha', 'beta', 
+            'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'iota', 
+            'kappa', 'lambda']])
 
-        # clear buffer
-        UI_object.buffer_clear()
+        print("\nTesting check() and get_error_message() of an InputValidator.")
+        if (suggestion_validator.check('host-beta') == (True, 'host-beta')
+            and suggestion_validator.check('hsot-beta') 
+            == (False, 'hsot-beta')
+            and suggestion_validator.get_error_message('host-beta') == ''
+            and 'Did you mean host-beta?' 
+            in suggestion_validator.get_error_message('hsot-beta')):
+
+            print("{:<15}{}".format('CORRECT','check() did not build a message'
+                + ' and get_error_message() suggested the closest option'))
 
-        # add characters to __buffer
-        for char in character_list:
-            UI_object.__buffer_add_char(char)
-        
-        for entry in UI_object.__buffer:
-            print("")
-            for key, value in entry.items():
-                print("{}: {}".format(key, value))
-        print("\nEntered: 'A[i10]B' into buffer")
-        if (len(UI_object.__buffer) == len(character_list)
-            and (UI_object.__buffer[0]['char'] == character_list[0]
-                and UI_object.__buffer[0]['type'] == 'standard_char') 
-            and (UI_object.__buffer[1]['char'] == character_list[1] 
-                and UI_object.__buffer[1]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[2]['char'] == character_list[2]
-                and UI_object.__buffer[2]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[3]['char'] == character_list[3]
-                and UI_object.__buffer[3]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[4]['char'] == character_list[4]
-                and UI_object.__buffer[4]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[5]['char'] == character_list[5]
-                and UI_object.__buffer[5]['type'] == 'special_formatting_char') 
-            and (UI_object.__buffer[6]['char'] == character_list[6]
-                and UI_object.__buffer[6]['type'] == 'standard_char')):
-            
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','check() or'
+                + ' get_error_message() gave an unexpected result'))
+
             if all_tests_passed:
                 all_tests_passed = False
 
-        """ test color instructions """
-        
-        # test color by name
 
-        # update character_list - 'A[c-red]B' 
-        character_list = ['A', '[', 'c', '-', 'r', 'e', 'd', ']', 'B']
+        """
+        TESTING TrigramIndex
+        """
 
-        # clear buffer
-        UI_object.buffer_clear()
+        import terminal_printer_fuzzy
+
+        trigram_index = terminal_printer_fuzzy.TrigramIndex(['production', 
+            'staging', 'development', 'preview'])
+
+        print("\nTesting TrigramIndex.get_closest() with misspelled entries.")
+        if (trigram_index.get_closest('prodution') == ['production']
+            and trigram_index.get_closest('stagign', 1) == ['staging']
+            and trigram_index.get_closest('zzz') == []
+            and terminal_printer_fuzzy.get_index(frozenset(['a1', 'b2'])) 
+            is terminal_printer_fuzzy.get_index(frozenset(['b2', 'a1']))):
+
+            print("{:<15}{}".format('CORRECT','the closest entries were found'
+                + ' and the index was reused for the same entries'))
 
-        # add characters to __buffer
-        for char in character_list:
-            UI_object.__buffer_add_char(char)
-        
-        for entry in UI_object.__buffer:
-            print("")
-            for key, value in entry.items():
-                print("{}: {}".format(key, value))
-        print("\nEntered: 'A#[91mB' into buffer where # is a special character")
-        if (len(UI_object.__buffer) == 7
-            and (UI_object.__buffer[0]['char'] == character_list[0]
-                and UI_object.__buffer[0]['type'] == 'standard_char')
-            and (UI_object.__buffer[2]['char'] == '['
-                and UI_object.__buffer[2]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[3]['char'] == '9'
-                and UI_object.__buffer[3]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[4]['char'] == '1'
-                and UI_object.__buffer[4]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[5]['char'] == 'm'
-                and UI_object.__buffer[5]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[6]['char'] == 'B'
-                and UI_object.__buffer[6]['type'] == 'standard_char')
-            and UI_object.__color == 'red'):
-            
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','closest entries: '
+                + repr([trigram_index.get_closest('prodution'), 
+                trigram_index.get_closest('stagign', 1)])))
+
             if all_tests_passed:
                 all_tests_passed = False
 
-        """ manually change __color and test removing color """
-        UI_object.__color = 'blue'
 
-        # update character_list - 'A[t03]B'
-        character_list = ['A', '[', 'c', '-', 'n', 'o', 'n', 'e', ']', 'B']
+        """
+        TESTING InputForm
+        """
 
-        # clear buffer
-        UI_object.buffer_clear()
+        test_form = TerminalPrinter.get_input_form()
+        test_form.add_field('host', 'Host: ', SELECTION_LIST=['prod', 'dev'])
+        test_form.add_field('port', 'Port: ', INPUT_TYPE='integer', 
+            LOWER_LIMIT=1, UPPER_LIMIT=65535)
+        test_form.add_field('retries', 'Retries: ', INPUT_TYPE='integer', 
+            UPPER_LIMIT=5, IGNORE_ENTER=True)
+        form_value_dict, form_error_dict = test_form.validate({'host': 'test',
+            'port': 'x'})
+        form_result = test_form.ask(ANSWERS={'host': 'dev', 'port': 22}, 
+            PROMPT=False)
+
+        try:
+            test_form.ask(ANSWERS={'host': 'prod', 'port': 99999}, 
+                PROMPT=False)
+            error_answer_number = None
+        except terminal_printer_input.InvalidInputError as error:
+            error_answer_number = error.answer_number
+
+        print("\nTesting InputForm with 3 fields and answers given in"
+            + " advance.")
+        if (form_value_dict == {'retries': ''} 
+            and list(form_error_dict) == ['host', 'port']
+            and form_result == (True, {'host': 'dev', 'port': 22, 
+            'retries': ''})
+            and error_answer_number == 2):
+
+            print("{:<15}{}".format('CORRECT','every field was checked'
+                + ' together and field 2 raised InvalidInputError'))
 
-        # add characters to __buffer
-        for char in character_list:
-            UI_object.__buffer_add_char(char)
-        
-        for entry in UI_object.__buffer:
-            print("")
-            for key, value in entry.items():
-                print("{}: {}".format(key, value))
-        print("\nEntered: 'A#[0mB' into buffer where # is a special character")
-        if (len(UI_object.__buffer) == 6
-            and (UI_object.__buffer[0]['char'] == character_list[0]
-                and UI_object.__buffer[0]['type'] == 'standard_char')
-            and (UI_object.__buffer[2]['char'] == '['
-                and UI_object.__buffer[2]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[3]['char'] == '0'
-                and UI_object.__buffer[3]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[4]['char'] == 'm'
-                and UI_object.__buffer[4]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[5]['char'] == 'B'
-                and UI_object.__buffer[5]['type'] == 'standard_char')
-            and UI_object.__color == 'none'):
-            
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','errors: ' 
+                + repr(list(form_error_dict)) + ', result: ' 
+                + repr(form_result) + ', field with error: ' 
+                + repr(error_answer_number)))
+
             if all_tests_passed:
                 all_tests_passed = False
 
-        # test color instruction by rgb values
-        
-        # update character_list - 'A[t03]B'
-        character_list = ['A', '[', 'c', '-', '2', '5', '5', ';', '2', '5', '5', 
-            ';', '2', '5', '5', ']', 'B']
 
-        # clear buffer
-        UI_object.buffer_clear()
+        """
+        TESTING ScreenControl batches
+        """
 
-        # add characters to __buffer
-        for char in character_list:
-            UI_object.__buffer_add_char(char)
-        
-        for entry in UI_object.__buffer:
-            print("")
-            for key, value in entry.items():
-                print("{}: {}".format(key, value))
-        print("\nEntered: 'A#[38;2;255;255;255mB' into buffer where # is a special character")
-        if (len(UI_object.__buffer) == 21
-            and (UI_object.__buffer[0]['char'] == character_list[0]
-                and UI_object.__buffer[0]['type'] == 'standard_char')
-            and UI_object.__buffer[1]['type'] == 'formatting_char'
-            and (UI_object.__buffer[2]['char'] == '['
-                and UI_object.__buffer[2]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[3]['char'] == '3'
-                and UI_object.__buffer[3]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[4]['char'] == '8'
-                and UI_object.__buffer[4]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[5]['char'] == ';'
-                and UI_object.__buffer[5]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[6]['char'] == '2'
-                and UI_object.__buffer[6]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[7]['char'] == ';'
-                and UI_object.__buffer[7]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[8]['char'] == '2'
-                and UI_object.__buffer[8]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[9]['char'] == '5'
-                and UI_object.__buffer[9]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[10]['char'] == '5'
-                and UI_object.__buffer[10]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[11]['char'] == ';'
-                and UI_object.__buffer[11]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[12]['char'] == '2'
-                and UI_object.__buffer[12]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[13]['char'] == '5'
-                and UI_object.__buffer[13]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[14]['char'] == '5'
-                and UI_object.__buffer[14]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[15]['char'] == ';'
-                and UI_object.__buffer[15]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[16]['char'] == '2'
-                and UI_object.__buffer[16]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[17]['char'] == '5'
-                and UI_object.__buffer[17]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[18]['char'] == '5'
-                and UI_object.__buffer[18]['type'] == 'formatting_char') 
-            and (UI_object.__buffer[19]['char'] == 'm'
-                and UI_object.__buffer[19]['type'] == 'formatting_char')
-            and (UI_object.__buffer[20]['char'] == 'B'
-                and UI_object.__buffer[20]['type'] == 'standard_char')
-            and UI_object.__color == '255;255;255'):
-            
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
-        else:
+        import terminal_printer_screen
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
-            if all_tests_passed:
-                all_tests_passed = False
+        class RecordingOutput:
 
-        """ test bold, italics, underline and strikethrough toggling on """
+            # output that records the text of each write
+            def __init__(self):
+                self.write_list = []
 
-        # test bold - toggle on
-        
-        print("\nTesting [b] instruction.")
-        
-        # set starting string and processed character list
-        starting_string = 'A[b]B'
-        processed_character_list = [
-            {'char': 'A', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '1', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'B', 'type': 'standard_char'}
-        ]
+            def write(self, text):
+                self.write_list.append(text)
+                return True
 
-        # clear buffer
-        UI_object.buffer_clear()
+        recording_output = RecordingOutput()
+        batch_screen = terminal_printer_screen.ScreenControl(recording_output)
+        batch_started_event = threading.Event()
+        other_write_event = threading.Event()
 
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
+        # another thread writes while the batch of this thread is open
+        def write_outside_batch():
+            batch_started_event.wait(2)
+            batch_screen.write('other')
+            other_write_event.set()
 
-        # set variable for current test result
-        current_test_passed = True
+        other_thread = threading.Thread(target=write_outside_batch, 
+            daemon=True)
+        other_thread.start()
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+        with batch_screen.batch():
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
-        else:
+            batch_screen.save_cursor()
+            batch_started_event.set()
+            other_write_event.wait(2)
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
-            if all_tests_passed:
-                all_tests_passed = False
+            with batch_screen.batch():
+                batch_screen.write('batch')
 
-        # test [i]
-        print("\nTesting [i] instruction.")
-        
-        # set starting string and processed character list
-        starting_string = 'A[i]B'
-        processed_character_list = [
-            {'char': 'A', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '3', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'B', 'type': 'standard_char'}
-        ]
+            batch_screen.restore_cursor()
 
-        # clear buffer
-        UI_object.buffer_clear()
+        other_thread.join(2)
 
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
+        print("\nTesting ScreenControl batches with writes from two threads.")
+        if recording_output.write_list == ['other', '\x1b7batch\x1b8']:
 
-        # set variable for current test result
-        current_test_passed = True
+            print("{:<15}{}".format('CORRECT',"the other thread's write was"
+                + ' printed straight away and the batch with a single write'))
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+        else:
+
+            print("{:<15}{}".format('INCORRECT','writes: ' 
+                + repr(recording_output.write_list)))
+
+            if all_tests_passed:
+                all_tests_passed = False
+
+
+        """
+        TESTING FrameRenderer
+        """
+
+        import terminal_printer_frame
+
+        recording_output = RecordingOutput()
+        frame_renderer = terminal_printer_frame.FrameRenderer(20, 3, 
+            terminal_printer_screen.ScreenControl(recording_output))
+        frame_renderer.begin()
+        num_chars_list = [frame_renderer.render(frame_text) for frame_text in
+            ['CPU 10%[n][b]Mem[b] 2GB', 'CPU 10%[n][b]Mem[b] 2GB', 
+            'CPU 12%[n][b]Mem[b] 2GB']]
+        frame_renderer.end()
+
+        print("\nTesting FrameRenderer with a frame drawn again unchanged and"
+            + " with one character changed.")
+        if (num_chars_list[1] == 0 and len(recording_output.write_list) == 4
+            and recording_output.write_list[2] == '\x1b[1;6H\x1b[0m2\x1b[0m'
+            and num_chars_list[2] == len(recording_output.write_list[2])):
+
+            print("{:<15}{}".format('CORRECT','nothing was printed for the'
+                + ' same frame and only the changed cell for the next frame'))
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','characters printed: ' 
+                + repr(num_chars_list) + ', writes: ' 
+                + repr(recording_output.write_list)))
+
             if all_tests_passed:
                 all_tests_passed = False
-        
-        # test [s]
-        print("\nTesting [s] instruction.")
-        
-        # set starting string and processed character list
-        starting_string = 'A[s]B'
-        processed_character_list = [
-            {'char': 'A', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '9', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'B', 'type': 'standard_char'}
-        ]
 
-        # clear buffer
-        UI_object.buffer_clear()
-
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
 
-        # set variable for current test result
-        current_test_passed = True
+        """
+        TESTING LiveRegion
+        """
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+        import terminal_printer_live
+
+        class RecordingTerminalOutput(RecordingOutput):
+
+            # recording output that is a terminal when is_terminal is True
+            def __init__(self, is_terminal):
+                super().__init__()
+                self.__is_terminal = is_terminal
+
+            def is_terminal(self):
+                return self.__is_terminal
+
+        # the status lines of a region that is not printing to a terminal are
+        # only printed when it stops
+        file_output = RecordingTerminalOutput(False)
+        file_live_region = terminal_printer_live.LiveRegion(2, 
+            screen=terminal_printer_screen.ScreenControl(file_output))
+        file_live_region.start()
+        file_live_region.set_lines(['Jobs: [b]3[b]', 'Done'])
+        num_writes_while_active = len(file_output.write_list)
+        file_live_region.stop()
+
+        # the first change is printed straight away and the next changes are
+        # combined into a single update printed by flush()
+        terminal_output = RecordingTerminalOutput(True)
+        terminal_live_region = terminal_printer_live.LiveRegion(2, 
+            MAX_REFRESH_RATE=0.1, 
+            screen=terminal_printer_screen.ScreenControl(terminal_output))
+        terminal_live_region.start()
+        for line_number, line_text in [(0, 'a'), (1, 'b'), (0, 'c')]:
+            terminal_live_region.set_line(line_number, line_text)
+        num_writes_before_flush = len(terminal_output.write_list)
+        terminal_live_region.flush()
+        terminal_live_region.stop()
+
+        print("\nTesting LiveRegion printing to a file and combining updates"
+            + " printed to a terminal.")
+        if (num_writes_while_active == 0 and len(file_output.write_list) == 1
+            and file_output.write_list[0].startswith('Jobs: \x1b[1m3\x1b[0m')
+            and file_output.write_list[0].endswith('\nDone\x1b[0m\n')
+            and num_writes_before_flush == 2
+            and len(terminal_output.write_list) == 4
+            and '\x1b[2Kc\x1b[0m' in terminal_output.write_list[2]
+            and '\x1b[2Kb\x1b[0m' in terminal_output.write_list[2]):
+
+            print("{:<15}{}".format('CORRECT','the file got the last status'
+                + ' lines when stopped and the terminal got one combined'
+                + ' update'))
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','file writes: ' 
+                + repr(file_output.write_list) + ', terminal writes: ' 
+                + repr(terminal_output.write_list)))
+
             if all_tests_passed:
                 all_tests_passed = False
-        
-        # test [u]
-        print("\nTesting [u] instruction.")
-        
-        # set starting string and processed character list
-        starting_string = 'A[u]B'
-        processed_character_list = [
-            {'char': 'A', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '4', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'B', 'type': 'standard_char'}
-        ]
 
-        # clear buffer
-        UI_object.buffer_clear()
 
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
+        """
+        TESTING StatusThrottle
+        """
 
-        # set variable for current test result
-        current_test_passed = True
+        import terminal_printer_throttle
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+        # the first status is printed straight away and the next statuses wait
+        # as the next print is allowed after 10 seconds
+        terminal_stream = TerminalStream()
+        TerminalPrinter.output.set_stream(terminal_stream)
+        status_throttle = terminal_printer_throttle.StatusThrottle(MAX_RATE=0.1)
+
+        try:
+
+            status_throttle.set_status('Step 1')
+            status_throttle.set_status('Step 2')
+            status_throttle.set_status('Step 3')
+            status_throttle.set_status('[b]5[b] files', channel='files')
+            num_writes_before_flush = len(terminal_stream.write_list)
+            status_throttle.flush()
+
+        finally:
+
+            TerminalPrinter.output.set_stream(None)
+
+        print("\nTesting StatusThrottle with statuses for two channels set"
+            + " faster than the maximum rate.")
+        if (terminal_stream.write_list == ['Step 1\x1b[0m\n', 
+            'Step 3\x1b[0m\n\x1b[1m5\x1b[0m files\x1b[0m\n']
+            and num_writes_before_flush == 1
+            and status_throttle.get_num_dropped() == 1):
+
+            print("{:<15}{}".format('CORRECT','only the first status and the'
+                + ' latest status of each channel were printed'))
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','writes: ' 
+                + repr(terminal_stream.write_list) + ', dropped: ' 
+                + str(status_throttle.get_num_dropped())))
+
             if all_tests_passed:
                 all_tests_passed = False
 
-        print("After toggling on bold, italics, underline, and strikethrough"
-            + " the attributes are:")
-        print("Bold: {}".format(UI_object.__bold))
-        print("Italics: {}".format(UI_object.__italics))
-        print("Underline: {}".format(UI_object.__underline))
-        print("Strikethrough: {}".format(UI_object.__strikethrough))
-        input("Press any key to continue")
-
-        """ test bold, italics, underline and strikethrough toggling off """
 
-        # test bold - toggle off
-        
-        print("\nTesting [b] instruction for toggle off.")
-        
-        # set starting string and processed character list
-        starting_string = 'C[b]D'
-        processed_character_list = [
-            {'char': 'C', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '0', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '3', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '9', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '4', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '3', 'type': 'formatting_char'},
-            {'char': '8', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'D', 'type': 'standard_char'}
-        ]
+        """
+        TESTING TableRenderer
+        """
 
-        # clear buffer
-        UI_object.buffer_clear()
+        import terminal_printer_table
 
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
+        # in 'streaming' mode the widths are found from the headings and the
+        # first row, so the longer cell of the second row is wrapped
+        table_renderer = terminal_printer_table.TableRenderer(['Name', 
+            'State'], SAMPLE_SIZE=1)
+        table_line_list = list(table_renderer.render(iter([['a', 
+            '[b]ok[b]'], ['longer name here', 'done']])))
+        visible_line_list = [terminal_printer_table.FORMATTING_PATTERN.sub(
+            '', table_line) for table_line in table_line_list]
 
-        # set variable for current test result
-        current_test_passed = True
+        print("\nTesting TableRenderer with a formatted cell and a cell wider"
+            + " than the rows used to find the column widths.")
+        if (visible_line_list == ['Name | State', '-----+------', 
+            'a    | ok', 'long | done', 'er   |', 'name |', 'here |']
+            and table_line_list[2].startswith('a    | \x1b[1mok\x1b[0m')):
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+            print("{:<15}{}".format('CORRECT','the formatting was not counted'
+                + ' in the widths and the wide cell was wrapped'))
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','lines: ' 
+                + repr(table_line_list)))
+
             if all_tests_passed:
                 all_tests_passed = False
-        
-        # test italics - toggle off
-        
-        print("\nTesting [i] instruction for toggle off.")
-        
-        # set starting string and processed character list
-        starting_string = 'C[i]D'
-        processed_character_list = [
-            {'char': 'C', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '0', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '9', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '4', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '3', 'type': 'formatting_char'},
-            {'char': '8', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'D', 'type': 'standard_char'}
-        ]
 
-        # clear buffer
-        UI_object.buffer_clear()
 
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
+        """
+        TESTING Pager and command line program
+        """
+
+        import os
+        import tempfile
+        import terminal_printer_cli
+        import terminal_printer_pager
+
+        # the formatting is cleared by [c-none] at the end of the first line
+        pager_file_descriptor, pager_file_path = tempfile.mkstemp()
+        os.write(pager_file_descriptor, b'x [c-pink]c[c-none]\nplain\n')
+        os.close(pager_file_descriptor)
+
+        try:
+
+            with terminal_printer_pager.Pager(pager_file_path, 
+                PARAGRAPH_WIDTH=10, height=5) as pager:
+
+                pager_row_list = pager.get_window_lines()
+
+        finally:
+
+            os.remove(pager_file_path)
+
+        read_descriptor, write_descriptor = os.pipe()
+        os.write(write_descriptor, b'x [c-pink]c[c-none]\n')
+        os.close(write_descriptor)
+        cli_line_list = []
 
-        # set variable for current test result
-        current_test_passed = True
+        try:
+            terminal_printer_cli.print_lines(read_descriptor, 
+                cli_line_list.extend, PARAGRAPH_WIDTH=10)
+        finally:
+            os.close(read_descriptor)
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+        print("\nTesting Pager rows and command line output ending with"
+            + " [c-none].")
+        if (pager_row_list == ['x \x1b[38;2;255;192;205mc\x1b[0m', 
+            'plain\x1b[0m']
+            and cli_line_list == ['x \x1b[38;2;255;192;205mc\x1b[0m\n']):
+
+            print("{:<15}{}".format('CORRECT','the formatting was cleared'
+                + ' once at the end of each row and line'))
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','rows: ' 
+                + repr(pager_row_list) + ', lines: ' + repr(cli_line_list)))
+
             if all_tests_passed:
                 all_tests_passed = False
-        
-        # test strikethrough - toggle off
-        
-        print("\nTesting [s] instruction for toggle off.")
-        
-        # set starting string and processed character list
-        starting_string = 'C[s]D'
-        processed_character_list = [
-            {'char': 'C', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '0', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '4', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '3', 'type': 'formatting_char'},
-            {'char': '8', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'D', 'type': 'standard_char'}
-        ]
 
-        # clear buffer
-        UI_object.buffer_clear()
 
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
+        """
+        TESTING format_stream
+        """
 
-        # set variable for current test result
-        current_test_passed = True
+        import io
+        import terminal_printer_stream
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+        class LineSink:
+
+            # sink that records the lines written
+            def __init__(self):
+                self.line_list = []
+
+            def writelines(self, line_list):
+                self.line_list.extend(line_list)
+
+        # text longer than FEED_SIZE with formatting instructions, words 
+        # longer than a line and brackets that are not instructions
+        stream_text = (('[b]Bold[b] words, [c-red]red[c-none] [t05]tabs'
+            + ' [i02]and [i00]') * 300 + 'a_word_longer_than_the_line_' * 5
+            + ' [c-pink]open [bracket] ] [') * 3
+        line_sink = LineSink()
+        stream_result = terminal_printer_stream.format_stream(
+            io.StringIO(stream_text), line_sink, PARAGRAPH_WIDTH=37, 
+            TEXT_INDENT=2, FOLLOWING_LINE_INDENT=1)
+        expected_line_list = [line + '\n' for line in 
+            TerminalPrinter.convert_message(stream_text, PARAGRAPH_WIDTH=37,
+            TEXT_INDENT=2, FOLLOWING_LINE_INDENT=1)]
+
+        print("\nTesting format_stream() with text in several parts.")
+        if (line_sink.line_list == expected_line_list
+            and stream_result['num_lines'] == len(expected_line_list)):
+
+            print("{:<15}{}".format('CORRECT','the lines written were the same'
+                + ' as convert_message() returns for the whole text'))
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','the lines written were'
+                + ' different to the lines from convert_message()'))
+
             if all_tests_passed:
                 all_tests_passed = False
-        
-        # test strikethrough - toggle off
-        
-        print("\nTesting [u] instruction for toggle off.")
-        
-        # set starting string and processed character list
-        starting_string = 'C[u]D'
-        processed_character_list = [
-            {'char': 'C', 'type': 'standard_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '0', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': '#', 'type': 'formatting_char'},
-            {'char': '[', 'type': 'formatting_char'},
-            {'char': '3', 'type': 'formatting_char'},
-            {'char': '8', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': ';', 'type': 'formatting_char'},
-            {'char': '2', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': '5', 'type': 'formatting_char'},
-            {'char': 'm', 'type': 'formatting_char'},
-            {'char': 'D', 'type': 'standard_char'}
-        ]
 
-        # clear buffer
-        UI_object.buffer_clear()
 
-        # add characters to __buffer
-        for i in range(len(starting_string)):
-            UI_object.__buffer_add_char(starting_string[i])
+        """
+        TESTING command line program
+        """
 
-        # set variable for current test result
-        current_test_passed = True
+        cli_file_descriptor, cli_file_path = tempfile.mkstemp()
+        os.write(cli_file_descriptor, 
+            b'one [c-255;0;0]two\n\n[b]three four five six[b]\n')
+        os.close(cli_file_descriptor)
 
-        print("Characters after processing are: ", end='')
-        
-        # check characters in the buffer
-        for i in range(len(processed_character_list)):
-            
-            print(processed_character_list[i]['char'], end='')
-            
-            if not ((processed_character_list[i]['char'] == '#'
-                    and UI_object.__buffer[i]['type'] 
-                    == 'formatting_char')
-                or (processed_character_list[i]['char'] != '#'
-                    and UI_object.__buffer[i]['char'] 
-                        == processed_character_list[i]['char']
-                    and UI_object.__buffer[i]['type']
-                        == processed_character_list[i]['type'])):
-                
-                # update current_test_passed to False as test failed
-                if current_test_passed:
-                    current_test_passed = False
-        
-        print("")
+        # the program writes to sys.stdout.buffer, which is replaced while 
+        # testing
+        original_stdout = sys.stdout
+        sys.stdout = io.TextIOWrapper(io.BytesIO())
+
+        try:
+
+            cli_exit_status = terminal_printer_cli.main(['--width', '12', 
+                '--color', '256', cli_file_path])
+            cli_output = sys.stdout.buffer.getvalue()
+
+        finally:
+
+            sys.stdout = original_stdout
+            os.remove(cli_file_path)
+
+        print("\nTesting the command line program with --width 12 and"
+            + " --color 256.")
+        if (cli_exit_status == 0 and cli_output == b'one \x1b[38;5;196mtwo'
+            b'\x1b[0m\n\n\x1b[1mthree four \nfive six\x1b[0m\n'):
+
+            print("{:<15}{}".format('CORRECT','each line was wrapped to 12'
+                + ' characters with a color of the 256 color palette'))
 
-        # print results of current test
-        if current_test_passed:
-        
-            print("{:<15}{}".format('CORRECT','Characters in buffer are correct'))
-            
         else:
 
-            print("{:<15}{}".format('INCORRECT','Characters in buffer are not'
-                + ' correct.'))
-            
+            print("{:<15}{}".format('INCORRECT','exit status ' 
+                + str(cli_exit_status) + ', output: ' + repr(cli_output)))
+
             if all_tests_passed:
                 all_tests_passed = False
 
-        
-        # print values for bold, italics, underline and strikethrough attributes
-        print("After toggling on bold, italics, underline, and strikethrough"
-            + " the attributes are:")
-        print("Bold: {}".format(UI_object.__bold))
-        print("Italics: {}".format(UI_object.__italics))
-        print("Underline: {}".format(UI_object.__underline))
-        print("Strikethrough: {}".format(UI_object.__strikethrough))
-        input("Press any key to continue")
-
-        """ clear text color so all formatting was removed """
-        UI_object.__color = 'none'
 
         """
-        Test convert_message and buffer_load_message
+        TESTING IncrementalWriter
         """
 
-        new_message = ('Test message using bold[b], blue text[c-blue], indent 10'
-            + '[i10] then a new line[n]removing bold[b] and changing color to white'
-            + '[c-255;255;255] before having a tab 5[t05] and removing color'
-            + '[c-none] to finish.')
-        
-        # clear buffer
-        UI_object.buffer_clear()
-
-        # load new_message into buffer
-        UI_object.__buffer_load_message(new_message)
+        import terminal_printer_incremental
 
-        print("\nAfter adding characters to buffer, buffer is: ")
+        # the text is added 3 characters at a time, splitting words and
+        # formatting commands between parts
+        incremental_text = ('Some [b]bold[b] words that wrap\nat [c-pink]'
+            + 'twenty[c-none] wide')
+        file_output = RecordingTerminalOutput(False)
 
-        # print text in buffer
-        for i in range(len(UI_object.__buffer)):
+        with terminal_printer_incremental.IncrementalWriter(
+            PARAGRAPH_WIDTH=20, output=file_output) as incremental_writer:
 
-            if UI_object.__buffer[i]['char'] == '\x1b':
-                print('#', end='')
-            else:
-                print(UI_object.__buffer[i]['char'], end='')
-        
-        # get text from buffer and print details received
-        print("\nTesting __buffer_return_text_portion()")
+            for part_start in range(0, len(incremental_text), 3):
+                incremental_writer.append(incremental_text[part_start:
+                    part_start + 3])
 
-        while UI_object.__buffer:
+        # parts that only add to the last line only print the new characters
+        terminal_output = RecordingTerminalOutput(True)
+        incremental_writer = terminal_printer_incremental.IncrementalWriter(
+            PARAGRAPH_WIDTH=20, output=terminal_output)
+        num_chars_list = [incremental_writer.append(part) for part in 
+            ['Hello', ' there', ' friend']]
+        incremental_writer.finish()
 
-            # get text portion from buffer
-            text_portion, num_chars, text_type = UI_object.__buffer_return_text_portion()
+        print("\nTesting IncrementalWriter with text added 3 characters at a"
+            + " time and with words added to the last line of a terminal.")
+        if (''.join(file_output.write_list) == '\n'.join(
+            TerminalPrinter.convert_message(incremental_text, 
+            PARAGRAPH_WIDTH=20)) + '\n' and num_chars_list == [5, 6, 7]
+            and terminal_output.write_list == ['Hello', ' there', ' friend', 
+            '\x1b[0m\n']):
 
-            print("Returned: '{}' with {} characters of type {}".format(
-                text_portion, num_chars, text_type))
-        
-        print("Buffer is empty {}".format(UI_object.__buffer_is_empty()))
+            print("{:<15}{}".format('CORRECT','the text matched'
+                + ' convert_message() and only new words were printed'))
 
-        message_to_test_printing = ('0123456789012345678901234567890123456789'
-            + '0123456789012345678901234567890123456789'
-            + ' 0123456789012345678901234567890123456789'
-            + '0123456789012345678901234567890123456789'
-            + 'Test message. No indents or formatting. Indent 10[i10] for next line'
-            + ' while making bold[b] and then underlined[u] and blue.[c-blue]'
-            + ' Now change[b] to white[c-255;255;255] using rgb. Make strikethrough'
-            + ' [s] before using a new line.[n] Now remove strikethrough[s] but'
-            + ' add italics[i] and use a tab of 5[t05]. Clear formatting[i][u][b]'
-            + '[c-none] so back to normal')
-        
-        printable_message_list = TerminalPrinter.convert_message(message_to_test_printing)
-        print("\nThe following message has numbers that fill the line followed"
-              + " by a space then numbers with 'test' appended that exceed"
-              + " a full line and should be split. Note that the space should"
-              + " not appear as it is at the beginning of a line without"
-              + " characters and should be ignored.\n")
-        for message in printable_message_list:
-            print(message)
+        else:
 
-        printable_message_list_02 = TerminalPrinter.convert_message(
-            message_to_test_printing, PARAGRAPH_WIDTH=100, TEXT_INDENT=5, 
-            FOLLOWING_LINE_INDENT=10)
-        print("\nThe following text is the same as the previous text. Paragraph"
-            + " width has been increased by 20. All text has been indented 5 and"
-            + " an additional indent of 10 on each line after the first has"
-            + " also been applied.\n")
-        for i in range(len(printable_message_list_02)):
-            if i != len(printable_message_list_02) - 1:
-                print(printable_message_list_02[i])
-            else:
-                print(printable_message_list_02[i], end='')
-        print(" Text didn't have a new line at the end")
+            print("{:<15}{}".format('INCORRECT','file writes: ' 
+                + repr(file_output.write_list) + ', terminal writes: ' 
+                + repr(terminal_output.write_list)))
 
-            
+            if all_tests_passed:
+                all_tests_passed = False
 
-        
         input("Quit")
 
 
@@ -2640,5 +4447,16 @@ class TerminalPrinter:
             print("\nPASSED: All tests for TerminalPrinter were passed.")
         else:
             print("\nFAILED. At least one test for TerminalPrinter was failed.")
-        
 
+if __name__ == '__main__':
+
+    # run the command line program (see terminal_printer_cli) when run with
+    # python -m terminal_printer. This module is registered as 
+    # terminal_printer so that the modules imported by the command line 
+    # program use it rather than importing a second copy, with its own 
+    # TerminalPrinter, converter pool and output
+    sys.modules['terminal_printer'] = sys.modules[__name__]
+
+    import terminal_printer_cli
+
+    sys.exit(terminal_printer_cli.main())
@@ -0,0 +1,685 @@
+"""
+Author: Luke Morris
+
+This module contains benchmarks for TerminalPrinter. Each benchmark returns a
+dictionary with its results so that the results can be compared between
+versions, and the benchmarks can be run and printed with:
+
+    python terminal_printer_benchmark.py
+
+The benchmarks include:
+
+    - benchmark_import_time() which imports terminal_printer in a new Python
+        process using '-X importtime' and records the time taken to import
+        terminal_printer and the modules it imports.
+    - benchmark_convert_message() which records the number of short messages
+        that TerminalPrinter.convert_message() converts per second.
+    - benchmark_loading_cycles() which records the number of times per 
+        second that a loading message can be started and finished.
+    - benchmark_indicator_cpu() which records the processing time used 
+        while many loading trackers are active.
+    - benchmark_input_validation() which records the number of inputs per
+        second checked against a large SELECTION_LIST, and separately the
+        number of error messages per second created for inputs that are not
+        in it, which includes finding the closest entries.
+    - benchmark_batch_answers() which records the number of get_input() 
+        prompts per second answered from a list of answers.
+    - benchmark_suggestions() which records the time taken to find the 
+        closest entries of a large SELECTION_LIST to an input.
+    - benchmark_frame_renderer() which records the number of characters 
+        printed for a full screen frame where one value changes, compared 
+        to reprinting the whole frame.
+    - benchmark_table() which records the number of table rows printed per 
+        second from a generator, and the peak memory used.
+    - benchmark_pager() which records the time taken to index a large 
+        file for the pager, to show a screen in the middle of it and to
+        search it, and the peak memory used.
+    - benchmark_print_formatted_file() which records the number of MB per 
+        second that print_formatted_file() converts and the peak memory 
+        used.
+    - benchmark_command_line() which records the time taken to start 
+        'python -m terminal_printer' and the number of MB per second it 
+        prints through a pipe.
+    - benchmark_print_status() which records the number of print_status() 
+        calls per second in a loop and the number of messages printed.
+    - benchmark_incremental_writer() which records the number of words per
+        second added to an IncrementalWriter and the characters printed for
+        each word, compared to converting and printing all of the text again
+        for each word.
+
+Last modified: 19 October 2026
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+def benchmark_import_time(NUM_RUNS=10, MODULE_NAME='terminal_printer') -> dict:
+
+    """
+    Imports MODULE_NAME in NUM_RUNS new Python processes started with
+    '-X importtime' and returns a dictionary with:\n
+        'median_microseconds' - the median cumulative import time of
+        MODULE_NAME in microseconds\n
+        'min_microseconds' - the fastest cumulative import time\n
+        'modules_imported' - the names of the modules imported while
+        importing MODULE_NAME in the last run
+    """
+
+    # set list to store the cumulative import time of each run
+    import_time_list = []
+    modules_imported = []
+
+    # run from the directory containing this module so that MODULE_NAME can
+    # be imported
+    module_directory = os.path.dirname(os.path.abspath(__file__))
+
+    for i in range(NUM_RUNS):
+
+        completed_process = subprocess.run([sys.executable, '-X', 'importtime',
+            '-c', 'import ' + MODULE_NAME], cwd=module_directory,
+            capture_output=True, text=True, check=True)
+
+        # lines are in the format
+        # 'import time: self [us] | cumulative | imported package'.
+        # The modules imported by MODULE_NAME are printed directly above
+        # MODULE_NAME and are indented
+        modules_imported = []
+        for line in completed_process.stderr.splitlines():
+
+            if not line.startswith('import time:'):
+                continue
+
+            portions = line[len('import time:'):].split('|')
+
+            # skip heading line
+            if not portions[0].strip().isdigit():
+                continue
+
+            name = portions[2]
+
+            if name.strip() == MODULE_NAME and not name.startswith('  '):
+
+                # MODULE_NAME was imported
+                import_time_list.append(int(portions[1]))
+                break
+
+            if name.startswith('   '):
+
+                # module imported by another module. Modules that are not
+                # indented are imported by Python during start up
+                modules_imported.append(name.strip())
+
+            else:
+
+                # module imported during start up so not part of MODULE_NAME
+                modules_imported = []
+
+    return {'median_microseconds': statistics.median(import_time_list),
+        'min_microseconds': min(import_time_list),
+        'modules_imported': modules_imported}
+
+def benchmark_convert_message(NUM_MESSAGES=20000, 
+    MESSAGE='[b]Status:[b] [c-green]ok[c-none] 42 items processed') -> dict:
+
+    """
+    Converts MESSAGE NUM_MESSAGES times with TerminalPrinter.convert_message()
+    and returns a dictionary with 'messages_per_second'
+    """
+
+    import terminal_printer
+
+    start_time = time.perf_counter()
+
+    for i in range(NUM_MESSAGES):
+        terminal_printer.TerminalPrinter.convert_message(MESSAGE)
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {'messages_per_second': NUM_MESSAGES / elapsed_time}
+
+def benchmark_loading_cycles(NUM_CYCLES=2000) -> dict:
+
+    """
+    Starts and finishes a loading message NUM_CYCLES times, as happens when
+    a loading message is shown around a quick operation, and returns a 
+    dictionary with 'cycles_per_second'. Nothing is printed because each 
+    loading message is finished before time_before_start has passed.
+    """
+
+    import terminal_printer
+
+    printer = terminal_printer.TerminalPrinter()
+
+    start_time = time.perf_counter()
+
+    for i in range(NUM_CYCLES):
+        printer.loading_thread_start()
+        printer.loading_thread_finish()
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {'cycles_per_second': NUM_CYCLES / elapsed_time}
+
+def benchmark_indicator_cpu(NUM_INDICATORS=200, SECONDS=1.0, 
+    TIME_BETWEEN_DOTS=0.5) -> dict:
+
+    """
+    Keeps NUM_INDICATORS loading trackers active for SECONDS, each printing
+    to its own in memory stream, and returns a dictionary with 
+    'cpu_seconds', the processing time used by this process, and 
+    'cpu_seconds_per_indicator'
+    """
+
+    import io
+    import terminal_printer_loading_thread
+    import terminal_printer_output
+
+    indicator_list = [terminal_printer_loading_thread.LoadingIndicator(
+        output=terminal_printer_output.TerminalOutput(io.StringIO()))
+        for i in range(NUM_INDICATORS)]
+
+    start_cpu_time = time.process_time()
+
+    for indicator in indicator_list:
+        indicator.begin(time_before_start=0, 
+            time_between_dots=TIME_BETWEEN_DOTS)
+
+    time.sleep(SECONDS)
+
+    for indicator in indicator_list:
+        indicator.end()
+
+    cpu_seconds = time.process_time() - start_cpu_time
+
+    return {'cpu_seconds': cpu_seconds, 
+        'cpu_seconds_per_indicator': cpu_seconds / NUM_INDICATORS}
+
+def benchmark_input_validation(NUM_INPUTS=100000, SELECTION_SIZE=10000,
+    NUM_ERROR_MESSAGES=200) -> dict:
+
+    """
+    Checks NUM_INPUTS inputs, half of them invalid, with an InputValidator
+    for an integer from a SELECTION_LIST of SELECTION_SIZE item numbers. 
+    Then creates the error messages for NUM_ERROR_MESSAGES invalid inputs. 
+    Returns a dictionary with 'inputs_per_second' for checking and 
+    'error_messages_per_second'
+    """
+
+    import terminal_printer
+
+    validator = terminal_printer.TerminalPrinter.get_input_validator(
+        INPUT_TYPE='integer', UPPER_LIMIT=SELECTION_SIZE * 2,
+        SELECTION_LIST=[str(i) for i in range(SELECTION_SIZE)])
+
+    inputs = [str(i * 2) for i in range(NUM_INPUTS)]
+
+    start_time = time.perf_counter()
+
+    for input_received in inputs:
+        validator.check(input_received)
+
+    elapsed_time = time.perf_counter() - start_time
+
+    # the first error message also creates the index used to find the 
+    # closest entries so it is not timed
+    invalid_inputs = [str(SELECTION_SIZE + i * 3) for i in 
+        range(NUM_ERROR_MESSAGES + 1)]
+    validator.get_error_message(invalid_inputs[0])
+
+    error_start_time = time.perf_counter()
+
+    for input_received in invalid_inputs[1:]:
+        validator.get_error_message(input_received)
+
+    error_elapsed_time = time.perf_counter() - error_start_time
+
+    return {'inputs_per_second': NUM_INPUTS / elapsed_time,
+        'error_messages_per_second': NUM_ERROR_MESSAGES / error_elapsed_time}
+
+def benchmark_batch_answers(NUM_PROMPTS=20000) -> dict:
+
+    """
+    Answers NUM_PROMPTS integer prompts with get_input() using answers from
+    a list and returns a dictionary with 'prompts_per_second'
+    """
+
+    import terminal_printer
+
+    printer = terminal_printer.TerminalPrinter
+
+    answers = printer.get_batch_answers([str(i % 100) for i in 
+        range(NUM_PROMPTS)])
+
+    start_time = time.perf_counter()
+
+    for i in range(NUM_PROMPTS):
+        printer.get_input('Enter a [b]number[b]: ', INPUT_TYPE='integer',
+            UPPER_LIMIT=100, ANSWERS=answers)
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {'prompts_per_second': NUM_PROMPTS / elapsed_time}
+
+def benchmark_suggestions(NUM_INPUTS=200, SELECTION_SIZE=10000) -> dict:
+
+    """
+    Finds the closest entries of a SELECTION_LIST of SELECTION_SIZE host 
+    names to NUM_INPUTS misspelled host names and returns a dictionary with
+    'index_seconds', the time to create the index, and 
+    'milliseconds_per_input'
+    """
+
+    import terminal_printer_fuzzy
+
+    entry_list = ['server-{}-{}.example.com'.format(
+        ('london', 'paris', 'tokyo', 'sydney')[i % 4], i) 
+        for i in range(SELECTION_SIZE)]
+
+    start_time = time.perf_counter()
+    index = terminal_printer_fuzzy.TrigramIndex(entry_list)
+    index_seconds = time.perf_counter() - start_time
+
+    # swap two characters in entries to make inputs that are not valid
+    input_list = []
+    for i in range(NUM_INPUTS):
+        entry = entry_list[i * 37 % SELECTION_SIZE]
+        input_list.append(entry[:3] + entry[4] + entry[3] + entry[5:])
+
+    start_time = time.perf_counter()
+
+    for input_received in input_list:
+        index.get_closest(input_received)
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {'index_seconds': index_seconds,
+        'milliseconds_per_input': elapsed_time * 1000 / NUM_INPUTS}
+
+def benchmark_frame_renderer(NUM_FRAMES=100, WIDTH=160, HEIGHT=48) -> dict:
+
+    """
+    Draws NUM_FRAMES dashboard frames of WIDTH by HEIGHT with a 
+    FrameRenderer printing to an in memory stream. One counter changes in 
+    each frame. Returns a dictionary with 'characters_per_frame', 
+    'full_frame_characters' (the characters printed for the first frame) 
+    and 'frames_per_second'
+    """
+
+    import io
+    import terminal_printer_frame
+    import terminal_printer_output
+    import terminal_printer_screen
+
+    stream = io.StringIO()
+    screen = terminal_printer_screen.ScreenControl(
+        terminal_printer_output.TerminalOutput(stream))
+    renderer = terminal_printer_frame.FrameRenderer(width=WIDTH, 
+        height=HEIGHT, screen=screen)
+
+    # rows of the dashboard that do not change
+    row_text = '[n]'.join('[b]Worker {:02}[b] [c-green]running[c-none] '
+        'queue length 12 last error none'.format(i) for i in range(HEIGHT - 1))
+
+    full_frame_characters = renderer.render('Processed: 0[n]' + row_text)
+
+    start_time = time.perf_counter()
+
+    for i in range(1, NUM_FRAMES + 1):
+        renderer.render('Processed: ' + str(i) + '[n]' + row_text)
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {'characters_per_frame': (len(stream.getvalue()) 
+        - full_frame_characters) / NUM_FRAMES,
+        'full_frame_characters': full_frame_characters,
+        'frames_per_second': NUM_FRAMES / elapsed_time}
+
+def benchmark_print_status(NUM_MESSAGES=200000) -> dict:
+
+    """
+    Calls TerminalPrinter.print_status() NUM_MESSAGES times with the output 
+    going to an in memory stream and returns a dictionary with 
+    'calls_per_second' and 'num_printed', the number of messages printed
+    """
+
+    import io
+    import terminal_printer
+    import terminal_printer_throttle
+
+    printer = terminal_printer.TerminalPrinter
+    throttle = terminal_printer_throttle.StatusThrottle(MAX_RATE=10)
+
+    stream = io.StringIO()
+    old_stream = printer.output.get_stream()
+    printer.output.set_stream(stream)
+
+    start_time = time.perf_counter()
+
+    for i in range(NUM_MESSAGES):
+        throttle.set_status('[b]Processed[b] ' + str(i) + ' items')
+
+    throttle.flush()
+
+    elapsed_time = time.perf_counter() - start_time
+
+    printer.output.set_stream(old_stream)
+
+    return {'calls_per_second': NUM_MESSAGES / elapsed_time,
+        'num_printed': stream.getvalue().count('\n')}
+
+def benchmark_table(NUM_ROWS=100000) -> dict:
+
+    """
+    Prints a table of NUM_ROWS rows from a generator to an in memory stream
+    that discards the text and returns a dictionary with 'rows_per_second' 
+    and 'peak_memory_kb', the largest amount of memory allocated while 
+    printing
+    """
+
+    import terminal_printer
+    import tracemalloc
+
+    class DiscardStream:
+
+        def write(self, text):
+            return len(text)
+
+        def flush(self):
+            pass
+
+    printer = terminal_printer.TerminalPrinter
+
+    def row_generator():
+        for i in range(NUM_ROWS):
+            yield [str(i), '[b]worker-' + str(i % 16) + '[b]', 'ok', 
+                str(i * 7 % 1000) + ' ms']
+
+    old_stream = printer.output.get_stream()
+    printer.output.set_stream(DiscardStream())
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+
+    printer.print_table(row_generator(), ['Id', 'Worker', 'Status', 'Time'])
+
+    elapsed_time = time.perf_counter() - start_time
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    printer.output.set_stream(old_stream)
+
+    return {'rows_per_second': NUM_ROWS / elapsed_time,
+        'peak_memory_kb': peak_memory / 1024}
+
+def benchmark_pager(NUM_LINES=1000000, HEIGHT=50) -> dict:
+
+    """
+    Writes a temporary file of NUM_LINES formatted lines and returns a 
+    dictionary with 'file_mb', 'index_seconds' to index the whole file, 
+    'window_milliseconds' to show a screen of HEIGHT rows in the middle of 
+    the file, 'search_milliseconds' to find text near the end of the file 
+    and 'peak_memory_kb', the largest amount of memory allocated
+    """
+
+    import tempfile
+    import terminal_printer_pager
+    import tracemalloc
+
+    file_descriptor, file_path = tempfile.mkstemp(suffix='.txt')
+
+    try:
+
+        with os.fdopen(file_descriptor, 'w') as file:
+
+            for i in range(NUM_LINES):
+                file.write('{} [b]worker-{}[b] finished job [c-green]ok'
+                    '[c-none] in {} ms\n'.format(i, i % 16, i * 7 % 1000))
+
+            file.write('needle\n')
+
+        file_size = os.path.getsize(file_path)
+
+        tracemalloc.start()
+
+        with terminal_printer_pager.Pager(file_path, PARAGRAPH_WIDTH=80,
+            height=HEIGHT) as pager:
+
+            start_time = time.perf_counter()
+            pager.go_to_end()
+            index_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            pager.jump_to_offset(file_size // 2)
+            pager.get_window_lines()
+            window_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            pager.search('needle')
+            search_time = time.perf_counter() - start_time
+
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    finally:
+
+        os.remove(file_path)
+
+    return {'file_mb': file_size / 1000000, 'index_seconds': index_time,
+        'window_milliseconds': window_time * 1000,
+        'search_milliseconds': search_time * 1000,
+        'peak_memory_kb': peak_memory / 1024}
+
+def benchmark_print_formatted_file(NUM_LINES=20000) -> dict:
+
+    """
+    Writes a temporary file of NUM_LINES lines of formatted text, prints it
+    with print_formatted_file() to a sink that discards the lines and returns
+    a dictionary with 'file_mb', 'mb_per_second' and 'peak_memory_kb', the 
+    largest amount of memory allocated while printing
+    """
+
+    import tempfile
+    import terminal_printer
+    import tracemalloc
+
+    class DiscardSink:
+
+        def writelines(self, line_list):
+            pass
+
+    file_descriptor, file_path = tempfile.mkstemp(suffix='.txt')
+
+    try:
+
+        with os.fdopen(file_descriptor, 'w') as file:
+
+            for i in range(NUM_LINES):
+                file.write('Job {} on [b]worker-{}[b] finished with status '
+                    '[c-green]ok[c-none] after {} ms.[n]\n'.format(i, i % 16, 
+                    i * 7 % 1000))
+
+        tracemalloc.start()
+
+        result = terminal_printer.TerminalPrinter.print_formatted_file(
+            file_path, sink=DiscardSink())
+
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # time again without tracemalloc, which slows the conversion
+        result = terminal_printer.TerminalPrinter.print_formatted_file(
+            file_path, sink=DiscardSink())
+
+    finally:
+
+        os.remove(file_path)
+
+    return {'file_mb': result['num_bytes'] / 1000000, 
+        'mb_per_second': result['mb_per_second'],
+        'peak_memory_kb': peak_memory / 1024}
+
+def benchmark_command_line(NUM_RUNS=10, NUM_LINES=50000) -> dict:
+
+    """
+    Runs 'python -m terminal_printer' NUM_RUNS times with no input and once 
+    with NUM_LINES lines of formatted text through a pipe. Returns a 
+    dictionary with 'startup_milliseconds', the fastest time to start and 
+    finish with no input, and 'mb_per_second' for the formatted text
+    """
+
+    import sys
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    command = [sys.executable, '-m', 'terminal_printer']
+
+    startup_time_list = []
+
+    for i in range(NUM_RUNS):
+
+        start_time = time.perf_counter()
+        subprocess.run(command, stdin=subprocess.DEVNULL, 
+            stdout=subprocess.DEVNULL, cwd=directory)
+        startup_time_list.append(time.perf_counter() - start_time)
+
+    data = ''.join('{} [b]worker-{}[b] finished [c-green]ok[c-none] in {} '
+        'ms\n'.format(i, i % 16, i * 7 % 1000) 
+        for i in range(NUM_LINES)).encode()
+
+    start_time = time.perf_counter()
+    subprocess.run(command, input=data, stdout=subprocess.DEVNULL, 
+        cwd=directory)
+    elapsed_time = time.perf_counter() - start_time
+
+    return {'startup_milliseconds': min(startup_time_list) * 1000,
+        'mb_per_second': len(data) / 1000000 / elapsed_time}
+
+def benchmark_incremental_writer(NUM_WORDS=5000) -> dict:
+
+    """
+    Adds NUM_WORDS formatted words one at a time to an IncrementalWriter 
+    printing to an in memory stream that reports itself as a terminal. 
+    Returns a dictionary with 'words_per_second', 'characters_per_word' and 
+    'full_text_words_per_second' and 'full_text_characters_per_word' for 
+    converting and printing all of the text again for each word
+    """
+
+    import io
+    import terminal_printer
+    import terminal_printer_incremental
+    import terminal_printer_output
+
+    class TerminalStream(io.StringIO):
+
+        def isatty(self) -> bool:
+
+            return True
+
+    word_list = ['[b]word{}[b]'.format(i) if i % 7 == 0 else
+        '[c-blue]value[c-none]' if i % 11 == 0 else 'text' + str(i % 13)
+        for i in range(NUM_WORDS)]
+
+    stream = TerminalStream()
+    writer = terminal_printer_incremental.IncrementalWriter(
+        output=terminal_printer_output.TerminalOutput(stream))
+
+    start_time = time.perf_counter()
+
+    for word in word_list:
+        writer.append(word + ' ')
+
+    writer.finish()
+
+    elapsed_time = time.perf_counter() - start_time
+
+    # converting all of the text again for each word grows with the length of
+    # the text so fewer words are used
+    num_full_text_words = min(NUM_WORDS, 1000)
+    num_full_text_characters = 0
+
+    full_text_start_time = time.perf_counter()
+
+    for i in range(1, num_full_text_words + 1):
+        num_full_text_characters += len('\n'.join(
+            terminal_printer.TerminalPrinter.convert_message(
+            ' '.join(word_list[:i]))))
+
+    full_text_elapsed_time = time.perf_counter() - full_text_start_time
+
+    return {'words_per_second': NUM_WORDS / elapsed_time,
+        'characters_per_word': len(stream.getvalue()) / NUM_WORDS,
+        'full_text_words_per_second': 
+        num_full_text_words / full_text_elapsed_time,
+        'full_text_characters_per_word': 
+        num_full_text_characters / num_full_text_words}
+
+if __name__ == '__main__':
+
+    result = benchmark_import_time()
+    print("Import time: median {} us, fastest {} us. Modules imported: {}".format(
+        result['median_microseconds'], result['min_microseconds'],
+        ', '.join(result['modules_imported']) or 'none'))
+
+    result = benchmark_convert_message()
+    print("convert_message: {:.0f} messages per second".format(
+        result['messages_per_second']))
+
+    result = benchmark_loading_cycles()
+    print("Loading message: {:.0f} start and finish cycles per second".format(
+        result['cycles_per_second']))
+
+    result = benchmark_indicator_cpu()
+    print("Loading trackers: {:.4f} s of processing for 200 trackers active"
+        " for 1 s".format(result['cpu_seconds']))
+
+    result = benchmark_input_validation()
+    print("Input validation: {:.0f} inputs per second with 10000 selections,"
+        " {:.0f} error messages with suggestions per second".format(
+        result['inputs_per_second'], result['error_messages_per_second']))
+
+    result = benchmark_batch_answers()
+    print("Batch answers: {:.0f} get_input() prompts per second".format(
+        result['prompts_per_second']))
+
+    result = benchmark_suggestions()
+    print("Suggestions: {:.3f} s to index 10000 entries, {:.2f} ms per input"
+        .format(result['index_seconds'], result['milliseconds_per_input']))
+
+    result = benchmark_frame_renderer()
+    print("Frame renderer: {:.0f} characters per frame rather than {}, {:.0f}"
+        " frames per second".format(result['characters_per_frame'], 
+        result['full_frame_characters'], result['frames_per_second']))
+
+    result = benchmark_table()
+    print("Table: {:.0f} rows per second, peak memory {:.0f} KB".format(
+        result['rows_per_second'], result['peak_memory_kb']))
+
+    result = benchmark_pager()
+    print("Pager: {:.3f} s to index {:.0f} MB, {:.2f} ms to show a screen, "
+        "{:.2f} ms to search, peak memory {:.0f} KB".format(
+        result['index_seconds'], result['file_mb'], 
+        result['window_milliseconds'], result['search_milliseconds'],
+        result['peak_memory_kb']))
+
+    result = benchmark_print_formatted_file()
+    print("print_formatted_file: {:.2f} MB per second for {:.1f} MB, peak "
+        "memory {:.0f} KB".format(result['mb_per_second'], 
+        result['file_mb'], result['peak_memory_kb']))
+
+    result = benchmark_command_line()
+    print("Command line: {:.1f} ms to start, {:.2f} MB per second".format(
+        result['startup_milliseconds'], result['mb_per_second']))
+
+    result = benchmark_print_status()
+    print("print_status: {:.0f} calls per second, {} of 200000 messages "
+        "printed".format(result['calls_per_second'], result['num_printed']))
+
+    result = benchmark_incremental_writer()
+    print("Incremental writer: {:.0f} words per second, {:.1f} characters "
+        "per word, rather than {:.0f} words per second and {:.0f} characters"
+        " per word converting all of the text again".format(
+        result['words_per_second'], result['characters_per_word'],
+        result['full_text_words_per_second'],
+        result['full_text_characters_per_word']))
@@ -0,0 +1,397 @@
+"""
+Author: Luke Morris
+
+This module is the command line program of TerminalPrinter. It prints text
+with the formatting commands of print_formatted() from files or from
+standard input, so that it can be used in a pipeline such as:
+
+    tail -f app.log | python -m terminal_printer --width 100 | less -R
+
+The options are:
+
+    - --width, --indent and --following-indent which are the PARAGRAPH_WIDTH,
+        TEXT_INDENT and FOLLOWING_LINE_INDENT of print_formatted(). The width
+        is the width of the terminal by default, or 80.
+    - --color which chooses the colors printed: 'truecolor' for RGB colors,
+        '256' for the 256 color palette, 'basic' for the 16 basic colors or
+        'none' to print without any formatting. By default colors are not
+        printed if the NO_COLOR environment variable is set.
+    - --reflow which prints each file as one message, with the lines of the
+        file joined and wrapped together. By default each line of the input
+        is printed as a separate message as soon as it is read.
+
+Input is read with os.read() so that lines are printed as soon as they
+arrive from a pipe, and the lines converted from each read are written to
+standard output with a single write.
+
+The functionality includes:
+
+    - main() which runs the program with a list of arguments and returns
+        the exit status.
+    - ColorConverter which changes the color escape sequences of converted
+        text to a color depth.
+    - remove_repeated_clear_formatting() which removes the repeated escape
+        sequences that clear the formatting at the end of a converted line.
+
+Last modified: 19 October 2026
+"""
+
+import codecs
+import os
+import re
+import sys
+import terminal_printer
+import terminal_printer_stream
+
+# maximum number of bytes read from the input at a time
+READ_SIZE = 65536
+
+# choices for --color
+COLOR_DEPTHS = ('truecolor', '256', 'basic', 'none')
+
+# escape sequence that changes the formatting of text
+FORMATTING_PATTERN = re.compile('\x1b\\[([0-9;]*)m')
+
+# escape sequence that clears all formatting
+CLEAR_FORMATTING = '\x1b[0m'
+
+# RGB values of the 16 basic colors as shown by most terminals, with the code
+# of each color
+BASIC_COLOR_RGB = {
+    '30': (0, 0, 0),
+    '31': (205, 0, 0),
+    '32': (0, 205, 0),
+    '33': (205, 205, 0),
+    '34': (0, 0, 238),
+    '35': (205, 0, 205),
+    '36': (0, 205, 205),
+    '37': (229, 229, 229),
+    '90': (127, 127, 127),
+    '91': (255, 0, 0),
+    '92': (0, 255, 0),
+    '93': (255, 255, 0),
+    '94': (92, 92, 255),
+    '95': (255, 0, 255),
+    '96': (0, 255, 255),
+    '97': (255, 255, 255)
+}
+
+class ColorConverter:
+
+    # maximum number of escape sequences remembered
+    CACHE_MAX_SIZE = 4096
+
+    def __init__(self, COLOR_DEPTH: str = 'truecolor') -> None:
+
+        """
+        COLOR_DEPTH is one of COLOR_DEPTHS
+        """
+
+        if COLOR_DEPTH not in COLOR_DEPTHS:
+            raise ValueError('COLOR_DEPTH must be one of '
+                + ', '.join(COLOR_DEPTHS) + '.')
+
+        self.__color_depth = COLOR_DEPTH
+        self.__sequence_dict = {} # codes: escape sequence for COLOR_DEPTH
+
+    def convert(self, text: str) -> str:
+
+        """
+        Returns text with each RGB color changed to the nearest color of the
+        color depth, or with all formatting removed for 'none'
+        """
+
+        # most text can be returned as it is
+        if self.__color_depth == 'truecolor' or '\x1b' not in text:
+            return text
+
+        if self.__color_depth == 'none':
+            return FORMATTING_PATTERN.sub('', text)
+
+        return FORMATTING_PATTERN.sub(self.__replace_sequence, text)
+
+    def __replace_sequence(self, match) -> str:
+
+        """
+        Returns the escape sequence to use instead of match
+        """
+
+        codes = match.group(1)
+        sequence = self.__sequence_dict.get(codes)
+
+        if sequence is not None:
+            return sequence
+
+        code_list = codes.split(';')
+
+        # only RGB colors (38;2;r;g;b) are changed
+        if len(code_list) == 5 and code_list[:2] == ['38', '2']:
+
+            red, green, blue = (int(code) for code in code_list[2:])
+
+            if self.__color_depth == '256':
+                sequence = '\x1b[38;5;{}m'.format(
+                    self.get_256_color_number(red, green, blue))
+            else:
+                sequence = '\x1b[{}m'.format(
+                    self.get_basic_color_code(red, green, blue))
+
+        else:
+
+            sequence = match.group()
+
+        # empty the cache when it is full
+        if len(self.__sequence_dict) >= self.CACHE_MAX_SIZE:
+            self.__sequence_dict.clear()
+
+        self.__sequence_dict[codes] = sequence
+
+        return sequence
+
+    @staticmethod
+    def get_256_color_number(red: int, green: int, blue: int) -> int:
+
+        """
+        Returns the number of the nearest color of the 256 color palette,
+        from the 6 x 6 x 6 color cube or the gray ramp
+        """
+
+        # grays use the 24 step gray ramp
+        if red == green == blue:
+
+            if red < 8:
+                return 16
+
+            if red > 248:
+                return 231
+
+            return 232 + round((red - 8) / 247 * 24)
+
+        return (16 + 36 * round(red / 255 * 5) + 6 * round(green / 255 * 5)
+            + round(blue / 255 * 5))
+
+    @staticmethod
+    def get_basic_color_code(red: int, green: int, blue: int) -> str:
+
+        """
+        Returns the code of the nearest of the 16 basic colors
+        """
+
+        return min(BASIC_COLOR_RGB, key=lambda code: sum(
+            (value - basic_value) ** 2 for value, basic_value in
+            zip((red, green, blue), BASIC_COLOR_RGB[code])))
+
+def main(argv=None) -> int:
+
+    """
+    Runs the command line program with the list of arguments argv, by
+    default sys.argv[1:], and returns the exit status
+    """
+
+    import argparse
+    import shutil
+
+    parser = argparse.ArgumentParser(prog='python -m terminal_printer',
+        description='Prints text with the formatting commands of '
+        'TerminalPrinter.print_formatted(), such as [b] and [c-red].')
+    parser.add_argument('files', nargs='*', metavar='FILE',
+        help="files to print. '-' or no files reads standard input")
+    parser.add_argument('-w', '--width', type=int,
+        help='maximum number of characters on a line (default: the width of'
+        ' the terminal, or 80)')
+    parser.add_argument('--indent', type=int, default=0,
+        help='number of spaces before every line')
+    parser.add_argument('--following-indent', type=int, default=0,
+        help='number of additional spaces before lines after the first line'
+        ' of a message')
+    parser.add_argument('--color', choices=COLOR_DEPTHS,
+        help="colors to print (default: 'none' if NO_COLOR is set, otherwise"
+        " 'truecolor')")
+    parser.add_argument('--reflow', action='store_true',
+        help='print each file as one message, joining and wrapping its lines'
+        ' together')
+    parser.add_argument('--encoding', default='utf-8',
+        help='encoding of the input and output (default: utf-8)')
+
+    arguments = parser.parse_args(argv)
+
+    PARAGRAPH_WIDTH = arguments.width
+    if PARAGRAPH_WIDTH is None:
+        PARAGRAPH_WIDTH = shutil.get_terminal_size((80, 24)).columns
+
+    if PARAGRAPH_WIDTH <= arguments.indent + max(arguments.following_indent,
+        0):
+        parser.error('--indent plus --following-indent must be less than '
+            '--width')
+
+    color_depth = arguments.color
+    if color_depth is None:
+        color_depth = 'none' if os.environ.get('NO_COLOR') else 'truecolor'
+
+    color_converter = ColorConverter(color_depth)
+    output_file = sys.stdout.buffer
+
+    def write_lines(line_list: list) -> None:
+
+        # write the lines converted from one read with a single write
+        if line_list:
+
+            output_file.write(color_converter.convert(''.join(line_list))
+                .encode(arguments.encoding, errors='replace'))
+            output_file.flush()
+
+    exit_status = 0
+
+    try:
+
+        for file_name in arguments.files or ['-']:
+
+            try:
+
+                if file_name == '-':
+                    file_descriptor = sys.stdin.fileno()
+                else:
+                    file_descriptor = os.open(file_name, os.O_RDONLY)
+
+            except OSError as error:
+
+                sys.stderr.write('{}: {}: {}\n'.format(parser.prog, file_name,
+                    error.strerror))
+                exit_status = 1
+                continue
+
+            try:
+
+                if arguments.reflow:
+                    print_reflowed(file_descriptor, write_lines,
+                        PARAGRAPH_WIDTH, arguments.indent,
+                        arguments.following_indent, arguments.encoding)
+                else:
+                    print_lines(file_descriptor, write_lines,
+                        PARAGRAPH_WIDTH, arguments.indent,
+                        arguments.following_indent, arguments.encoding)
+
+            finally:
+
+                if file_name != '-':
+                    os.close(file_descriptor)
+
+    except KeyboardInterrupt:
+
+        return 130
+
+    except BrokenPipeError:
+
+        # the program reading the output has finished, such as head. Standard
+        # output is replaced so that Python does not report the error when
+        # it exits
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+    return exit_status
+
+def print_lines(file_descriptor: int, write_lines, PARAGRAPH_WIDTH=80,
+    TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0, ENCODING='utf-8') -> bool:
+
+    """
+    Reads file_descriptor until it finishes and converts each line as a
+    separate message. The lines converted from each read are passed to
+    write_lines as a list. A line is converted once it is finished by a new
+    line, or when the input finishes
+    """
+
+    decoder = codecs.getincrementaldecoder(ENCODING)(errors='replace')
+    convert_message = terminal_printer.TerminalPrinter.convert_message
+    unfinished_line = ''
+
+    while True:
+
+        data = os.read(file_descriptor, READ_SIZE)
+        line_list = (unfinished_line + decoder.decode(data, not data)).split(
+            '\n')
+
+        # the last line is not finished until a new line is read
+        unfinished_line = line_list.pop() if data else ''
+
+        if not data and line_list[-1] == '':
+            line_list.pop()
+
+        printable_line_list = []
+
+        for line in line_list:
+
+            line = line.rstrip('\r')
+
+            # blank lines are printed as empty lines. convert_message() 
+            # returns no lines for spaces and a line that only clears the
+            # formatting for an empty message
+            if not line or line.isspace():
+
+                printable_line_list.append('')
+                continue
+
+            converted_line_list = convert_message(line,
+                PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, TEXT_INDENT=TEXT_INDENT,
+                FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT) or ['']
+            converted_line_list[-1] = remove_repeated_clear_formatting(
+                converted_line_list[-1])
+
+            printable_line_list.extend(converted_line_list)
+
+        write_lines([line + '\n' for line in printable_line_list])
+
+        if not data:
+            return True
+
+def print_reflowed(file_descriptor: int, write_lines, PARAGRAPH_WIDTH=80,
+    TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0, ENCODING='utf-8') -> bool:
+
+    """
+    Reads file_descriptor until it finishes and converts all of its text as
+    one message. The lines finished by each read are passed to write_lines
+    as a list
+    """
+
+    decoder = codecs.getincrementaldecoder(ENCODING)(errors='replace')
+    converter = terminal_printer.MessageConverter.acquire()
+
+    try:
+
+        converter.start_lines(PARAGRAPH_WIDTH=PARAGRAPH_WIDTH,
+            TEXT_INDENT=TEXT_INDENT,
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+        while True:
+
+            data = os.read(file_descriptor, READ_SIZE)
+
+            terminal_printer_stream.feed_converter(converter,
+                decoder.decode(data, not data), write_lines)
+
+            if not data:
+                break
+
+        line_list = converter.finish()
+
+        if line_list:
+            line_list[-1] = remove_repeated_clear_formatting(line_list[-1])
+
+        write_lines([line + '\n' for line in line_list])
+
+    finally:
+
+        terminal_printer.MessageConverter.release(converter)
+
+    return True
+
+def remove_repeated_clear_formatting(line: str) -> str:
+
+    """
+    Returns line with the formatting cleared only once at its end. The
+    converter clears the formatting at the end of a message, after any
+    formatting command at its end such as [c-none] has cleared it already
+    """
+
+    while line.endswith(CLEAR_FORMATTING * 2):
+        line = line[:-len(CLEAR_FORMATTING)]
+
+    return line
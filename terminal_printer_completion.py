@@ -0,0 +1,177 @@
+"""
+Author: Luke Morris
+
+This class stores the entries of a SELECTION_LIST in a prefix trie so that
+the entries starting with the text typed so far can be found quickly. It is
+used by TerminalPrinter.get_input() for tab completion and to show a short
+list of suggestions, rather than every entry, when an input is not in a long
+SELECTION_LIST.
+
+Finding the entries that start with some text takes a time that depends on
+the length of the text rather than the number of entries.
+
+The functionality includes:
+
+    - complete() which returns the characters that every entry starting with
+        some text has next, so that pressing tab can add them.
+    - get_matches() which returns up to a maximum number of entries that
+        start with some text and the total number of entries that do.
+    - get_longest_prefix() which returns the longest start of some text that
+        at least one entry starts with.
+
+The trie is created once for each InputValidator, the first time it is
+needed.
+
+Last modified: 19 October 2026
+"""
+
+class PrefixTrie:
+
+    # positions of values in each node of the trie. Nodes are lists rather
+    # than objects to keep large tries small
+    CHILDREN = 0 # dictionary of character to the next node
+    IS_ENTRY = 1 # whether the text leading to this node is an entry
+    NUM_ENTRIES = 2 # number of entries that pass through this node
+
+    def __init__(self, entry_list=()) -> None:
+
+        self.__root = [{}, False, 0]
+
+        for entry in entry_list:
+            self.add(entry)
+
+    def add(self, entry: str) -> bool:
+
+        """
+        Adds entry to the trie. Returns False if entry was already in the trie
+        """
+
+        # find or create the node for each character
+        node_list = [self.__root]
+        node = self.__root
+
+        for character in entry:
+
+            children = node[self.CHILDREN]
+            next_node = children.get(character)
+
+            if next_node is None:
+
+                next_node = [{}, False, 0]
+                children[character] = next_node
+
+            node = next_node
+            node_list.append(node)
+
+        if node[self.IS_ENTRY]:
+            return False
+
+        node[self.IS_ENTRY] = True
+
+        # count the entry in every node it passes through
+        for node in node_list:
+            node[self.NUM_ENTRIES] += 1
+
+        return True
+
+    def get_num_entries(self, prefix: str = '') -> int:
+
+        """
+        Returns the number of entries that start with prefix
+        """
+
+        node = self.__find(prefix)
+
+        if node is None:
+            return 0
+
+        return node[self.NUM_ENTRIES]
+
+    def complete(self, prefix: str) -> str:
+
+        """
+        Returns the characters that follow prefix in every entry that starts
+        with prefix. Returns an empty string if there is no such entry or
+        the entries start to differ straight after prefix
+        """
+
+        node = self.__find(prefix)
+
+        if node is None:
+            return ''
+
+        extension_list = []
+
+        # follow the trie while there is only one way to continue
+        while not node[self.IS_ENTRY] and len(node[self.CHILDREN]) == 1:
+
+            for character, node in node[self.CHILDREN].items():
+                extension_list.append(character)
+
+        return ''.join(extension_list)
+
+    def get_matches(self, prefix: str, MAX_MATCHES: int = 10) -> tuple:
+
+        """
+        Returns a tuple (list, int) of up to MAX_MATCHES entries that start
+        with prefix, in the order they were added where possible, and the
+        total number of entries that start with prefix
+        """
+
+        prefix_node = self.__find(prefix)
+
+        if prefix_node is None:
+            return [], 0
+
+        match_list = []
+
+        # search depth first, only as far as needed to find MAX_MATCHES
+        stack = [(prefix, prefix_node)]
+
+        while stack and len(match_list) < MAX_MATCHES:
+
+            text, node = stack.pop()
+
+            if node[self.IS_ENTRY]:
+                match_list.append(text)
+
+            # add children in reverse so the first child is searched first
+            for character, child in reversed(node[self.CHILDREN].items()):
+                stack.append((text + character, child))
+
+        return match_list, prefix_node[self.NUM_ENTRIES]
+
+    def get_longest_prefix(self, text: str) -> str:
+
+        """
+        Returns the longest start of text that at least one entry starts
+        with
+        """
+
+        node = self.__root
+
+        for i, character in enumerate(text):
+
+            node = node[self.CHILDREN].get(character)
+
+            if node is None:
+                return text[:i]
+
+        return text
+
+    def __find(self, prefix: str):
+
+        """
+        Returns the node for prefix, or None if no entry starts with prefix
+        """
+
+        node = self.__root
+
+        for character in prefix:
+
+            node = node[self.CHILDREN].get(character)
+
+            if node is None:
+                return None
+
+        return node
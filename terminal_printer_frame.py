@@ -0,0 +1,269 @@
+"""
+Author: Luke Morris
+
+This class draws frames of formatted text on the terminal screen, such as a
+dashboard that is updated every second, without clearing and reprinting the
+whole screen. The previous frame is kept as rows of (character, style) cells
+and only the cells that changed are printed for a new frame, after moving the
+cursor to them. The number of characters printed for a frame depends on how
+much of the frame changed rather than on the size of the screen.
+
+Frames are written with the same formatting commands as print_formatted()
+and are converted by TerminalPrinter.convert_message().
+
+The functionality includes:
+
+    - begin() which switches to the alternate screen, hides the cursor and
+        clears the screen. end() shows the cursor and switches back.
+    - render() which draws a frame and returns the number of characters
+        printed for it.
+    - invalidate() which makes the next frame be drawn in full, for example
+        after other text has been printed on the screen.
+
+Each frame is printed with a single write through a ScreenControl (see
+terminal_printer_screen).
+
+Last modified: 19 October 2026
+"""
+
+import re
+import terminal_printer
+
+# escape sequence that changes the formatting of text
+FORMATTING_PATTERN = re.compile('\x1b\\[[0-9;]*m')
+
+# formatting that clears all formatting
+CLEAR_FORMATTING = '\x1b[0m'
+
+# cell for a position without text
+EMPTY_CELL = (' ', '')
+
+class FrameRenderer:
+
+    # changed cells separated by fewer than this number of unchanged cells
+    # are printed together with the unchanged cells between them, as that is
+    # shorter than moving the cursor
+    MIN_GAP_TO_MOVE = 6
+
+    def __init__(self, width: int = None, height: int = None,
+        screen=None, TOP_ROW: int = 1) -> None:
+
+        """
+        width and height are the size of the frame in columns and rows. None
+        means the size of the terminal. screen is the ScreenControl used to
+        print, by default TerminalPrinter.screen. TOP_ROW is the row of the
+        screen that the first row of the frame is drawn on.
+        """
+
+        if screen is None:
+            screen = terminal_printer.TerminalPrinter.screen
+
+        terminal_width, terminal_height = screen.get_size()
+
+        self.__width = terminal_width if width is None else width
+        self.__height = terminal_height if height is None else height
+        self.__screen = screen
+        self.__top_row = TOP_ROW
+        self.__row_list = None # cells of the frame on the screen. None means
+        # that the next frame is drawn in full
+
+    def get_size(self) -> tuple:
+
+        """
+        Returns the size of the frame as a tuple (width, height)
+        """
+
+        return self.__width, self.__height
+
+    def begin(self) -> bool:
+
+        """
+        Switches to the alternate screen, hides the cursor and clears the
+        screen
+        """
+
+        with self.__screen.batch():
+
+            self.__screen.enter_alternate_screen()
+            self.__screen.hide_cursor()
+            self.__screen.clear_screen()
+
+        self.__row_list = [[EMPTY_CELL] * self.__width
+            for i in range(self.__height)]
+
+        return True
+
+    def end(self) -> bool:
+
+        """
+        Shows the cursor and switches back from the alternate screen
+        """
+
+        with self.__screen.batch():
+
+            self.__screen.write(CLEAR_FORMATTING)
+            self.__screen.show_cursor()
+            self.__screen.leave_alternate_screen()
+
+        self.__row_list = None
+
+        return True
+
+    def invalidate(self) -> bool:
+
+        """
+        Makes the next frame be drawn in full
+        """
+
+        self.__row_list = None
+
+        return True
+
+    def render(self, frame_text: str) -> int:
+
+        """
+        Draws frame_text, which can include the formatting commands of
+        print_formatted(), and returns the number of characters printed.
+        Text beyond the width or height of the frame is not drawn.
+        """
+
+        new_row_list = self.get_cells(frame_text)
+        old_row_list = self.__row_list
+
+        text_list = []
+
+        if old_row_list is None:
+
+            # draw every row
+            old_row_list = [None] * self.__height
+
+        for row, new_row in enumerate(new_row_list):
+
+            old_row = old_row_list[row]
+
+            # most rows are the same as in the previous frame
+            if new_row == old_row:
+                continue
+
+            self.__add_changes(text_list, row, old_row, new_row)
+
+        self.__row_list = new_row_list
+
+        if not text_list:
+            return 0
+
+        text_list.append(CLEAR_FORMATTING)
+        text = ''.join(text_list)
+
+        self.__screen.write(text)
+
+        return len(text)
+
+    def get_cells(self, frame_text: str) -> list:
+
+        """
+        Converts frame_text and returns a list with a row for each row of the
+        frame. Each row is a list of (character, style) cells, where style is
+        the escape sequences for the formatting of the character
+        """
+
+        # converted lines can contain new lines so they are split again
+        line_list = '\n'.join(terminal_printer.TerminalPrinter.convert_message(
+            frame_text, PARAGRAPH_WIDTH=self.__width)).split('\n')
+
+        row_list = []
+
+        # formatting continues from one line to the next until it is cleared
+        style = ''
+
+        for line in line_list[:self.__height]:
+
+            row = []
+            position = 0
+
+            # split line into characters and formatting
+            for match in FORMATTING_PATTERN.finditer(line):
+
+                for character in line[position:match.start()]:
+                    row.append((character, style))
+
+                if match.group() == CLEAR_FORMATTING:
+                    style = ''
+                else:
+                    style += match.group()
+
+                position = match.end()
+
+            for character in line[position:]:
+                row.append((character, style))
+
+            # fill the rest of the row with empty cells
+            if len(row) < self.__width:
+                row.extend([EMPTY_CELL] * (self.__width - len(row)))
+            else:
+                del row[self.__width:]
+
+            row_list.append(row)
+
+        # fill the rest of the frame with empty rows
+        while len(row_list) < self.__height:
+            row_list.append([EMPTY_CELL] * self.__width)
+
+        return row_list
+
+    def __add_changes(self, text_list: list, row: int, old_row,
+        new_row: list) -> None:
+
+        """
+        Adds the text to text_list that moves the cursor to each run of
+        changed cells in row and prints them. old_row of None means every
+        cell has changed
+        """
+
+        width = self.__width
+        column = 0
+
+        while column < width:
+
+            # find start of next run of changed cells
+            if old_row is not None:
+
+                while column < width and old_row[column] == new_row[column]:
+                    column += 1
+
+                if column == width:
+                    break
+
+            start_column = column
+            end_column = column + 1 # column after the last changed cell
+            column += 1
+
+            # extend run until MIN_GAP_TO_MOVE unchanged cells are found
+            while column < width:
+
+                if old_row is None or old_row[column] != new_row[column]:
+
+                    column += 1
+                    end_column = column
+
+                elif column - end_column >= self.MIN_GAP_TO_MOVE:
+
+                    break
+
+                else:
+
+                    column += 1
+
+            # move to start of run and print its cells
+            text_list.append('\x1b[{};{}H'.format(self.__top_row + row,
+                start_column + 1))
+            style = None
+
+            for character, cell_style in new_row[start_column:end_column]:
+
+                if cell_style != style:
+
+                    text_list.append(CLEAR_FORMATTING + cell_style)
+                    style = cell_style
+
+                text_list.append(character)
@@ -0,0 +1,155 @@
+"""
+Author: Luke Morris
+
+This class finds the entries of a SELECTION_LIST that are closest to an input
+that is not in the list, so that TerminalPrinter.get_input() can ask "did you
+mean ...?" rather than listing every entry.
+
+Each entry is split into trigrams, the groups of three characters in the
+entry with spaces added at the start and end. An index stores the entries
+that contain each trigram. The closest entries to an input are the entries
+that share the most trigrams with it, compared to the number of trigrams in
+both. Trigrams that are in many entries, such as '.co' in a list of host 
+names, are not used to find the entries to check so that only a small number
+of entries sharing less common trigrams with the input are checked.
+
+The functionality includes:
+
+    - get_closest() which returns up to a chosen number of the closest
+        entries to a string, with the closest first.
+    - get_index() which returns the TrigramIndex for a set of entries. The
+        indexes for the most recently used sets of entries are kept so that
+        prompts that use the same SELECTION_LIST share one index.
+
+Last modified: 19 October 2026
+"""
+
+import heapq
+
+# indexes for the most recently used sets of entries, oldest first
+index_cache = {}
+INDEX_CACHE_MAX_SIZE = 8
+
+class TrigramIndex:
+
+    # entries with fewer than this fraction of their trigrams in common with
+    # the string are not suggested
+    MIN_SIMILARITY = 0.2
+
+    # trigrams in more than this fraction of the entries are not used to find
+    # the entries to check, and at most MAX_CANDIDATES entries are checked
+    COMMON_FRACTION = 0.05
+    MAX_CANDIDATES = 64
+
+    def __init__(self, entry_list=()) -> None:
+
+        # entries sorted so that suggestions do not depend on the order of the
+        # SELECTION_LIST
+        self.__entry_list = sorted(set(entry_list))
+        self.__num_trigrams_list = [] # number of trigrams in each entry
+        self.__postings = {} # trigram: list of positions of entries with it
+
+        for position, entry in enumerate(self.__entry_list):
+
+            trigram_set = self.get_trigrams(entry)
+            self.__num_trigrams_list.append(len(trigram_set))
+
+            for trigram in trigram_set:
+
+                posting_list = self.__postings.get(trigram)
+
+                if posting_list is None:
+                    self.__postings[trigram] = [position]
+                else:
+                    posting_list.append(position)
+
+    @staticmethod
+    def get_trigrams(text: str) -> set:
+
+        """
+        Returns the set of trigrams in text. Case is ignored
+        """
+
+        padded_text = '  ' + text.lower() + ' '
+
+        return {padded_text[i:i + 3] for i in range(len(padded_text) - 2)}
+
+    def get_closest(self, text: str, NUM_MATCHES: int = 3) -> list:
+
+        """
+        Returns a list of up to NUM_MATCHES entries that are closest to text,
+        with the closest first
+        """
+
+        import collections
+
+        trigram_set = self.get_trigrams(text)
+
+        # find posting lists of the trigrams of text
+        posting_list_list = [self.__postings[trigram] for trigram in 
+            trigram_set if trigram in self.__postings]
+
+        # only use the less common trigrams to find entries, unless every 
+        # trigram is common
+        max_common_length = max(len(self.__entry_list) * self.COMMON_FRACTION,
+            1)
+        rare_list = [posting_list for posting_list in posting_list_list 
+            if len(posting_list) <= max_common_length]
+        if rare_list:
+            posting_list_list = rare_list
+
+        # count the trigrams each entry shares with text
+        shared_counter = collections.Counter()
+
+        for posting_list in posting_list_list:
+            shared_counter.update(posting_list)
+
+        # similarity is the number of shared trigrams divided by the number of
+        # trigrams in either text or the entry. Only the entries sharing the
+        # most trigrams found are checked
+        num_trigrams = len(trigram_set)
+        num_trigrams_list = self.__num_trigrams_list
+        entry_list = self.__entry_list
+        scored_list = []
+
+        for position, count in shared_counter.most_common(
+            self.MAX_CANDIDATES):
+
+            entry = entry_list[position]
+            num_shared = len(trigram_set & self.get_trigrams(entry))
+
+            similarity = num_shared / (num_trigrams
+                + num_trigrams_list[position] - num_shared)
+
+            if similarity >= self.MIN_SIMILARITY:
+                scored_list.append((similarity, entry))
+
+        # the closest entries, with entries that are equally close in
+        # alphabetical order
+        closest_list = heapq.nsmallest(NUM_MATCHES, scored_list,
+            key=lambda scored: (-scored[0], scored[1]))
+
+        return [entry for similarity, entry in closest_list]
+
+def get_index(entry_set: frozenset) -> TrigramIndex:
+
+    """
+    Returns the TrigramIndex for entry_set. The index is created the first
+    time and reused while entry_set is one of the INDEX_CACHE_MAX_SIZE sets
+    used most recently
+    """
+
+    index = index_cache.pop(entry_set, None)
+
+    if index is None:
+
+        index = TrigramIndex(entry_set)
+
+        # remove the index used least recently
+        if len(index_cache) >= INDEX_CACHE_MAX_SIZE:
+            index_cache.pop(next(iter(index_cache)), None)
+
+    # add index as the most recently used
+    index_cache[entry_set] = index
+
+    return index
@@ -0,0 +1,254 @@
+"""
+Author: Luke Morris
+
+This class prints text that arrives in small parts, such as text generated a
+word at a time, with the formatting commands of print_formatted(). Each part
+is added with append() and only the new characters are printed, rather than
+converting and printing all of the text again.
+
+The text is converted by a MessageConverter with feed(), which keeps the line
+being filled between the parts. Lines that are finished never change so they
+are only printed once. The unfinished last line is shown as it would be if
+the text ended now, by finishing a copy of the converter. When a part only
+adds characters to the end of the last line then only those characters are
+printed. When a word no longer fits and moves to the next line, the last
+line is printed again with '\\r' and the escape sequence that clears the rest
+of the line. The cost of each part depends on the length of the part and the
+last line, not on the length of all of the text.
+
+The functionality includes:
+
+    - append() which adds a part of the text and prints the changes. It
+        returns the number of characters printed.
+    - finish() which prints the end of the text, clears the formatting and
+        moves to a new line.
+
+An IncrementalWriter can be used with 'with' so that finish() is called when
+the block finishes.
+
+When the output is not a terminal only finished lines are printed, as the
+last line can not be printed again. When it is a terminal PARAGRAPH_WIDTH is
+limited to the width of the terminal so that every line fills one row of the
+screen, as the last line is printed again by counting rows.
+
+finish() must be called, or the IncrementalWriter used with 'with', so that
+its MessageConverter is returned to the pool. An IncrementalWriter that is
+discarded without finishing returns it when it is deleted, without printing
+the end of the text.
+
+Last modified: 19 October 2026
+"""
+
+import re
+import shutil
+import terminal_printer
+
+# escape sequence that changes the formatting of text
+FORMATTING_PATTERN = re.compile('\x1b\\[[0-9;]*m')
+
+# formatting that clears all formatting
+CLEAR_FORMATTING = '\x1b[0m'
+
+class IncrementalWriter:
+
+    # escape sequences to print the last line again
+    RETURN_TO_LINE_START = '\r'
+    CLEAR_TO_END_OF_LINE = '\x1b[K'
+    CLEAR_TO_END_OF_SCREEN = '\x1b[J'
+
+    def __init__(self, PARAGRAPH_WIDTH=80, TEXT_INDENT=0,
+        FOLLOWING_LINE_INDENT=0, output=None) -> None:
+
+        """
+        See TerminalPrinter.print_formatted() for details of PARAGRAPH_WIDTH,
+        TEXT_INDENT and FOLLOWING_LINE_INDENT. output is the TerminalOutput
+        that text is printed through, by default TerminalPrinter.output
+        """
+
+        if output is None:
+            output = terminal_printer.TerminalPrinter.output
+
+        self.__output = output
+        self.__is_terminal = output.is_terminal()
+
+        if self.__is_terminal:
+
+            # a line wider than the terminal would fill more rows than are
+            # counted when it is printed again. One column is left free for
+            # terminals that move to the next row when the last column is
+            # filled
+            PARAGRAPH_WIDTH = min(PARAGRAPH_WIDTH, max(
+                shutil.get_terminal_size((80, 24)).columns - 1,
+                TEXT_INDENT + max(FOLLOWING_LINE_INDENT, 0) + 1))
+
+        self.__converter = terminal_printer.MessageConverter.acquire()
+        self.__converter.start_lines(PARAGRAPH_WIDTH=PARAGRAPH_WIDTH,
+            TEXT_INDENT=TEXT_INDENT,
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+        self.__shown_text = '' # text printed after the last finished line
+        self.__line_style = '' # formatting at the start of __shown_text
+        self.__finished = False
+
+    def __del__(self) -> None:
+
+        # return the converter to the pool if finish() was not called. The end
+        # of the text is not printed as the output may already be closed
+        if not getattr(self, '_IncrementalWriter__finished', True):
+
+            self.__finished = True
+
+            try:
+                terminal_printer.MessageConverter.release(self.__converter)
+            except Exception:
+                # the module may have been removed while the program exits
+                pass
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+
+        self.finish()
+
+        # exceptions are not suppressed
+        return False
+
+    def append(self, fragment: str) -> int:
+
+        """
+        Adds fragment to the end of the text and prints the changes. Returns
+        the number of characters printed
+        """
+
+        if self.__finished:
+            raise ValueError('append() can not be used after finish().')
+
+        finished_line_list = self.__converter.feed(fragment)
+
+        if not self.__is_terminal:
+
+            # only finished lines can be printed
+            return self.__write(''.join(line + '\n'
+                for line in finished_line_list))
+
+        # show the last line as it would be if the text ended now, without
+        # clearing the formatting so that the next characters continue it
+        preview_converter = self.__converter.copy()
+
+        try:
+            preview_line_list = preview_converter.buffer_return_lines(
+                FINISH=True)
+        finally:
+            terminal_printer.MessageConverter.release(preview_converter)
+
+        return self.__show(finished_line_list, '\n'.join(preview_line_list))
+
+    def finish(self) -> int:
+
+        """
+        Prints the end of the text, clears the formatting and moves to a new
+        line. Returns the number of characters printed
+        """
+
+        if self.__finished:
+            return 0
+
+        self.__finished = True
+
+        try:
+            line_list = self.__converter.finish()
+        finally:
+            terminal_printer.MessageConverter.release(self.__converter)
+
+        if not self.__is_terminal:
+            return self.__write(''.join(line + '\n' for line in line_list))
+
+        # each finished line is followed by a new line
+        return self.__show(line_list, '')
+
+    def __show(self, finished_line_list: list, unfinished_text: str) -> int:
+
+        """
+        Prints the changes from the text shown after the last finished line
+        to the lines in finished_line_list followed by unfinished_text, and
+        returns the number of characters printed
+        """
+
+        new_text = (''.join(line + '\n' for line in finished_line_list)
+            + unfinished_text)
+        shown_text = self.__shown_text
+
+        if new_text.startswith(shown_text):
+
+            # only characters were added so print them
+            text = new_text[len(shown_text):]
+
+        else:
+
+            # print again from the start of the first line that changed
+            num_same = 0
+            max_num_same = min(len(shown_text), len(new_text))
+
+            while (num_same < max_num_same
+                and shown_text[num_same] == new_text[num_same]):
+                num_same += 1
+
+            line_start = shown_text.rfind('\n', 0, num_same) + 1
+            num_lines_below = shown_text.count('\n', line_start)
+
+            text_list = []
+
+            if num_lines_below:
+
+                text_list.append('\x1b[{}A'.format(num_lines_below))
+                clear_text = self.CLEAR_TO_END_OF_SCREEN
+
+            else:
+
+                clear_text = self.CLEAR_TO_END_OF_LINE
+
+            # formatting printed at the end of the line is cleared and the
+            # formatting at the start of the line is started again
+            text_list.append(self.RETURN_TO_LINE_START + clear_text
+                + CLEAR_FORMATTING + self.__get_style(self.__line_style,
+                shown_text[:line_start]) + new_text[line_start:])
+
+            text = ''.join(text_list)
+
+        # the finished lines will not change so the shown text starts after
+        # them
+        finished_text = new_text[:len(new_text) - len(unfinished_text)]
+        self.__line_style = self.__get_style(self.__line_style,
+            finished_text)
+        self.__shown_text = unfinished_text
+
+        return self.__write(text)
+
+    def __write(self, text: str) -> int:
+
+        """
+        Prints text, if there is any, and returns its length
+        """
+
+        if text:
+            self.__output.write(text)
+
+        return len(text)
+
+    @staticmethod
+    def __get_style(style: str, text: str) -> str:
+
+        """
+        Returns the formatting after text for text that starts with the
+        formatting style
+        """
+
+        for match in FORMATTING_PATTERN.finditer(text):
+
+            if match.group() == CLEAR_FORMATTING:
+                style = ''
+            else:
+                style += match.group()
+
+        return style
@@ -0,0 +1,535 @@
+"""
+Author: Luke Morris
+
+The classes in this module check inputs received by 
+TerminalPrinter.get_input() and provide answers when a program is run 
+without a User, for example by a script that pipes answers to it. The rules
+for an input (INPUT_TYPE, LOWER_LIMIT, UPPER_LIMIT, IGNORE_ENTER and
+SELECTION_LIST) are prepared once when the InputValidator is created so that
+checking each input is quick, even when the input has to be entered many
+times or SELECTION_LIST has thousands of entries.
+
+The functionality includes:
+
+    - parse() which checks an input and returns whether it is valid, the
+        value of the input (a float, an integer or a string) and the error
+        message to be printed if it is not valid. The input is converted to a
+        number once.
+    - check() which checks an input without creating an error message, and
+        get_error_message() which creates the error message for an input 
+        that is not valid. The closest entries of SELECTION_LIST are only 
+        searched for when the error message is created, as searching takes
+        far longer than checking the input.
+    - the entries of SELECTION_LIST are stored in a frozenset so that
+        checking whether an input is in SELECTION_LIST takes the same time
+        however long SELECTION_LIST is.
+    - error messages that list every entry of SELECTION_LIST are only
+        created the first time they are needed and are then reused. When
+        SELECTION_LIST has more than MAX_SUGGESTIONS entries the error 
+        message lists up to MAX_SUGGESTIONS entries that start with as much 
+        of the input as possible, found with a PrefixTrie (see 
+        terminal_printer_completion), rather than every entry.
+    - get_trie() which returns the PrefixTrie of SELECTION_LIST used for 
+        tab completion. It is created the first time it is needed.
+    - get_suggestions() which returns the entries of SELECTION_LIST closest
+        to an input, found with a TrigramIndex (see terminal_printer_fuzzy).
+        When SELECTION_LIST has more than MAX_SUGGESTIONS entries the error
+        message asks whether the input was meant to be one of these entries.
+
+An InputValidator can be created with TerminalPrinter.get_input_validator()
+and passed to get_input() as VALIDATOR so that the same rules are reused for
+many prompts.
+
+BatchAnswers reads answers from a list (or any iterable of strings), a file
+or a pipe to stdin. It can be created with TerminalPrinter.get_batch_answers()
+and passed to get_input() as ANSWERS. Each answer is checked with the same 
+rules as an answer typed by the User but nothing is printed, the screen is 
+not cleared and nothing waits for a key to be pressed. The first answer that
+is not valid raises an InvalidInputError which has the details of the answer
+and the prompt as attributes.
+
+InputForm asks for several inputs together. Each field is added with 
+add_field() using the same rules as get_input(). ask() prints the prompt of
+each field and receives its input, then checks every answer together and 
+only asks again for the fields with answers that are not valid, without 
+clearing the screen. Answers can be given to ask() for some or all of the 
+fields, for example from a configuration file, so that only the other 
+fields are asked for. With PROMPT=False nothing is asked for and the first
+field without a valid answer raises an InvalidInputError. A field without 
+an answer is treated as if enter was pressed.
+
+Last modified: 19 October 2026
+"""
+
+import sys
+import terminal_printer
+
+class InvalidInputError(ValueError):
+
+    """
+    Raised by BatchAnswers when an answer is not valid or there are no 
+    answers left. The attributes are:\n
+        input_message - the prompt that the answer was for\n
+        input_received - the answer, or None if there were no answers left\n
+        answer_number - the number of the answer, starting from 1\n
+        error_message - the message that would have been printed for the 
+        User
+    """
+
+    def __init__(self, input_message, input_received, answer_number,
+        error_message) -> None:
+
+        self.input_message = input_message
+        self.input_received = input_received
+        self.answer_number = answer_number
+        self.error_message = error_message
+
+        super().__init__('Answer {} ({!r}) for prompt {!r} is not valid. {}'
+            .format(answer_number, input_received, input_message, 
+            error_message))
+
+class InputValidator:
+
+    # choices for INPUT_TYPE
+    INPUT_TYPES = ('string', 'integer', 'float')
+
+    # maximum number of entries of SELECTION_LIST listed in an error message
+    MAX_SUGGESTIONS = 10
+
+    # number of closest entries of SELECTION_LIST suggested for an input
+    NUM_CLOSEST = 3
+
+    def __init__(self, INPUT_TYPE='string', LOWER_LIMIT=0.0, UPPER_LIMIT=0.0,
+        IGNORE_ENTER=False, SELECTION_LIST=[]) -> None:
+
+        """
+        See TerminalPrinter.get_input() for details of parameters.
+        SELECTION_LIST can be any iterable of strings.
+        """
+
+        self.input_type = INPUT_TYPE
+        self.ignore_enter = IGNORE_ENTER
+        self.selection_list = list(SELECTION_LIST)
+        self.selection_set = frozenset(self.selection_list)
+
+        # text added to error messages when enter is also a valid input
+        if IGNORE_ENTER:
+            self.additional_text = ' or you can just press enter'
+        else:
+            self.additional_text = ''
+
+        # set the function that converts the input and the range allowed
+        if INPUT_TYPE == 'float':
+
+            self.convert = float
+            self.lower_limit = float(min(LOWER_LIMIT, UPPER_LIMIT))
+            self.upper_limit = float(max(LOWER_LIMIT, UPPER_LIMIT))
+
+        elif INPUT_TYPE == 'integer':
+
+            self.convert = int
+            self.lower_limit = int(min(LOWER_LIMIT, UPPER_LIMIT))
+            self.upper_limit = int(max(LOWER_LIMIT, UPPER_LIMIT))
+
+        else:
+
+            # strings are not converted or checked against a range
+            self.convert = None
+            self.lower_limit = None
+            self.upper_limit = None
+
+        self.__selection_error_message = None # created when first needed
+        self.__trie = None # PrefixTrie created when first needed
+
+    def parse(self, input_received: str) -> tuple:
+
+        """
+        Checks input_received and returns a tuple (bool, value, string). The
+        boolean value is whether input_received is valid. The value is
+        input_received converted to a float or integer when INPUT_TYPE is
+        'float' or 'integer' and is otherwise the string input_received. The
+        string is the error message to print when input_received is not valid
+        and is an empty string otherwise.
+        """
+
+        input_valid, value = self.check(input_received)
+
+        if input_valid:
+            return True, value, ''
+
+        return False, value, self.get_error_message(input_received)
+
+    def check(self, input_received: str) -> tuple:
+
+        """
+        Checks input_received and returns a tuple (bool, value) like parse()
+        but without creating the error message
+        """
+
+        if not input_received:
+            return self.ignore_enter, ''
+
+        # an entry of SELECTION_LIST must still be of INPUT_TYPE
+        if self.selection_set and input_received not in self.selection_set:
+            return False, input_received
+
+        if self.convert is None:
+            return True, input_received
+
+        # convert input_received to a number
+        try:
+            value = self.convert(input_received)
+        except ValueError:
+            return False, input_received
+
+        # check that value is within LOWER_LIMIT and UPPER_LIMIT
+        if value < self.lower_limit or value > self.upper_limit:
+            return False, input_received
+
+        return True, value
+
+    def get_error_message(self, input_received: str) -> str:
+
+        """
+        Returns the error message to print for input_received, or an empty
+        string if input_received is valid
+        """
+
+        if not input_received:
+
+            if self.ignore_enter:
+                return ''
+
+            return 'Input is required but no input was received.'
+
+        if self.selection_set and input_received not in self.selection_set:
+            return self.get_selection_error_message(input_received)
+
+        if self.convert is None:
+            return ''
+
+        try:
+            value = self.convert(input_received)
+        except ValueError as ve:
+            return self.__get_error_message(str(ve.args[0]))
+
+        if value < self.lower_limit or value > self.upper_limit:
+
+            return self.__get_error_message(
+                str(input_received) + ' was given but value must be between '
+                + str(self.lower_limit) + ' and ' + str(self.upper_limit)
+                + self.additional_text + '.')
+
+        return ''
+
+    def get_trie(self):
+
+        """
+        Returns a PrefixTrie with the entries of SELECTION_LIST
+        """
+
+        if self.__trie is None:
+
+            # import completion module the first time it is used
+            import terminal_printer_completion
+
+            self.__trie = terminal_printer_completion.PrefixTrie(
+                self.selection_list)
+
+        return self.__trie
+
+    def get_suggestions(self, input_received: str, 
+        NUM_SUGGESTIONS: int = 3) -> list:
+
+        """
+        Returns a list of up to NUM_SUGGESTIONS entries of SELECTION_LIST that
+        are closest to input_received, with the closest first
+        """
+
+        # import fuzzy module the first time it is used
+        import terminal_printer_fuzzy
+
+        # the index is shared by every InputValidator with the same entries
+        return terminal_printer_fuzzy.get_index(self.selection_set
+            ).get_closest(input_received, NUM_SUGGESTIONS)
+
+    def get_selection_error_message(self, input_received: str = '') -> str:
+
+        """
+        Returns the error message for input_received when it is not in 
+        SELECTION_LIST
+        """
+
+        if len(self.selection_set) > self.MAX_SUGGESTIONS and input_received:
+
+            suggestion_list = self.get_suggestions(input_received, 
+                self.NUM_CLOSEST)
+
+            if suggestion_list:
+
+                return self.__get_error_message('Text must be one of the '
+                    + str(len(self.selection_set)) + ' options' 
+                    + self.additional_text + '. Did you mean '
+                    + terminal_printer.TerminalPrinter.combine_list_into_text(
+                    suggestion_list, 'or') + '?')
+
+        if len(self.selection_set) > self.MAX_SUGGESTIONS:
+
+            # list some of the entries that start with as much of 
+            # input_received as possible
+            trie = self.get_trie()
+            prefix = trie.get_longest_prefix(input_received)
+            match_list, num_matches = trie.get_matches(prefix,
+                self.MAX_SUGGESTIONS)
+
+            text_list = ['Text must be one of the ', 
+                str(len(self.selection_set)), ' options. Options ']
+            if prefix:
+                text_list.append('starting with "' + prefix + '" ')
+            text_list.append('include ')
+
+            num_others = num_matches - len(match_list)
+            if num_others == 1:
+                match_list.append('1 other')
+            elif num_others:
+                match_list.append(str(num_others) + ' others')
+
+            text_list.append(
+                terminal_printer.TerminalPrinter.combine_list_into_text(
+                match_list, 'and'))
+
+            return self.__get_error_message(''.join(text_list) 
+                + self.additional_text + '.')
+
+        if self.__selection_error_message is None:
+
+            self.__selection_error_message = self.__get_error_message(
+                'Text must be one of the following: '
+                + terminal_printer.TerminalPrinter.combine_list_into_text(
+                self.selection_list, 'or') + self.additional_text + '.')
+
+        return self.__selection_error_message
+
+    def __get_error_message(self, text: str) -> str:
+
+        """
+        Returns the message printed when an input of the wrong type is
+        received
+        """
+
+        return 'ERROR. Incorrect input type was received. ' + text
+
+class BatchAnswers:
+
+    def __init__(self, answers=None) -> None:
+
+        """
+        answers is a list or any iterable of strings, such as an open file. 
+        None means sys.stdin at the time the first answer is read. The new 
+        line at the end of each line of a file is removed. Answers that are
+        not strings, such as numbers, are checked as the text that would be
+        typed and bytes are decoded as UTF-8.
+        """
+
+        self.__answers = answers
+        self.__iterator = None # created when the first answer is read
+        self.__num_answers = 0 # number of answers read
+
+    @classmethod
+    def from_file(cls, file_name: str, encoding: str = 'utf-8'):
+
+        """
+        Returns BatchAnswers with one answer for each line of the file 
+        file_name
+        """
+
+        with open(file_name, encoding=encoding) as file:
+            return cls(file.read().splitlines())
+
+    def get_num_answers(self) -> int:
+
+        """
+        Returns the number of answers that have been read
+        """
+
+        return self.__num_answers
+
+    def answer(self, input_message, validator: InputValidator) -> str:
+
+        """
+        Returns the next answer if it is valid according to validator. Raises
+        InvalidInputError if the answer is not valid or there are no answers
+        left. input_message is the prompt the answer is for and is only used
+        for the error.
+        """
+
+        if self.__iterator is None:
+
+            if self.__answers is None:
+                self.__iterator = iter(sys.stdin)
+            else:
+                self.__iterator = iter(self.__answers)
+
+        self.__num_answers += 1
+
+        input_received = next(self.__iterator, None)
+
+        if input_received is None:
+
+            raise InvalidInputError(input_message, None, self.__num_answers,
+                'There were no answers left.')
+
+        if isinstance(input_received, bytes):
+            input_received = input_received.decode('utf-8', errors='replace')
+        elif not isinstance(input_received, str):
+            input_received = str(input_received)
+
+        # remove new line from lines read from a file
+        if input_received[-1:] == '\n':
+            input_received = input_received.rstrip('\r\n')
+
+        input_valid, value, error_message = validator.parse(input_received)
+
+        if not input_valid:
+
+            raise InvalidInputError(input_message, input_received,
+                self.__num_answers, error_message)
+
+        return input_received
+
+class InputForm:
+
+    def __init__(self) -> None:
+
+        # fields in the order they were added as name: (input_message, 
+        # InputValidator)
+        self.__field_dict = {}
+
+    def add_field(self, name: str, input_message: str, INPUT_TYPE='string',
+        LOWER_LIMIT=0.0, UPPER_LIMIT=0.0, IGNORE_ENTER=False, 
+        SELECTION_LIST=[]) -> bool:
+
+        """
+        Adds a field with the name name. input_message is the prompt printed
+        for the field. See TerminalPrinter.get_input() for details of the 
+        other parameters. Adding a field with the same name as another field
+        replaces it.
+        """
+
+        self.__field_dict[name] = (input_message, InputValidator(
+            INPUT_TYPE=INPUT_TYPE, LOWER_LIMIT=LOWER_LIMIT, 
+            UPPER_LIMIT=UPPER_LIMIT, IGNORE_ENTER=IGNORE_ENTER, 
+            SELECTION_LIST=SELECTION_LIST))
+
+        return True
+
+    def get_field_names(self) -> list:
+
+        """
+        Returns a list of the names of the fields in the order they were 
+        added
+        """
+
+        return list(self.__field_dict)
+
+    def validate(self, answer_dict: dict) -> tuple:
+
+        """
+        Checks the answer in answer_dict for every field and returns a tuple
+        (dict, dict). The first dictionary has the value of each valid answer
+        (a float, an integer or a string, see InputValidator.parse()) and the
+        second has the error message for each field with an answer that is 
+        not valid. A field without an answer in answer_dict is checked as if
+        enter was pressed. Answers that are not strings, such as a number
+        given in advance, are checked as the text that would be typed.
+        """
+
+        value_dict = {}
+        error_dict = {}
+
+        for name, (input_message, validator) in self.__field_dict.items():
+
+            answer = answer_dict.get(name, '')
+
+            if answer is None:
+                answer = ''
+            elif not isinstance(answer, str):
+                answer = str(answer)
+
+            input_valid, value, error_message = validator.parse(answer)
+
+            if input_valid:
+                value_dict[name] = value
+            else:
+                error_dict[name] = error_message
+
+        return value_dict, error_dict
+
+    def ask(self, ANSWERS=None, PROMPT=True, PARAGRAPH_WIDTH=80, 
+        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0) -> tuple:
+
+        """
+        Asks for an input for each field without an answer in the dictionary
+        ANSWERS, checks all of the answers and asks again only for the fields
+        with answers that are not valid until every answer is valid. Returns
+        a tuple (bool, dict) with True and the value of the answer for each 
+        field.\n
+        PROMPT set to False means that nothing is asked for. An 
+        InvalidInputError is raised for the first field without a valid 
+        answer in ANSWERS. A field without an answer is checked as if enter
+        was pressed.\n
+        See TerminalPrinter.print_formatted() for details of the other 
+        parameters.
+        """
+
+        import terminal_printer_keys
+
+        printer = terminal_printer.TerminalPrinter
+
+        answer_dict = dict(ANSWERS or {})
+        name_list = [name for name in self.__field_dict 
+            if name not in answer_dict]
+
+        prompt_text_dict = {} # prompts converted the first time they are 
+        # printed
+
+        while True:
+
+            # ask for the fields in name_list. Without PROMPT a field without
+            # an answer is checked as if enter was pressed
+            for name in name_list if PROMPT else ():
+
+                if name not in prompt_text_dict:
+
+                    prompt_text_dict[name] = '\n'.join(
+                        printer.convert_message(self.__field_dict[name][0],
+                        PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, 
+                        TEXT_INDENT=TEXT_INDENT,
+                        FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT))
+
+                if prompt_text_dict[name]:
+                    printer.output.write(prompt_text_dict[name])
+
+                # keys typed ahead of the form are used first
+                answer_dict[name] = terminal_printer_keys.read_input_line()
+
+            # check all answers together
+            value_dict, error_dict = self.validate(answer_dict)
+
+            if not error_dict:
+                return True, value_dict
+
+            if not PROMPT:
+
+                name = next(iter(error_dict))
+
+                raise InvalidInputError(self.__field_dict[name][0], 
+                    answer_dict.get(name), 
+                    self.get_field_names().index(name) + 1, error_dict[name])
+
+            # print all errors together and ask again for those fields only
+            printer.print_formatted('[n]'.join(error_dict.values()),
+                PARAGRAPH_WIDTH=PARAGRAPH_WIDTH, TEXT_INDENT=TEXT_INDENT,
+                FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+            name_list = list(error_dict)
@@ -0,0 +1,638 @@
+"""
+Author: Luke Morris
+
+This class reads keys and lines typed into a terminal with a time limit. It is
+used by TerminalPrinter.get_input() when a prompt has a timeout or accepts a
+single key press rather than a line followed by enter.
+
+On Linux and macOS the terminal is put into cbreak mode with termios while a
+single key is read so that each key is received as soon as it is pressed, and
+select() is used to wait for input so that reading can give up when the time
+limit is reached. The bytes read from a terminal are decoded with an
+incremental decoder so that a character split between two reads is kept
+whole. On Windows msvcrt is used instead.
+
+When input is not a terminal, such as a pipe, it is read through the stream
+itself, normally sys.stdin, one line at a time. Lines that were read ahead
+by the stream stay in its buffer, so they are still available to the next
+prompt and to input(). With a time limit, the text already available is
+read without waiting and select() waits for more.
+
+A single KeyReader, default_key_reader, is shared by every prompt so that
+keys typed ahead, and text read but not yet used, are kept for the next
+prompt rather than discarded.
+
+The functionality includes:
+
+    - read_key() which returns the next key pressed, or None if no key is
+        pressed before the timeout. Keys that send more than one character,
+        such as the arrow keys, are returned as a single string.
+    - read_line() which returns the next line typed, without the new line, or
+        None if the line is not finished before the timeout. When input is
+        not a terminal, such as a pipe, lines are read from the pipe.
+    - read_completed_line() which reads a line like read_line() but handles 
+        the keys itself so that pressing tab completes the line from the 
+        entries of a PrefixTrie (see terminal_printer_completion). Pressing 
+        tab when nothing can be added lists the entries that start with the
+        line typed so far, up to a maximum number.
+    - read_input_line() which returns the next line like input(), using
+        text already read by default_key_reader first.
+    - run_pty_check() which runs get_input() in a child process connected to
+        a pseudo terminal, types keys into it and checks what was printed. It
+        also pipes answers for two prompts into a child process. It can be 
+        run with:
+
+            python terminal_printer_keys.py
+
+The modules for reading from the terminal are only imported the first time a
+key or line is read.
+
+Last modified: 19 October 2026
+"""
+
+import codecs
+import os
+import sys
+import time
+
+class KeyReader:
+
+    # number of bytes read at a time. Keys such as the arrow keys send
+    # several bytes which are read together
+    READ_SIZE = 64
+
+    # time in seconds between checks for a key press on Windows, where
+    # select() can not be used with the console
+    WINDOWS_POLL_INTERVAL = 0.01
+
+    def __init__(self, stream=None, ENCODING='utf-8') -> None:
+
+        # stream to read from. None means sys.stdin at the time of reading
+        self.__stream = stream
+        self.__pending = '' # text read but not yet returned
+        self.__in_cbreak = False # whether the terminal is already in cbreak
+        # mode for the line being read
+
+        # decoder for the bytes read from a terminal, which keeps the start 
+        # of a character that was split between two reads
+        self.__decoder = codecs.getincrementaldecoder(ENCODING)(
+            errors='replace')
+
+    def get_stream(self):
+
+        """
+        Returns the stream that keys are read from
+        """
+
+        if self.__stream is None:
+            return sys.stdin
+
+        return self.__stream
+
+    def has_pending(self) -> bool:
+
+        """
+        Returns True if text has been read but not yet returned, such as keys
+        typed ahead of a prompt
+        """
+
+        return bool(self.__pending)
+
+    def read_key(self, timeout: float = None):
+
+        """
+        Returns the next key pressed as a string, or None if timeout seconds
+        pass without a key being pressed. timeout of None waits until a key
+        is pressed. Raises EOFError if the input has finished.
+        """
+
+        if self.__pending:
+
+            key = self.__pending[0]
+            self.__pending = self.__pending[1:]
+
+            return key
+
+        stream = self.get_stream()
+
+        if not self.__is_terminal(stream):
+
+            # there are no key presses to wait for so the characters of the
+            # input are the keys
+            text = self.__stream_read(stream, timeout)
+
+            if text is None:
+                return None
+
+            if not text:
+                raise EOFError
+
+            self.__pending = text[1:]
+
+            return text[0]
+
+        if os.name == 'nt':
+            return self.__windows_read(timeout, LINE=False)
+
+        file_descriptor = stream.fileno()
+
+        if self.__in_cbreak:
+
+            # the terminal is already in cbreak mode
+            return self.__posix_read(file_descriptor, timeout)
+
+        import termios
+        import tty
+
+        # cbreak mode gives each key as soon as it is pressed without printing
+        # it. Ctrl-C still interrupts the program. The mode is changed straight
+        # away so that keys typed before this method was called are kept
+        old_settings = termios.tcgetattr(file_descriptor)
+
+        try:
+
+            tty.setcbreak(file_descriptor, termios.TCSANOW)
+
+            return self.__posix_read(file_descriptor, timeout)
+
+        finally:
+
+            termios.tcsetattr(file_descriptor, termios.TCSADRAIN,
+                old_settings)
+
+    def read_line(self, timeout: float = None):
+
+        """
+        Returns the next line typed, without the new line, or None if timeout
+        seconds pass before the line is finished. timeout of None waits until
+        the line is finished. Raises EOFError if the input has finished.
+        """
+
+        stream = self.get_stream()
+        is_terminal = self.__is_terminal(stream)
+
+        if os.name == 'nt' and is_terminal and '\n' not in self.__pending:
+
+            line = self.__windows_read(timeout, LINE=True)
+
+            if line is None or not self.__pending:
+                return line
+
+            # keys typed ahead start the line
+            line = self.__pending + line
+            self.__pending = ''
+
+            return line
+
+        # the terminal is left in its normal mode so the line can be edited and
+        # is printed by the terminal. select() only reports the input as ready
+        # once enter has been pressed
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while '\n' not in self.__pending:
+
+            if deadline is None:
+                remaining = None
+            else:
+                remaining = max(deadline - time.monotonic(), 0)
+
+            if is_terminal:
+                text = self.__posix_read(stream.fileno(), remaining,
+                    KEEP_PENDING=True)
+            else:
+                text = self.__stream_read(stream, remaining)
+
+            if text is None:
+                return None
+
+            if not text:
+
+                # input finished without a new line
+                if self.__pending:
+                    break
+
+                raise EOFError
+
+            self.__pending += text
+
+        line, new_line, self.__pending = self.__pending.partition('\n')
+
+        return line
+
+    def read_completed_line(self, trie, output, prompt_text: str = '',
+        timeout: float = None, MAX_MATCHES: int = 10):
+
+        """
+        Returns the next line typed, without the new line, or None if timeout
+        seconds pass before the line is finished. Keys are printed to the
+        TerminalOutput output. Pressing tab adds the characters that every 
+        entry of trie starting with the line has next. If there are none then
+        up to MAX_MATCHES of those entries are listed below the line and 
+        prompt_text and the line are printed again. When input is not a 
+        terminal read_line() is used.
+        """
+
+        stream = self.get_stream()
+
+        if not self.__is_terminal(stream):
+            return self.read_line(timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        character_list = []
+
+        old_settings = None
+
+        if os.name != 'nt':
+
+            import termios
+            import tty
+
+            # keep terminal in cbreak mode for the whole line so that keys are
+            # never printed by the terminal
+            file_descriptor = stream.fileno()
+            old_settings = termios.tcgetattr(file_descriptor)
+            tty.setcbreak(file_descriptor, termios.TCSANOW)
+            self.__in_cbreak = True
+
+        try:
+
+            while True:
+
+                if deadline is None:
+                    remaining = None
+                else:
+                    remaining = max(deadline - time.monotonic(), 0)
+
+                key = self.read_key(remaining)
+
+                if key is None:
+                    return None
+
+                if key in ('\r', '\n'):
+
+                    output.write('\n')
+
+                    return ''.join(character_list)
+
+                if key in ('\x7f', '\x08'):
+
+                    # backspace removes the last character from the screen
+                    if character_list:
+
+                        character_list.pop()
+                        output.write('\x08 \x08')
+
+                elif key == '\t':
+
+                    line = ''.join(character_list)
+                    extension = trie.complete(line)
+
+                    if extension:
+
+                        character_list.extend(extension)
+                        output.write(extension)
+
+                    else:
+
+                        # list entries starting with line
+                        match_list, num_matches = trie.get_matches(line,
+                            MAX_MATCHES)
+
+                        if num_matches > len(match_list):
+                            match_list.append('({} more)'.format(
+                                num_matches - len(match_list)))
+
+                        output.write('\n' + '  '.join(match_list) + '\n'
+                            + prompt_text + line)
+
+                elif key.isprintable():
+
+                    # keys such as the arrow keys are not printable
+                    character_list.append(key)
+                    output.write(key)
+
+        finally:
+
+            if old_settings is not None:
+
+                self.__in_cbreak = False
+                termios.tcsetattr(file_descriptor, termios.TCSADRAIN,
+                    old_settings)
+
+    def __posix_read(self, file_descriptor, timeout, KEEP_PENDING=False):
+
+        """
+        Waits for up to timeout seconds for input from a terminal and returns
+        the text read, or None if there was no input in time. Unless 
+        KEEP_PENDING is True only the first key is returned and the rest is
+        kept for the next read
+        """
+
+        import select
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+
+            if deadline is None:
+                remaining = None
+            else:
+                remaining = max(deadline - time.monotonic(), 0)
+
+            ready_list = select.select([file_descriptor], [], [], remaining)[0]
+
+            if not ready_list:
+                return None
+
+            data = os.read(file_descriptor, self.READ_SIZE)
+            text = self.__decoder.decode(data, not data)
+
+            # only part of a character was read so wait for the rest
+            if text or not data:
+                break
+
+        if KEEP_PENDING:
+            return text
+
+        if not text:
+            raise EOFError
+
+        # keep escape sequences, such as the arrow keys, together
+        if text[0] == '\x1b':
+            return text
+
+        self.__pending += text[1:]
+
+        return text[0]
+
+    def __stream_read(self, stream, timeout):
+
+        """
+        Reads the next line, or the rest of the text available, from stream,
+        which is not a terminal. Returns None if timeout seconds pass with
+        nothing to read and '' if the input has finished. Text after the line
+        is left in the buffer of stream
+        """
+
+        try:
+            file_descriptor = stream.fileno()
+        except (AttributeError, ValueError, OSError):
+            file_descriptor = None
+
+        # select() can only wait for files and pipes on Linux and macOS
+        if timeout is None or file_descriptor is None or os.name == 'nt':
+            return stream.readline()
+
+        import select
+
+        deadline = time.monotonic() + timeout
+        is_ready = False
+
+        while True:
+
+            # text in the buffer of stream is not seen by select() so it is 
+            # read first, without waiting
+            was_blocking = os.get_blocking(file_descriptor)
+            os.set_blocking(file_descriptor, False)
+
+            try:
+                text = stream.readline()
+            except BlockingIOError:
+                text = ''
+            finally:
+                os.set_blocking(file_descriptor, was_blocking)
+
+            # nothing to read after select() reported the input as ready means
+            # that the input has finished
+            if text or is_ready:
+                return text
+
+            remaining = max(deadline - time.monotonic(), 0)
+            is_ready = bool(select.select([file_descriptor], [], [], 
+                remaining)[0])
+
+            if not is_ready:
+                return None
+
+    @staticmethod
+    def __is_terminal(stream) -> bool:
+
+        """
+        Returns True if stream is a terminal
+        """
+
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def __windows_read(self, timeout, LINE):
+
+        """
+        Reads a key, or a line if LINE is True, from the Windows console.
+        Returns None if timeout seconds pass first
+        """
+
+        import msvcrt
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        characters = []
+
+        while True:
+
+            if msvcrt.kbhit():
+
+                character = msvcrt.getwch()
+
+                # keys such as the arrow keys are sent as two characters
+                if character in ('\x00', '\xe0'):
+                    character += msvcrt.getwch()
+
+                if not LINE:
+                    return character
+
+                if character in ('\r', '\n'):
+
+                    msvcrt.putwch('\n')
+
+                    return ''.join(characters)
+
+                if character == '\x08':
+
+                    # backspace removes the last character from the screen
+                    if characters:
+
+                        characters.pop()
+
+                        for erase_character in '\x08 \x08':
+                            msvcrt.putwch(erase_character)
+
+                elif len(character) == 1:
+
+                    characters.append(character)
+                    msvcrt.putwch(character)
+
+            elif deadline is not None and time.monotonic() >= deadline:
+
+                return None
+
+            else:
+
+                time.sleep(self.WINDOWS_POLL_INTERVAL)
+
+# KeyReader shared by every prompt so that text read ahead is not lost
+default_key_reader = KeyReader()
+
+def read_input_line(prompt_text: str = '') -> str:
+
+    """
+    Returns the next line of input like input(prompt_text). Text already read
+    by default_key_reader, such as keys typed ahead of the prompt, is used
+    first
+    """
+
+    if not default_key_reader.has_pending():
+        return input(prompt_text)
+
+    sys.stdout.write(prompt_text)
+    sys.stdout.flush()
+
+    return default_key_reader.read_line()
+
+def run_pty_check() -> dict:
+
+    """
+    Runs get_input() in child processes connected to pseudo terminals, types
+    into them and checks what get_input() returns. Returns a dictionary
+    with:\n
+        'passed' - whether every check passed\n
+        'results' - a list of (check name, passed, text printed by the child)
+    """
+
+    import pty
+    import select
+
+    module_directory = os.path.dirname(os.path.abspath(__file__))
+
+    # (name, get_input arguments, keys to type, expected return value)
+    checks = [
+        ('single key', "SELECTION_LIST=['y', 'n'], SINGLE_KEY=True", 'n',
+            "(True, 'n')"),
+        ('single key after invalid key',
+            "SELECTION_LIST=['y', 'n'], SINGLE_KEY=True, TIMEOUT=5", 'x y',
+            "(True, 'y')"),
+        ('line with timeout', "INPUT_TYPE='integer', UPPER_LIMIT=10, "
+            "TIMEOUT=5", '7\n', "(True, '7')"),
+        ('timeout', "TIMEOUT=0.2", '', "(False, '')"),
+        ('tab completion', "SELECTION_LIST=['host-alpha', 'host-beta', "
+            "'db'], COMPLETION=True", 'h\tb\t\n', "(True, 'host-beta')"),
+        ('multi-byte key', "SELECTION_LIST=['\u00e9', 'n'], SINGLE_KEY=True",
+            '\u00e9', "(True, '\u00e9')"),
+    ]
+
+    results = []
+
+    for name, arguments, keys, expected in checks:
+
+        process_id, file_descriptor = pty.fork()
+
+        if process_id == 0:
+
+            # child process
+            sys.path.insert(0, module_directory)
+
+            import terminal_printer
+
+            print('RESULT', eval('terminal_printer.TerminalPrinter.get_input('
+                '"Answer: ", ' + arguments + ')'))
+            sys.stdout.flush()
+
+            os._exit(0)
+
+        # type keys once the prompt has been printed
+        output = b''
+        deadline = time.monotonic() + 10
+
+        while b'Answer' not in output and time.monotonic() < deadline:
+
+            if select.select([file_descriptor], [], [], 0.1)[0]:
+                output += os.read(file_descriptor, 1024)
+
+        for key in keys:
+
+            os.write(file_descriptor, key.encode())
+            time.sleep(0.05)
+
+        # read everything printed until the child process finishes
+        while time.monotonic() < deadline:
+
+            try:
+
+                if select.select([file_descriptor], [], [], 0.1)[0]:
+
+                    text = os.read(file_descriptor, 1024)
+
+                    if not text:
+                        break
+
+                    output += text
+
+            except OSError:
+
+                # pseudo terminal closed by the child process
+                break
+
+        # stop the child process if it is still waiting for input
+        if os.waitpid(process_id, os.WNOHANG)[0] == 0:
+
+            import signal
+
+            os.kill(process_id, signal.SIGKILL)
+            os.waitpid(process_id, 0)
+
+        os.close(file_descriptor)
+
+        output_text = output.decode('utf-8', errors='replace')
+        results.append((name, 'RESULT ' + expected in output_text,
+            output_text))
+
+    # answers for two prompts piped together. The second answer is read 
+    # ahead with the first and must still be given to the second prompt
+    import subprocess
+
+    code = ('import sys\nsys.path.insert(0, {!r})\nimport terminal_printer\n'
+        'for prompt in ("A: ", "B: "):\n'
+        '    print("RESULT", terminal_printer.TerminalPrinter.get_input('
+        'prompt, INPUT_TYPE="integer", UPPER_LIMIT=10, TIMEOUT=2))\n'
+        ).format(module_directory)
+
+    try:
+
+        output_text = subprocess.run([sys.executable, '-c', code],
+            input=b'7\n8\n', stdout=subprocess.PIPE, 
+            stderr=subprocess.STDOUT, timeout=10).stdout.decode('utf-8',
+            errors='replace')
+
+    except subprocess.TimeoutExpired:
+
+        output_text = 'timed out'
+
+    results.append(('two prompts from a pipe', 
+        "RESULT (True, '7')" in output_text 
+        and "RESULT (True, '8')" in output_text, output_text))
+
+    return {'passed': all(result[1] for result in results),
+        'results': results}
+
+if __name__ == '__main__':
+
+    result = run_pty_check()
+
+    for name, passed, output_text in result['results']:
+
+        print('{:8}{}'.format('PASSED' if passed else 'FAILED', name))
+
+        if not passed:
+            print(repr(output_text))
+
+    sys.exit(0 if result['passed'] else 1)
@@ -0,0 +1,337 @@
+"""
+Author: Luke Morris
+
+This class keeps a number of status lines, such as counts or the current job,
+at the bottom of the terminal while text printed by print_formatted() scrolls
+above them.
+
+The rows above the status lines are set as the scroll region of the terminal
+so that printing text never moves or redraws the status lines. A status line
+is updated by saving the position of the cursor, moving to the status line,
+printing it and moving the cursor back, all in a single write.
+
+Updates are combined so that the status lines are printed at most
+MAX_REFRESH_RATE times per second however often they are updated. Only the
+lines that changed since they were last printed are printed. The update is
+printed by the Scheduler (see terminal_printer_scheduler) used by the loading
+trackers.
+
+The functionality includes:
+
+    - start() which makes room for the status lines and sets the scroll
+        region. stop() prints any waiting update, clears the status lines and
+        sets the whole screen to scroll again.
+    - set_line() which changes one status line and set_lines() which changes
+        all of them. The text can include the formatting commands of
+        print_formatted(). Text wider than the terminal is cut off.
+    - flush() which prints any waiting update straight away.
+
+A LiveRegion can be used with 'with' so that it is started and stopped
+around a block of code.
+
+When the output is not a terminal the status lines are not printed while the
+region is active and the last status lines are printed as normal text when it
+stops.
+
+Last modified: 19 October 2026
+"""
+
+# _thread.allocate_lock() gives the same lock as threading.Lock() without
+# importing threading, which would add to the time taken to import this module
+import _thread
+import time
+import terminal_printer
+
+class LiveRegion:
+
+    def __init__(self, num_lines: int = 1, MAX_REFRESH_RATE: float = 10,
+        screen=None, scheduler=None, CLEAR_ON_STOP: bool = True) -> None:
+
+        """
+        num_lines is the number of status lines. MAX_REFRESH_RATE is the
+        maximum number of times per second that the status lines are printed.
+        screen is the ScreenControl used to print, by default
+        TerminalPrinter.screen. scheduler is the Scheduler used, by default
+        the shared Scheduler. CLEAR_ON_STOP is whether the status lines are
+        cleared by stop() rather than left on the screen.
+        """
+
+        if screen is None:
+            screen = terminal_printer.TerminalPrinter.screen
+
+        self.__num_lines = num_lines
+        self.__time_between_refreshes = 1 / MAX_REFRESH_RATE
+        self.__screen = screen
+        self.__scheduler = scheduler
+        self.__clear_on_stop = CLEAR_ON_STOP
+
+        # all variables below are only used while holding __lock
+        self.__lock = _thread.allocate_lock()
+        self.__active = False
+        self.__is_terminal = False
+        self.__width = 80
+        self.__first_row = 1 # row of the screen of the first status line
+        self.__line_list = [''] * num_lines # text of each status line
+        self.__shown_list = [None] * num_lines # text of each status line
+        # when it was last printed
+        self.__timer = None # timer for the next refresh
+        self.__last_refresh_time = 0.0
+
+    def __enter__(self):
+
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+
+        self.stop()
+
+        # exceptions are not suppressed
+        return False
+
+    def start(self) -> bool:
+
+        """
+        Makes room for the status lines at the bottom of the terminal and
+        sets the rows above them to scroll. Returns False if already active
+        """
+
+        with self.__lock:
+
+            if self.__active:
+                return False
+
+            self.__active = True
+            self.__is_terminal = self.__screen.get_output().is_terminal()
+            self.__shown_list = [None] * self.__num_lines
+
+            if not self.__is_terminal:
+                return True
+
+            self.__width, height = self.__screen.get_size()
+            self.__first_row = height - self.__num_lines + 1
+
+            with self.__screen.batch():
+
+                # scroll existing text up to make room for the status lines
+                # and go back to the last row of the scroll region
+                self.__screen.write('\n' * self.__num_lines)
+                self.__screen.move_cursor_up(self.__num_lines)
+
+                # setting the scroll region moves the cursor so it is saved
+                self.__screen.save_cursor()
+                self.__screen.set_scroll_region(1, self.__first_row - 1)
+                self.__screen.restore_cursor()
+
+                self.__add_changed_lines()
+
+        return True
+
+    def stop(self) -> bool:
+
+        """
+        Prints any waiting update and sets the whole screen to scroll again.
+        The status lines are cleared if CLEAR_ON_STOP is True. Returns False
+        if not active
+        """
+
+        with self.__lock:
+
+            if not self.__active:
+                return False
+
+            self.__active = False
+            self.__cancel_timer()
+
+            if not self.__is_terminal:
+
+                # print the last status lines as normal text
+                text_list = [self.__convert(line) for line in
+                    self.__line_list if line]
+
+                if text_list:
+                    self.__screen.get_output().write('\n'.join(text_list)
+                        + '\n')
+
+                return True
+
+            with self.__screen.batch():
+
+                self.__screen.save_cursor()
+
+                if self.__clear_on_stop:
+                    self.__screen.clear_region(self.__first_row,
+                        self.__first_row + self.__num_lines - 1)
+                else:
+                    self.__add_changed_lines()
+
+                self.__screen.reset_scroll_region()
+                self.__screen.restore_cursor()
+
+                # when the lines are kept the cursor moves below them so that
+                # text printed afterwards does not replace them
+                if not self.__clear_on_stop:
+                    self.__screen.move_cursor(self.__first_row
+                        + self.__num_lines - 1)
+                    self.__screen.write('\n')
+
+        return True
+
+    def set_line(self, line_number: int, text: str) -> bool:
+
+        """
+        Changes the status line line_number, counted from 0, to text. The
+        change is printed within 1 / MAX_REFRESH_RATE seconds
+        """
+
+        with self.__lock:
+
+            self.__line_list[line_number] = text
+            self.__request_refresh()
+
+        return True
+
+    def set_lines(self, text_list: list) -> bool:
+
+        """
+        Changes each status line to the text with the same position in
+        text_list
+        """
+
+        with self.__lock:
+
+            for line_number, text in enumerate(text_list[:self.__num_lines]):
+                self.__line_list[line_number] = text
+
+            self.__request_refresh()
+
+        return True
+
+    def flush(self) -> bool:
+
+        """
+        Prints any waiting update straight away
+        """
+
+        with self.__lock:
+
+            if self.__active and self.__is_terminal:
+
+                self.__cancel_timer()
+                self.__refresh()
+
+        return True
+
+    def __request_refresh(self) -> None:
+
+        """
+        Prints the status lines now, or schedules them to be printed, so that
+        they are printed at most MAX_REFRESH_RATE times per second. Must be
+        called while holding __lock
+        """
+
+        if not self.__active or not self.__is_terminal:
+            return
+
+        # an update is already waiting so this change will be included
+        if self.__timer is not None:
+            return
+
+        delay = (self.__last_refresh_time + self.__time_between_refreshes
+            - time.monotonic())
+
+        if delay <= 0:
+
+            self.__refresh()
+
+        else:
+
+            if self.__scheduler is None:
+
+                import terminal_printer_scheduler
+
+                self.__scheduler = \
+                    terminal_printer_scheduler.get_default_scheduler()
+
+            self.__timer = self.__scheduler.schedule(delay,
+                self.__refresh_from_timer)
+
+    def __refresh_from_timer(self) -> None:
+
+        """
+        Prints the waiting update. Called by the scheduler
+        """
+
+        with self.__lock:
+
+            self.__timer = None
+
+            if self.__active:
+                self.__refresh()
+
+    def __refresh(self) -> None:
+
+        """
+        Prints the status lines that have changed. Must be called while
+        holding __lock
+        """
+
+        self.__last_refresh_time = time.monotonic()
+
+        with self.__screen.batch():
+
+            self.__screen.save_cursor()
+            self.__add_changed_lines()
+            self.__screen.restore_cursor()
+
+    def __add_changed_lines(self) -> None:
+
+        """
+        Moves to and prints each status line that has changed since it was
+        last printed. Must be called in a batch while holding __lock
+        """
+
+        for line_number, line in enumerate(self.__line_list):
+
+            if line == self.__shown_list[line_number]:
+                continue
+
+            self.__screen.move_cursor(self.__first_row + line_number)
+            self.__screen.write(self.__screen.CLEAR_LINE 
+                + self.__convert(line))
+
+            self.__shown_list[line_number] = line
+
+    def __convert(self, text: str) -> str:
+
+        """
+        Returns the first line of text converted with the formatting
+        commands of print_formatted() and cut to the width of the terminal
+        """
+
+        line_list = terminal_printer.TerminalPrinter.convert_message(text,
+            PARAGRAPH_WIDTH=self.__width)
+
+        if not line_list:
+            return ''
+
+        line = line_list[0].split('\n')[0]
+
+        # clear formatting so that it does not continue into other text
+        if not line.endswith('\x1b[0m'):
+            line += '\x1b[0m'
+
+        return line
+
+    def __cancel_timer(self) -> None:
+
+        """
+        Cancels the timer for the waiting update. Must be called while
+        holding __lock
+        """
+
+        if self.__timer is not None:
+
+            self.__scheduler.cancel(self.__timer)
+            self.__timer = None
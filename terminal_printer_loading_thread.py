@@ -1,86 +1,467 @@
 """
 Author: Luke Morris
 
-This class allows the creation of a thread that will print a string and then at 
-set time intervals will print a '.'.
+This class prints a string and then at set time intervals prints a '.' each 
+time it is asked to show a loading tracker.
 
 This class is designed to be used by a TerminalPrinter object to allow loading 
-trackers to be used.
+trackers to be used. A TerminalPrinter object creates one LoadingIndicator the
+first time a loading tracker is started and the same object is used for every
+loading tracker after that. Starting (begin()) and finishing (end()) a 
+loading tracker only change the values stored by the object. 
+set_starting_text() changes the starting text of the active loading tracker 
+without finishing it, which allows loading trackers to be nested.
 
-When creating the thread values can be provided for:
+A LoadingIndicator does not have its own thread. The time before the starting
+text is printed, the time of each dot and the time that the loading tracker 
+finishes are all given to a Scheduler (see terminal_printer_scheduler) which
+runs every loading tracker from a single thread. That thread only wakes when
+something is due to be printed so the processing used stays the same however
+many loading trackers are active.
+
+When starting a loading tracker values can be provided for:
     - the string to be printed at the beginning of the loading tracker.
+    - the style of the loading tracker:
+        - 'dots' prints a '.' at each time interval. The dots continue on a
+        new line when the line is 80 characters long.
+        - 'spinner' redraws the line in place with a spinning character.
+        - 'elapsed' redraws the line in place with the number of seconds 
+        since the loading tracker started.
+        - 'bar' redraws the line in place with a bar bouncing between 
+        brackets.
+    The styles that redraw the line in place print the same small 
+    number of characters at each time interval and the line is erased when 
+    the loading tracker finishes.
+    When the output is not a terminal, for example a log file written by a 
+    scheduled job, the style is not used. Instead a line with the time and 
+    the starting text is printed when the loading tracker starts, a 
+    heartbeat line is printed every heartbeat_interval seconds and a line 
+    saying "done in X s" is printed when the loading tracker finishes.
     - the time to pass before the string is printed. This delay allows the program
-    calling the thread to complete and terminate the thread before printing if 
-    the program completes quickly.
-    - the time to pass between printing the dots for the loading tracker
-    - the maximum time that the thread should remain alive. This makes sure that
-    the thread will self terminate regardless of whether the programming creating
-    this thread fails to terminate it.
-
-Last modified: 22 January 2024
+    using the loading tracker to complete and finish the loading tracker before 
+    printing if the program completes quickly.
+    - the time to pass between printing the dots (or redrawing the line) for 
+    the loading tracker
+    - the time to pass between heartbeat lines when the output is not a 
+    terminal
+    - the maximum time that the loading tracker should remain active. This 
+    makes sure that the loading tracker will finish regardless of whether the 
+    program using it fails to finish it.
+
+When creating the object values can be provided for:
+    - the TerminalOutput object used to print the text. All text is printed
+    through this object so that the dots are never printed in the middle of
+    text being printed by the program.
+    - the Scheduler used. By default the Scheduler shared by all 
+    TerminalPrinter objects is used.
+
+LoadingStopEvent is returned by the deprecated 
+TerminalPrinter.loading_thread_stop_event so that code written for the 
+threading.Event that stopped the earlier loading thread still works.
+
+Last modified: 19 October 2026
 """
 
 import threading
 import time
+import terminal_printer_output
+import terminal_printer_scheduler
+
+class LoadingIndicator:
+
+    # choices for the style of the loading tracker
+    STYLES = ('dots', 'spinner', 'elapsed', 'bar')
+
+    # maximum width of a line of dots
+    PARAGRAPH_WIDTH = 80
 
-class LoadingThread(threading.Thread):
+    # frames for the styles that are redrawn in place. The frames for the bar
+    # are created by get_bar_frames() the first time they are used
+    SPINNER_FRAMES = ('|', '/', '-', '\\')
+    BAR_WIDTH = 12
+    BAR_BLOCK = '==='
+    bar_frames = None
 
-    def __init__(self, stop_event: threading.Event,
-        starting_text: str = "Loading", 
+    # default time in seconds between heartbeat lines when the output is not
+    # a terminal and the format of the time at the start of each line
+    HEARTBEAT_INTERVAL = 30.0
+    HEARTBEAT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self, output: terminal_printer_output.TerminalOutput = None,
+        scheduler: terminal_printer_scheduler.Scheduler = None):
+
+        if output is None:
+            output = terminal_printer_output.TerminalOutput()
+        if scheduler is None:
+            scheduler = terminal_printer_scheduler.get_default_scheduler()
+        self.__output = output
+        self.__scheduler = scheduler
+
+        # all variables below are only used while holding __lock
+        self.__lock = threading.Lock()
+        self.__active = False # whether a loading tracker has been started
+        self.__generation = 0 # increased whenever a loading tracker is 
+        # started or finished so that timers for an old loading tracker that 
+        # could not be cancelled in time do nothing
+        self.__shown = False # whether the starting text has been printed
+        self.__num_dots = 0 # number of dots printed on the current line
+        self.__column = 0 # number of characters on the current line of dots
+        self.__frame_index = 0 # frame shown for styles redrawn in place
+        self.__start_time = 0.0 # time that the starting text was printed
+        self.__style = 'dots'
+        self.__heartbeat = False # whether heartbeat lines are printed 
+        # because the output is not a terminal
+        self.__heartbeat_interval = self.HEARTBEAT_INTERVAL
+        self.__timer = None # timer for the starting text or the next dot
+        self.__finish_timer = None # timer for max_time_alive
+        self.__starting_text = "Loading"
+        self.__time_between_dots = 0.5
+        self.__max_time_alive = 120.0
+
+    def begin(self, starting_text: str = "Loading", 
         time_before_start: float = 0.25,
         time_between_dots: float = 0.5,
-        max_time_alive: float = 120.0):
+        max_time_alive: float = 120.0,
+        style: str = 'dots',
+        heartbeat_interval: float = None) -> bool:
+
+        """
+        Starts a loading tracker. If a loading tracker is already active then
+        it is finished first.
+        """
+
+        if style not in self.STYLES:
+            raise ValueError('style must be one of ' + ', '.join(self.STYLES)
+                + '.')
+
+        with self.__lock:
+
+            # finish existing loading tracker, if applicable
+            if self.__active:
+                self.__finish()
+
+            self.__starting_text = starting_text
+            self.__time_between_dots = time_between_dots
+            self.__max_time_alive = max_time_alive
+            self.__style = style
+            self.__heartbeat_interval = (self.HEARTBEAT_INTERVAL 
+                if heartbeat_interval is None else heartbeat_interval)
+            self.__active = True
+            self.__generation += 1
+
+            # print starting text after time_before_start
+            self.__timer = self.__schedule(time_before_start, self.__start)
+
+        return True
+
+    def end(self) -> bool:
+
+        """
+        Finishes the active loading tracker. Nothing more is printed by the 
+        loading tracker after this method returns. Returns False if there was
+        no active loading tracker.
+        """
+
+        with self.__lock:
+
+            if not self.__active:
+                return False
+
+            self.__finish()
+
+        return True
+
+    def set_starting_text(self, starting_text: str) -> bool:
+
+        """
+        Changes the starting text of the active loading tracker without 
+        finishing it. If the starting text has been printed then it is 
+        printed again with the new text followed by the dots printed so far.
+        Returns False if there is no active loading tracker.
+        """
+
+        with self.__lock:
+
+            if not self.__active:
+                return False
+
+            # heartbeat lines already printed are not changed
+            if (self.__shown and not self.__heartbeat 
+                and starting_text != self.__starting_text):
+
+                self.__starting_text = starting_text
+
+                if self.__style == 'dots':
+                    self.__output.replace_indicator(starting_text 
+                        + '.' * self.__num_dots)
+                    self.__column = len(starting_text) + self.__num_dots
+                else:
+                    self.__output.replace_indicator(self.__get_line())
+
+            self.__starting_text = starting_text
+
+        return True
+
+    def is_active(self) -> bool:
+
+        """
+        Returns True if a loading tracker has been started and has not 
+        finished
+        """
+
+        return self.__active
+
+    @classmethod
+    def get_bar_frames(cls) -> tuple:
+
+        """
+        Returns the frames for the 'bar' style with BAR_BLOCK moving from the
+        left of the bar to the right and back again
+        """
+
+        if cls.bar_frames is None:
+
+            num_positions = cls.BAR_WIDTH - len(cls.BAR_BLOCK) + 1
+            positions = (list(range(num_positions)) 
+                + list(range(num_positions - 2, 0, -1)))
+
+            cls.bar_frames = tuple('[' + ' ' * position + cls.BAR_BLOCK 
+                + ' ' * (num_positions - 1 - position) + ']' 
+                for position in positions)
+
+        return cls.bar_frames
+
+    def __get_line(self) -> str:
+
+        """
+        Returns the line of text for the styles that are redrawn in place
+        """
+
+        if self.__style == 'spinner':
+            frames = self.SPINNER_FRAMES
+        elif self.__style == 'bar':
+            frames = self.get_bar_frames()
+        else:
+            return '{} {:.1f}s'.format(self.__starting_text, 
+                time.monotonic() - self.__start_time)
+
+        return (self.__starting_text + ' ' 
+            + frames[self.__frame_index % len(frames)])
+
+    def __schedule(self, delay: float, method):
+
+        """
+        Schedules method to be called after delay seconds for the active 
+        loading tracker. Must be called while holding __lock
+        """
+
+        generation = self.__generation
+
+        def run_if_current():
+
+            with self.__lock:
 
-        super().__init__()
-        self.__starting_text = starting_text
-        self.__stop_event = stop_event
-        self.__time_before_start = time_before_start
-        self.__time_between_dots = time_between_dots
-        self.__max_time_alive = max_time_alive
+                # do nothing if the loading tracker has changed
+                if generation == self.__generation:
+                    method()
 
-    def run(self):
+        return self.__scheduler.schedule(delay, run_if_current)
 
-        # pause for short period before starting to allow processing by application
-        # before the starting text is used. Allows quick processing to
-        # happen without the thread printing if finished quickly
-        if self.__time_before_start > 0:
-            time.sleep(self.__time_before_start)
+    def __finish(self) -> None:
 
-        # print starting text if stop_event has not been received
-        if not self.__stop_event.is_set():
+        """
+        Finishes the active loading tracker. Must be called while holding 
+        __lock
+        """
 
-            # set start time for thread
-            start_time = time.time()
+        self.__active = False
+        self.__generation += 1
+
+        # cancel timers
+        if self.__timer is not None:
+            self.__scheduler.cancel(self.__timer)
+            self.__timer = None
+        if self.__finish_timer is not None:
+            self.__scheduler.cancel(self.__finish_timer)
+            self.__finish_timer = None
+
+        if self.__shown and self.__heartbeat:
+
+            self.__print_heartbeat_line('{} done in {:.1f} s'.format(
+                self.__starting_text, time.monotonic() - self.__start_time))
+            self.__shown = False
+
+        elif self.__shown:
+
+            # lines that are redrawn in place are erased
+            self.__output.finish_indicator(ERASE=self.__style != 'dots')
+            self.__shown = False
+
+    def __start(self) -> None:
+
+        """
+        Prints the starting text. Called by the scheduler after 
+        time_before_start
+        """
+
+        self.__shown = True
+        self.__start_time = time.monotonic()
+
+        # finish loading tracker when the max time for it to be active is 
+        # reached
+        self.__finish_timer = self.__schedule(self.__max_time_alive,
+            self.__finish)
+
+        # print heartbeat lines instead of the style if the output is not a 
+        # terminal
+        self.__heartbeat = not self.__output.is_terminal()
+
+        if self.__heartbeat:
+
+            self.__print_heartbeat_line(self.__starting_text + '...')
+
+            self.__timer = self.__schedule(self.__heartbeat_interval,
+                self.__print_heartbeat)
+
+        elif self.__style == 'dots':
 
             # print starting text
-            print(self.__starting_text, end='', flush=True)
+            self.__output.write_indicator(self.__starting_text)
+            self.__num_dots = 0
+            self.__column = len(self.__starting_text) % self.PARAGRAPH_WIDTH
+
+            # print first dot
+            self.__print_dot()
+
+        else:
+
+            # print first frame
+            self.__frame_index = 0
+            self.__output.write_indicator(self.__get_line())
+
+            self.__timer = self.__schedule(self.__time_between_dots,
+                self.__redraw)
+
+    def __print_dot(self) -> None:
+
+        """
+        Prints a dot and schedules the next dot
+        """
+
+        # go to new line if paragraph width reached
+        if self.__column >= self.PARAGRAPH_WIDTH:
+
+            self.__output.new_indicator_line()
+            self.__num_dots = 0
+            self.__column = 0
+
+        # print dot
+        self.__output.write_indicator('.')
+        self.__num_dots += 1
+        self.__column += 1
+
+        # wait
+        self.__timer = self.__schedule(self.__time_between_dots, 
+            self.__print_dot)
+
+    def __redraw(self) -> None:
+
+        """
+        Redraws the line for the styles that are redrawn in place and 
+        schedules the next frame
+        """
+
+        self.__frame_index += 1
+        self.__output.replace_indicator(self.__get_line())
+
+        # wait
+        self.__timer = self.__schedule(self.__time_between_dots, 
+            self.__redraw)
+
+    def __print_heartbeat(self) -> None:
+
+        """
+        Prints a heartbeat line with the time since the loading tracker 
+        started and schedules the next heartbeat line
+        """
+
+        self.__print_heartbeat_line('{}... {:.0f} s'.format(
+            self.__starting_text, time.monotonic() - self.__start_time))
+
+        # wait
+        self.__timer = self.__schedule(self.__heartbeat_interval,
+            self.__print_heartbeat)
+
+    def __print_heartbeat_line(self, text: str) -> None:
+
+        """
+        Prints text on its own line after the current time and flushes the 
+        output so that the line is seen in log files straight away
+        """
+
+        self.__output.write('[{}] {}\n'.format(
+            time.strftime(self.HEARTBEAT_TIME_FORMAT), text))
+        self.__output.flush()
+
+class LoadingStopEvent:
+
+    # time in seconds between checks of the loading tracker in wait()
+    WAIT_INTERVAL = 0.05
+
+    def __init__(self, printer) -> None:
+
+        """
+        printer is the TerminalPrinter whose loading tracker is stopped
+        """
+
+        self.__printer = printer
+
+    def set(self) -> None:
+
+        """
+        Finishes the active loading tracker
+        """
+
+        self.__printer.loading_thread_finish()
+
+    def is_set(self) -> bool:
+
+        """
+        Returns True if no loading tracker is active
+        """
+
+        return not self.__printer.loading_thread_active()
+
+    def clear(self) -> None:
+
+        """
+        Does nothing. Starting a loading tracker no longer needs the event to
+        be cleared first
+        """
+
+    def wait(self, timeout: float = None) -> bool:
+
+        """
+        Waits until no loading tracker is active or until timeout seconds 
+        have passed. Returns True if no loading tracker is active
+        """
+
+        if timeout is not None:
+            end_time = time.monotonic() + timeout
 
-            # set counter for paragraph width - max 80
-            paragraph_width_ctr = len(self.__starting_text) % 80
+        while not self.is_set():
 
-            # print dots
-            while not self.__stop_event.is_set():
+            if timeout is not None:
 
-                # set elapsed time
-                elapsed_time = time.time() - start_time
+                remaining_time = end_time - time.monotonic()
 
-                # break while loop if max time for thread to be active is not reached
-                if elapsed_time >= self.__max_time_alive:
+                if remaining_time <= 0:
+                    return False
 
-                    # set stop_event
-                    self.__stop_event.set()
+                time.sleep(min(self.WAIT_INTERVAL, remaining_time))
 
-                    # break while loop
-                    break
+            else:
 
-                # go to new line if paragraph width reached
-                if paragraph_width_ctr >= 80:
-                    print('') # go to new line
-                
-                # print dot
-                print('.', end='', flush=True)
-                
-                # wait
-                time.sleep(self.__time_between_dots)
+                time.sleep(self.WAIT_INTERVAL)
 
-                
\ No newline at end of file
+        return True
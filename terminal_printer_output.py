@@ -0,0 +1,543 @@
+"""
+Author: Luke Morris
+
+This class is the single writer used by TerminalPrinter for all output to the
+terminal. Text printed by the program and text printed by a loading thread
+are both written through a TerminalOutput object so that the dots of a
+loading tracker can never be printed in the middle of a line of formatted
+text or in the middle of the codes that change the text formatting.
+
+The functionality includes:
+
+    - write() which writes text to the stream in a single write while
+        holding a lock. If a loading tracker is being shown then it is
+        removed from the screen first and, if the text finishes with a new
+        line, it is printed again below the text.
+    - write_indicator() which adds text, such as '.', to the loading
+        tracker.
+    - replace_indicator() which replaces all of the loading tracker text,
+        for example when the label of the loading tracker changes.
+    - new_indicator_line() which leaves the current loading tracker text on
+        the screen and continues the loading tracker on a new line.
+    - finish_indicator() which is called when the loading tracker has
+        finished. The loading tracker text is left on the screen or, for a 
+        loading tracker that is redrawn in place, is erased.
+    - is_terminal() which returns whether the stream is a terminal. The
+        result is stored after the first check.
+    - start_background_writer() which starts a thread that does the writing
+        so that write() only adds text to a queue and returns straight away.
+        The queue has a maximum size and FULL_QUEUE_POLICY chooses what 
+        happens when it is full:
+        - 'block' - write() waits until there is space in the queue
+        - 'drop_oldest' - the oldest text in the queue is discarded
+        - 'collapse' - older text in the queue with the same channel as the
+            new text (for example a repeated status line) is discarded. If
+            there is none then write() waits.
+        Text is always written in the order it was received. flush() waits 
+        until all text in the queue has been written and close() also stops
+        the thread. Loading tracker text is written once the queue is empty.
+        If writing from the thread fails, for example because the stream
+        was closed, the thread stops, write() writes directly to the stream
+        again and the next call of flush() raises the error.
+
+Last modified: 19 October 2026
+"""
+
+import _thread
+import sys
+
+# NOTE atexit, collections and threading are only imported when the 
+# background writer is started so that importing this module is quick
+
+class TerminalOutput:
+
+    # text that moves the cursor to the start of the line and clears the line
+    ERASE_LINE = '\r\x1b[K'
+
+    # choices for what happens when the queue of the background writer is full
+    FULL_QUEUE_POLICIES = ('block', 'drop_oldest', 'collapse')
+
+    def __init__(self, stream=None) -> None:
+
+        # stream to write to. None means sys.stdout at the time of writing so
+        # that redirecting sys.stdout still works
+        self.__stream = stream
+        self.__is_terminal = None # set when first checked
+
+        # lock held for every write. A plain lock is used, rather than one
+        # from threading, so that threading does not need to be imported
+        self.__lock = _thread.allocate_lock()
+
+        # variables for the loading tracker
+        self.__indicator_text = '' # all text printed by the loading tracker
+        self.__indicator_visible = False # whether the text is on the screen
+        self.__at_line_start = True # whether the last text written finished
+        # with a new line
+
+        # variables for the background writer
+        self.__writer_thread = None # thread writing text from the queue
+        self.__queue = None # deque of (text, channel) waiting to be written
+        self.__queue_condition = None # threading.Condition for the queue
+        self.__max_queue_size = 0
+        self.__full_queue_policy = 'block'
+        self.__num_being_written = 0 # entries taken from queue not yet written
+        self.__num_dropped = 0 # entries discarded because the queue was full
+        self.__closing = False
+        self.__writer_error = None # exception that stopped the writer thread
+
+    def get_stream(self):
+
+        """
+        Returns the stream that text is written to
+        """
+
+        if self.__stream is None:
+            return sys.stdout
+
+        return self.__stream
+
+    def set_stream(self, stream=None) -> bool:
+
+        """
+        Sets the stream that text is written to. None means sys.stdout
+        """
+
+        with self.__lock:
+
+            self.__stream = stream
+            self.__is_terminal = None
+
+        return True
+
+    def is_terminal(self) -> bool:
+
+        """
+        Returns True if the stream is a terminal. The result is stored so the
+        stream is only checked once
+        """
+
+        if self.__is_terminal is None:
+
+            try:
+                self.__is_terminal = self.get_stream().isatty()
+            except (AttributeError, ValueError):
+                self.__is_terminal = False
+
+        return self.__is_terminal
+
+    def write(self, text: str, channel=None) -> bool:
+
+        """
+        Writes text to the stream in a single write.\n
+        If a loading tracker is on the screen then it is removed before text
+        is written and printed again after text if text finishes with a new
+        line. Otherwise the loading tracker is hidden until text finishing
+        with a new line is written.\n
+        If the background writer is running then text is added to the queue
+        instead. channel is used by the 'collapse' policy to find older text
+        that can be discarded, for example a name for a status line.
+        """
+
+        if not text:
+            return True
+
+        if self.__writer_thread is not None:
+            return self.__queue_add(text, channel)
+
+        return self.__write_now(text)
+
+    def __write_now(self, text: str) -> bool:
+
+        """
+        Writes text to the stream in a single write. See write()
+        """
+
+        with self.__lock:
+
+            stream = self.get_stream()
+
+            # set list to store all portions of text for the single write
+            text_list = []
+
+            # remove loading tracker from the screen, if applicable
+            if self.__indicator_visible:
+
+                if self.is_terminal():
+                    text_list.append(self.ERASE_LINE)
+                else:
+                    # text can not be removed from a file so finish the line
+                    text_list.append('\n')
+
+                self.__indicator_visible = False
+
+            text_list.append(text)
+
+            self.__at_line_start = text.endswith('\n')
+
+            # print loading tracker again below text, if applicable
+            if self.__indicator_text and self.__at_line_start:
+
+                text_list.append(self.__indicator_text)
+                self.__indicator_visible = True
+
+            stream.write(''.join(text_list))
+
+            # text for a terminal is shown straight away
+            if self.is_terminal() or self.__indicator_visible:
+                stream.flush()
+
+        return True
+
+    def write_indicator(self, text: str) -> bool:
+
+        """
+        Adds text to the loading tracker and writes it to the stream. If the
+        loading tracker is hidden because the last text written did not
+        finish with a new line then text is stored and written later.
+        """
+
+        self.__wait_for_queue()
+
+        with self.__lock:
+
+            stream = self.get_stream()
+
+            self.__indicator_text += text
+
+            if self.__indicator_visible:
+
+                # loading tracker is on the screen so add text
+                stream.write(text)
+                stream.flush()
+
+            elif self.__at_line_start:
+
+                # print all of the loading tracker text
+                stream.write(self.__indicator_text)
+                stream.flush()
+
+                self.__indicator_visible = True
+
+        return True
+
+    def replace_indicator(self, text: str) -> bool:
+
+        """
+        Replaces all of the loading tracker text with text. If the loading 
+        tracker is on the screen of a terminal then its line is cleared and
+        text is printed. A stream that is not a terminal can not be changed
+        so text is printed on a new line.
+        """
+
+        self.__wait_for_queue()
+
+        with self.__lock:
+
+            stream = self.get_stream()
+
+            if self.__indicator_visible:
+
+                if self.is_terminal():
+                    stream.write(self.ERASE_LINE + text)
+                else:
+                    stream.write('\n' + text)
+
+                stream.flush()
+
+            elif self.__at_line_start and self.__indicator_text:
+
+                # loading tracker was hidden so print it again
+                stream.write(text)
+                stream.flush()
+
+                self.__indicator_visible = True
+
+            self.__indicator_text = text
+
+        return True
+
+    def new_indicator_line(self) -> bool:
+
+        """
+        Leaves the loading tracker text on the screen as normal text and 
+        continues the loading tracker on a new line, for example when the 
+        dots reach the end of a line.
+        """
+
+        self.__wait_for_queue()
+
+        with self.__lock:
+
+            if self.__indicator_visible:
+
+                stream = self.get_stream()
+                stream.write('\n')
+                stream.flush()
+
+                self.__at_line_start = True
+
+            self.__indicator_text = ''
+            self.__indicator_visible = False
+
+        return True
+
+    def finish_indicator(self, ERASE=False) -> bool:
+
+        """
+        Called when a loading tracker has finished. Any loading tracker text
+        on the screen is left there and is treated as normal text unless 
+        ERASE is True and the stream is a terminal, in which case the 
+        loading tracker line is cleared.
+        """
+
+        self.__wait_for_queue()
+
+        with self.__lock:
+
+            if self.__indicator_visible:
+
+                if ERASE and self.is_terminal():
+
+                    stream = self.get_stream()
+                    stream.write(self.ERASE_LINE)
+                    stream.flush()
+
+                else:
+
+                    self.__at_line_start = self.__indicator_text.endswith('\n')
+
+            self.__indicator_text = ''
+            self.__indicator_visible = False
+
+        return True
+
+    def start_background_writer(self, MAX_QUEUE_SIZE=1000,
+        FULL_QUEUE_POLICY='block') -> bool:
+
+        """
+        Starts a thread that writes text from a queue so that write() does 
+        not wait for slow streams such as pipes or SSH sessions.\n
+        MAX_QUEUE_SIZE is the maximum number of texts in the queue.\n
+        FULL_QUEUE_POLICY is 'block', 'drop_oldest' or 'collapse'. See the 
+        description of this module.\n
+        Returns False if the background writer is already running.
+        """
+
+        if FULL_QUEUE_POLICY not in self.FULL_QUEUE_POLICIES:
+            raise ValueError('FULL_QUEUE_POLICY must be one of '
+                + ', '.join(self.FULL_QUEUE_POLICIES) + '.')
+
+        if MAX_QUEUE_SIZE < 1:
+            raise ValueError('MAX_QUEUE_SIZE must be at least 1.')
+
+        if self.__writer_thread is not None:
+            return False
+
+        import atexit
+        import collections
+        import threading
+
+        self.__queue = collections.deque()
+        self.__queue_condition = threading.Condition()
+        self.__max_queue_size = MAX_QUEUE_SIZE
+        self.__full_queue_policy = FULL_QUEUE_POLICY
+        self.__num_being_written = 0
+        self.__closing = False
+        self.__writer_error = None
+
+        self.__writer_thread = threading.Thread(target=self.__writer_run,
+            name='TerminalOutputWriter', daemon=True)
+        self.__writer_thread.start()
+
+        # make sure that queued text is written when the program finishes
+        atexit.register(self.close)
+
+        return True
+
+    def get_num_dropped(self) -> int:
+
+        """
+        Returns the number of texts discarded because the queue was full
+        """
+
+        return self.__num_dropped
+
+    def get_writer_error(self):
+
+        """
+        Returns the exception that stopped the background writer, or None
+        """
+
+        return self.__writer_error
+
+    def flush(self) -> bool:
+
+        """
+        Waits until all text in the queue has been written and then flushes
+        the stream. If the background writer stopped because writing failed
+        then the error is raised, once
+        """
+
+        self.__wait_for_queue()
+
+        writer_error = self.__writer_error
+
+        if writer_error is not None:
+
+            self.__writer_error = None
+
+            raise writer_error
+
+        with self.__lock:
+            self.get_stream().flush()
+
+        return True
+
+    def __wait_for_queue(self) -> None:
+
+        """
+        Waits until all text in the queue of the background writer has been
+        written, if the background writer is running
+        """
+
+        if self.__writer_thread is None:
+            return
+
+        with self.__queue_condition:
+
+            while self.__queue or self.__num_being_written:
+                self.__queue_condition.wait()
+
+    def close(self) -> bool:
+
+        """
+        Writes all text in the queue and stops the background writer. write()
+        writes directly to the stream afterwards
+        """
+
+        writer_thread = self.__writer_thread
+
+        if writer_thread is not None:
+
+            # tell the writer thread to finish once the queue is empty. The
+            # thread clears __writer_thread itself while holding the
+            # condition, so text is never added to a queue that will not be
+            # written
+            with self.__queue_condition:
+
+                self.__closing = True
+                self.__queue_condition.notify_all()
+
+            writer_thread.join()
+
+            import atexit
+
+            atexit.unregister(self.close)
+
+        self.flush()
+
+        return True
+
+    def __queue_add(self, text: str, channel) -> bool:
+
+        """
+        Adds text to the queue of the background writer, applying the full 
+        queue policy if required
+        """
+
+        with self.__queue_condition:
+
+            while (self.__writer_thread is not None
+                and len(self.__queue) >= self.__max_queue_size):
+
+                if self.__full_queue_policy == 'drop_oldest':
+
+                    # discard the oldest text
+                    self.__queue.popleft()
+                    self.__num_dropped += 1
+
+                    break
+
+                if self.__full_queue_policy == 'collapse' and channel is not None:
+
+                    # discard older text with the same channel, if any
+                    for entry in self.__queue:
+
+                        if entry[1] == channel:
+
+                            self.__queue.remove(entry)
+                            self.__num_dropped += 1
+
+                            break
+
+                    if len(self.__queue) < self.__max_queue_size:
+                        break
+
+                # wait until the writer thread makes space
+                self.__queue_condition.wait()
+
+            if self.__writer_thread is not None:
+
+                self.__queue.append((text, channel))
+                self.__queue_condition.notify_all()
+
+                return True
+
+        # the writer thread has stopped so write directly
+        return self.__write_now(text)
+
+    def __writer_run(self) -> None:
+
+        """
+        Writes text from the queue until close() is called or writing fails.
+        All text waiting in the queue is written with a single write
+        """
+
+        while True:
+
+            with self.__queue_condition:
+
+                while not self.__queue and not self.__closing:
+                    self.__queue_condition.wait()
+
+                if not self.__queue:
+
+                    # closing and all text has been written. write() writes
+                    # directly from now on
+                    self.__writer_thread = None
+                    self.__queue_condition.notify_all()
+
+                    break
+
+                # take all text from the queue
+                text_list = [entry[0] for entry in self.__queue]
+                self.__queue.clear()
+                self.__num_being_written = len(text_list)
+
+                # there is now space in the queue
+                self.__queue_condition.notify_all()
+
+            try:
+
+                self.__write_now(''.join(text_list))
+
+            except Exception as error:
+
+                # the stream can not be written to so the text in the queue
+                # is discarded and the error is raised by flush()
+                with self.__queue_condition:
+
+                    self.__writer_error = error
+                    self.__num_dropped += self.__num_being_written \
+                        + len(self.__queue)
+                    self.__queue.clear()
+                    self.__num_being_written = 0
+                    self.__writer_thread = None
+                    self.__queue_condition.notify_all()
+
+                break
+
+            with self.__queue_condition:
+
+                self.__num_being_written = 0
+                self.__queue_condition.notify_all()
@@ -0,0 +1,748 @@
+"""
+Author: Luke Morris
+
+This class shows a large file of formatted text one screen at a time, like
+the 'less' command. Only the lines shown on the screen are converted, so a
+file of hundreds of megabytes can be read without waiting for all of it to
+be converted first.
+
+Each line of the file is converted as a separate message by
+MessageConverter, with the formatting commands of print_formatted(). Bold,
+italics, strikethrough, underline and color continue from the end of one
+line to the start of the next line, as they would if the whole file was
+printed together.
+
+The file is memory mapped so that only the parts read are loaded by the
+operating system. The Pager keeps an index with a checkpoint every
+CHECKPOINT_INTERVAL lines, holding the position of the line in the file and
+the formatting at its start. The index is built as far as it is needed, for
+example when moving to the end of the file, by finding the line ends and
+formatting commands without converting the text. The lines between two
+checkpoints are found again when they are needed, so memory use depends on
+the size of the screen and the number of checkpoints rather than the size
+of the file.
+
+The functionality includes:
+
+    - show() which shows the file until 'q' is pressed. The keys include
+        space and b (or page down and page up) to move a screen, j and k (or
+        the arrow keys) to move a line, g and G to go to the start and end,
+        ':' to go to a line number, '%' to go to a percentage of the file,
+        '/' and '?' to search forwards and backwards, and n and N to repeat
+        the search. When the output is not a terminal the whole file is
+        printed instead.
+    - scroll_down(), scroll_up(), go_to_start() and go_to_end() which move
+        the window of lines shown.
+    - jump_to_line() and jump_to_offset() which move the window to a line
+        number or to the line containing a position in the file.
+    - search() which moves the window to the next line containing some text.
+        The text of the file is searched, including any formatting commands.
+    - get_window_lines() which returns the printable lines of the window.
+
+A Pager can be used with 'with' so that the file is closed afterwards.
+
+Last modified: 19 October 2026
+"""
+
+import bisect
+import mmap
+import os
+import re
+import terminal_printer
+
+# formatting command that changes the color of text. A command can not 
+# contain another '['
+COLOR_COMMAND_PATTERN = re.compile(rb'\[c-([^\[\]\n]*)\]')
+
+# escape sequence that changes the formatting of text
+FORMATTING_PATTERN = re.compile('\x1b\\[[0-9;]*m')
+
+# formatting that clears all formatting
+CLEAR_FORMATTING = '\x1b[0m'
+
+# formatting at the start of the file as (bold, italics, strikethrough,
+# underline, color)
+DEFAULT_STYLE = (False, False, False, False, 'none')
+
+class Pager:
+
+    # number of lines between checkpoints of the index
+    CHECKPOINT_INTERVAL = 256
+
+    # escape sequence for the status line at the bottom of the screen
+    STATUS_FORMATTING = '\x1b[7m'
+
+    def __init__(self, file_path: str, PARAGRAPH_WIDTH: int = None,
+        height: int = None, screen=None, ENCODING: str = 'utf-8') -> None:
+
+        """
+        file_path is the file to show. PARAGRAPH_WIDTH is the width that
+        lines are wrapped to and height is the number of rows of the screen,
+        including the status line. None means the size of the terminal.
+        screen is the ScreenControl used to print, by default
+        TerminalPrinter.screen. ENCODING is the encoding of the file.
+        """
+
+        if screen is None:
+            screen = terminal_printer.TerminalPrinter.screen
+
+        terminal_width, terminal_height = screen.get_size()
+
+        self.__width = terminal_width if PARAGRAPH_WIDTH is None \
+            else PARAGRAPH_WIDTH
+        self.__height = max((terminal_height if height is None else height)
+            - 1, 1) # rows of text, with the last row for the status line
+        self.__screen = screen
+        self.__encoding = ENCODING
+        self.__file_name = os.path.basename(file_path)
+
+        # memory map the file. An empty file can not be memory mapped
+        self.__file = open(file_path, 'rb')
+        self.__size = os.fstat(self.__file.fileno()).st_size
+
+        if self.__size:
+            self.__data = mmap.mmap(self.__file.fileno(), 0,
+                access=mmap.ACCESS_READ)
+        else:
+            self.__data = b''
+
+        # index with the position and formatting of every
+        # CHECKPOINT_INTERVAL lines
+        self.__offset_list = [0]
+        self.__style_list = [DEFAULT_STYLE]
+        self.__num_lines = None # number of lines once the index is complete
+
+        if not self.__size:
+            self.__num_lines = 0
+
+        # lines of the last block of lines between two checkpoints that was
+        # used, as (start, end, style) for each line
+        self.__block_number = None
+        self.__block_line_list = []
+
+        # top of the window, as a line and a row of that line
+        self.__top_line = 0
+        self.__top_row = 0
+        self.__search_text = ''
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+
+        self.close()
+
+        # exceptions are not suppressed
+        return False
+
+    def close(self) -> bool:
+
+        """
+        Closes the file
+        """
+
+        if isinstance(self.__data, mmap.mmap):
+            self.__data.close()
+
+        self.__file.close()
+
+        return True
+
+    def get_num_lines(self):
+
+        """
+        Returns the number of lines in the file, or None if the index has not
+        reached the end of the file
+        """
+
+        return self.__num_lines
+
+    def get_num_checkpoints(self) -> int:
+
+        """
+        Returns the number of checkpoints in the index
+        """
+
+        return len(self.__offset_list)
+
+    def get_position(self) -> tuple:
+
+        """
+        Returns the position of the window as a tuple (line number, row of
+        that line), both counted from 0
+        """
+
+        return self.__top_line, self.__top_row
+
+    def get_window_lines(self) -> list:
+
+        """
+        Returns a list of the printable lines shown in the window, with up to
+        one line for each row of the screen other than the status line
+        """
+
+        window_line_list = []
+        line_number = self.__top_line
+        first_row = self.__top_row
+
+        while len(window_line_list) < self.__height:
+
+            row_list = self.__convert_line(line_number)
+
+            if row_list is None:
+                break
+
+            window_line_list.extend(row_list[first_row:])
+            first_row = 0
+            line_number += 1
+
+        return window_line_list[:self.__height]
+
+    def scroll_down(self, num_rows: int = 1) -> bool:
+
+        """
+        Moves the window down num_rows rows. The window stops when the last
+        line of the file is at the bottom of the screen
+        """
+
+        while num_rows > 0:
+
+            row_list = self.__convert_line(self.__top_line)
+
+            if row_list is None:
+                break
+
+            remaining_rows = len(row_list) - self.__top_row
+
+            if num_rows < remaining_rows:
+
+                self.__top_row += num_rows
+                break
+
+            num_rows -= remaining_rows
+            self.__top_line += 1
+            self.__top_row = 0
+
+        # do not leave empty rows at the bottom of the screen
+        if len(self.get_window_lines()) < self.__height:
+            self.go_to_end()
+
+        return True
+
+    def scroll_up(self, num_rows: int = 1) -> bool:
+
+        """
+        Moves the window up num_rows rows
+        """
+
+        while num_rows > 0:
+
+            if num_rows <= self.__top_row:
+
+                self.__top_row -= num_rows
+                break
+
+            if self.__top_line == 0:
+
+                self.__top_row = 0
+                break
+
+            # move to the end of the previous line
+            num_rows -= self.__top_row
+            self.__top_line -= 1
+            self.__top_row = len(self.__convert_line(self.__top_line))
+
+        return True
+
+    def go_to_start(self) -> bool:
+
+        """
+        Moves the window to the start of the file
+        """
+
+        self.__top_line = 0
+        self.__top_row = 0
+
+        return True
+
+    def go_to_end(self) -> bool:
+
+        """
+        Moves the window so that the last line of the file is at the bottom
+        of the screen. The index is completed to find the last line
+        """
+
+        while self.__num_lines is None:
+            self.__index_next_block()
+
+        self.__top_line = self.__num_lines
+        self.__top_row = 0
+
+        return self.scroll_up(self.__height)
+
+    def jump_to_line(self, line_number: int) -> bool:
+
+        """
+        Moves the window so that line_number, counted from 0, is at the top
+        of the screen. Returns False if the file has fewer lines
+        """
+
+        if line_number < 0 or self.__get_line(line_number) is None:
+            return False
+
+        self.__top_line = line_number
+        self.__top_row = 0
+
+        # do not leave empty rows at the bottom of the screen
+        if len(self.get_window_lines()) < self.__height:
+            self.go_to_end()
+
+        return True
+
+    def jump_to_offset(self, offset: int) -> bool:
+
+        """
+        Moves the window to the line containing the byte at position offset
+        in the file. Returns False if offset is not in the file
+        """
+
+        if offset < 0 or offset >= self.__size:
+            return False
+
+        return self.jump_to_line(self.__get_line_number(offset))
+
+    def search(self, search_text: str = None, BACKWARDS: bool = False) -> bool:
+
+        """
+        Moves the window to the next line after the top line that contains
+        search_text, or the previous line if BACKWARDS is True. None repeats
+        the last search. Returns False if the text was not found
+        """
+
+        if search_text is None:
+            search_text = self.__search_text
+
+        if not search_text:
+            return False
+
+        self.__search_text = search_text
+        search_bytes = search_text.encode(self.__encoding)
+
+        top_line = self.__get_line(self.__top_line)
+
+        if top_line is None:
+            return False
+
+        if BACKWARDS:
+            offset = self.__data.rfind(search_bytes, 0, top_line[0])
+        else:
+            offset = self.__data.find(search_bytes, top_line[1])
+
+        if offset == -1:
+            return False
+
+        return self.jump_to_offset(offset)
+
+    def show(self, key_reader=None) -> bool:
+
+        """
+        Shows the file until 'q' is pressed. key_reader is the KeyReader used
+        to read keys (see terminal_printer_keys). When the output or input is
+        not a terminal the whole file is printed instead
+        """
+
+        import terminal_printer_keys
+
+        if key_reader is None:
+            key_reader = terminal_printer_keys.default_key_reader
+
+        if (not self.__screen.get_output().is_terminal()
+            or not key_reader.get_stream().isatty()):
+
+            return self.print_all()
+
+        with self.__screen.batch():
+
+            self.__screen.enter_alternate_screen()
+            self.__screen.hide_cursor()
+
+        try:
+
+            while True:
+
+                self.__draw()
+
+                try:
+                    key = key_reader.read_key()
+                except EOFError:
+                    break
+
+                if key in ('q', 'Q'):
+                    break
+
+                self.__handle_key(key, key_reader)
+
+        finally:
+
+            with self.__screen.batch():
+
+                self.__screen.write(CLEAR_FORMATTING)
+                self.__screen.show_cursor()
+                self.__screen.leave_alternate_screen()
+
+        return True
+
+    def print_all(self) -> bool:
+
+        """
+        Prints every line of the file, converting and writing a block of
+        lines at a time
+        """
+
+        output = self.__screen.get_output()
+        line_number = 0
+
+        while True:
+
+            text_list = []
+
+            for i in range(self.CHECKPOINT_INTERVAL):
+
+                row_list = self.__convert_line(line_number)
+
+                if row_list is None:
+                    break
+
+                text_list.extend(row_list)
+                line_number += 1
+
+            if not text_list:
+                break
+
+            text_list.append('')
+            output.write('\n'.join(text_list))
+
+        return True
+
+    def __handle_key(self, key: str, key_reader) -> None:
+
+        """
+        Moves the window for key
+        """
+
+        if key in (' ', 'f', '\x1b[6~'):
+            self.scroll_down(self.__height)
+        elif key in ('b', '\x1b[5~'):
+            self.scroll_up(self.__height)
+        elif key in ('j', '\n', '\r', '\x1b[B', '\x1bOB'):
+            self.scroll_down()
+        elif key in ('k', '\x1b[A', '\x1bOA'):
+            self.scroll_up()
+        elif key in ('g', '<', '\x1b[H', '\x1b[1~'):
+            self.go_to_start()
+        elif key in ('G', '>', '\x1b[F', '\x1b[4~'):
+            self.go_to_end()
+        elif key in ('/', '?'):
+
+            search_text = self.__prompt(key, key_reader)
+
+            if search_text:
+                self.search(search_text, BACKWARDS=key == '?')
+
+        elif key in ('n', 'N'):
+            self.search(BACKWARDS=key == 'N')
+        elif key == ':':
+
+            line_text = self.__prompt('Line: ', key_reader)
+
+            if line_text.isdigit():
+                self.jump_to_line(max(int(line_text) - 1, 0))
+
+        elif key == '%':
+
+            percent_text = self.__prompt('Percent: ', key_reader)
+
+            try:
+                percent = float(percent_text)
+            except ValueError:
+                return
+
+            self.jump_to_offset(min(int(self.__size * percent / 100),
+                self.__size - 1))
+
+    def __prompt(self, prompt_text: str, key_reader) -> str:
+
+        """
+        Reads a line typed on the status line after prompt_text
+        """
+
+        with self.__screen.batch():
+
+            self.__screen.move_cursor(self.__height + 1)
+            self.__screen.write(self.__screen.CLEAR_LINE + prompt_text)
+            self.__screen.show_cursor()
+
+        try:
+            text = key_reader.read_line()
+        except EOFError:
+            text = ''
+
+        self.__screen.hide_cursor()
+
+        return text or ''
+
+    def __draw(self) -> None:
+
+        """
+        Prints the window and the status line with a single write
+        """
+
+        window_line_list = self.get_window_lines()
+
+        with self.__screen.batch():
+
+            for row in range(self.__height):
+
+                self.__screen.move_cursor(row + 1)
+                self.__screen.write(self.__screen.CLEAR_LINE)
+
+                if row < len(window_line_list):
+                    self.__screen.write(window_line_list[row])
+
+            self.__screen.move_cursor(self.__height + 1)
+            self.__screen.write(self.__screen.CLEAR_LINE
+                + self.STATUS_FORMATTING + self.__get_status()[:self.__width]
+                + CLEAR_FORMATTING)
+
+    def __get_status(self) -> str:
+
+        """
+        Returns the text of the status line
+        """
+
+        status = ' {}  line {}'.format(self.__file_name, self.__top_line + 1)
+
+        if self.__num_lines is not None:
+            status += ' of {}'.format(self.__num_lines)
+
+        top_line = self.__get_line(self.__top_line)
+
+        if top_line is not None:
+            status += '  ({}%)'.format(top_line[0] * 100 // self.__size)
+
+        return status + '  q quit, / search '
+
+    def __convert_line(self, line_number: int):
+
+        """
+        Returns a list of the printable rows of line_number, or None if the
+        file has fewer lines. Each row starts with the formatting continued
+        from the row before and ends by clearing the formatting
+        """
+
+        line = self.__get_line(line_number)
+
+        if line is None:
+            return None
+
+        start, end, style = line
+        text = self.__data[start:end].decode(self.__encoding,
+            errors='replace').rstrip('\r\n')
+
+        # start the converter with the formatting at the start of the line
+        converter = terminal_printer.MessageConverter.acquire()
+
+        try:
+
+            (converter.bold, converter.italics, converter.strikethrough,
+                converter.underline, converter.color) = style
+
+            converted_line_list = '\n'.join(converter.convert(text,
+                PARAGRAPH_WIDTH=self.__width)).split('\n')
+
+        finally:
+
+            terminal_printer.MessageConverter.release(converter)
+
+        # a row that only clears formatting is added when the text fills the
+        # last row so it is removed
+        while (len(converted_line_list) > 1
+            and not FORMATTING_PATTERN.sub('', converted_line_list[-1])):
+            converted_line_list.pop()
+
+        row_list = []
+        row_style = (terminal_printer.TerminalPrinter
+            .get_formatting_start_formatting(*style))
+
+        for converted_line in converted_line_list:
+
+            # the converter clears the formatting at the end of the message,
+            # so it is removed before the row clears the formatting once
+            row = row_style + converted_line
+
+            while row.endswith(CLEAR_FORMATTING):
+                row = row[:-len(CLEAR_FORMATTING)]
+
+            row_list.append(row + CLEAR_FORMATTING)
+
+            # find formatting at the end of the row
+            for match in FORMATTING_PATTERN.finditer(converted_line):
+
+                if match.group() == CLEAR_FORMATTING:
+                    row_style = ''
+                else:
+                    row_style += match.group()
+
+        return row_list
+
+    def __get_line(self, line_number: int):
+
+        """
+        Returns a tuple (start, end, style) for line_number, with the
+        positions of the line in the file and the formatting at its start,
+        or None if the file has fewer lines
+        """
+
+        block_number = line_number // self.CHECKPOINT_INTERVAL
+
+        # extend the index until it reaches the block of line_number
+        while (self.__num_lines is None
+            and block_number >= len(self.__offset_list)):
+            self.__index_next_block()
+
+        if (block_number >= len(self.__offset_list)
+            or (self.__num_lines is not None
+            and line_number >= self.__num_lines)):
+            return None
+
+        block_line_list = self.__get_block(block_number)
+        line_index = line_number % self.CHECKPOINT_INTERVAL
+
+        if line_index >= len(block_line_list):
+            return None
+
+        return block_line_list[line_index]
+
+    def __get_line_number(self, offset: int) -> int:
+
+        """
+        Returns the number of the line containing the byte at position offset
+        """
+
+        # extend the index until it passes offset
+        while self.__num_lines is None and self.__offset_list[-1] <= offset:
+            self.__index_next_block()
+
+        block_number = bisect.bisect_right(self.__offset_list, offset) - 1
+
+        for line_index, (start, end, style) in enumerate(
+            self.__get_block(block_number)):
+
+            if offset < end:
+                return block_number * self.CHECKPOINT_INTERVAL + line_index
+
+        return block_number * self.CHECKPOINT_INTERVAL
+
+    def __get_block(self, block_number: int) -> list:
+
+        """
+        Returns a list of (start, end, style) for each line of the block of
+        lines that starts at checkpoint block_number. Only the last block
+        used is kept
+        """
+
+        if block_number == self.__block_number:
+            return self.__block_line_list
+
+        block_line_list = []
+        start = self.__offset_list[block_number]
+        style = self.__style_list[block_number]
+
+        while (len(block_line_list) < self.CHECKPOINT_INTERVAL
+            and start < self.__size):
+
+            end = self.__data.find(b'\n', start) + 1 or self.__size
+
+            block_line_list.append((start, end, style))
+
+            style = self.__get_end_style(style, self.__data[start:end])
+            start = end
+
+        self.__block_number = block_number
+        self.__block_line_list = block_line_list
+
+        return block_line_list
+
+    def __index_next_block(self) -> None:
+
+        """
+        Adds the next checkpoint to the index, or sets the number of lines if
+        the end of the file is reached
+        """
+
+        start = self.__offset_list[-1]
+        end = start
+        num_block_lines = 0
+
+        # find the end of the next CHECKPOINT_INTERVAL lines
+        while num_block_lines < self.CHECKPOINT_INTERVAL and end < self.__size:
+
+            end = self.__data.find(b'\n', end) + 1 or self.__size
+            num_block_lines += 1
+
+        if end >= self.__size:
+
+            self.__num_lines = ((len(self.__offset_list) - 1)
+                * self.CHECKPOINT_INTERVAL + num_block_lines)
+
+        else:
+
+            self.__offset_list.append(end)
+            self.__style_list.append(self.__get_end_style(
+                self.__style_list[-1], self.__data[start:end]))
+
+    @staticmethod
+    def __get_end_style(style: tuple, text: bytes) -> tuple:
+
+        """
+        Returns the formatting after text for text that starts with the
+        formatting style, using the same rules as MessageConverter
+        """
+
+        # most lines have no formatting commands
+        if b'[' not in text:
+            return style
+
+        bold, italics, strikethrough, underline, color = style
+
+        # each toggle command changes its style so only the number of
+        # commands matters
+        bold ^= text.count(b'[b]') % 2 == 1
+        italics ^= text.count(b'[i]') % 2 == 1
+        strikethrough ^= text.count(b'[s]') % 2 == 1
+        underline ^= text.count(b'[u]') % 2 == 1
+
+        # the color is set by the last valid color command
+        position = text.rfind(b'[c-')
+
+        while position != -1:
+
+            match = COLOR_COMMAND_PATTERN.match(text, position)
+
+            if match:
+
+                new_color = match.group(1).decode('ascii', errors='replace')
+
+                # the converter only changes color for a valid color with at
+                # least 3 characters
+                if new_color == 'none' or (len(new_color) >= 3 
+                    and terminal_printer.TerminalPrinter
+                    .get_formatting_color_code_text(new_color)):
+
+                    color = new_color
+                    break
+
+            position = text.rfind(b'[c-', 0, position)
+
+        return bold, italics, strikethrough, underline, color
@@ -0,0 +1,1123 @@
+"""
+Author: Luke Morris
+
+This module keeps a frozen copy of the message conversion used by 
+TerminalPrinter.convert_message() so that faster conversion engines can be 
+checked against the original behaviour.
+
+The functionality includes:
+
+    - ReferenceConverter.convert_message() which is the reference 
+        implementation. It must not be changed when TerminalPrinter is 
+        changed. Behaviour such as dropping spaces at the start of a line, how
+        tabs fill a line, splitting words that are longer than a line and the
+        formatting reset at the end of the text is defined by this copy.
+    - generate_random_markup() which creates random text containing valid and
+        invalid formatting instructions.
+    - run_differential_test() which converts the same random text with the 
+        reference and with another engine (by default 
+        TerminalPrinter.convert_message()), reports the first line that is 
+        different and records how long each engine took.
+
+The tests can be run without any input from the User with:
+
+    python terminal_printer_reference.py
+
+Last modified: 19 October 2026
+"""
+
+import random
+import sys
+import time
+import terminal_printer
+
+class ReferenceConverter:
+
+    """
+    Frozen copy of the conversion methods of TerminalPrinter as at 22 January
+    2024. Do not change.
+    """
+
+    # the tables of color names are data rather than behaviour so the tables
+    # used by TerminalPrinter are shared
+    basic_color_codes = terminal_printer.TerminalPrinter.get_basic_color_codes()
+    color_codes = terminal_printer.TerminalPrinter.get_color_codes()
+
+    def __init__(self) -> None:
+
+        # variables for use as a buffer
+        self.__buffer = []
+        self.__bold = False
+        self.__italics = False
+        self.__strikethrough = False
+        self.__underline = False
+        self.__color = 'none'
+        self.__starting_bracket_index_value = -1 # -1 signifies no open bracket
+    
+    def __buffer_add_char(self, new_char) -> bool:
+
+        """
+        adds new_char to __buffer.\n
+        Checks if new_char is the last character in a formatting instruction 
+        (for example [b]) and, if so, then method will pop the other formatting 
+        instruction characters from __buffer and append characters to __buffer 
+        that will implement the formatting instruction
+        """
+
+        # check that new_char is only 1 character long
+        if len(new_char) != 1:
+            return False
+        
+        # set buffer length and index value for starting bracket
+        BUFFER_LENGTH = len(self.__buffer)
+        INDEX_VALUE = self.__starting_bracket_index_value
+        
+        # process new_char
+        if self.__starting_bracket_index_value != -1 and new_char == ']':
+                
+            # a potential opening bracket has been found and new_char could 
+            # be a closing bracket of a formatting instruction
+    
+            # set string for converted formatting instruction that can be appended
+            # initial value is an empty string
+            formatting_instruction = ''
+
+            # set string for type to be recorded in buffer for 
+            # formatting_instruction characters in this group
+            formatting_instruction_type = 'formatting_char'
+
+            # determine type of formatting instruction, if applicable
+            if (INDEX_VALUE + 2 == BUFFER_LENGTH
+                and self.__buffer[INDEX_VALUE + 1]['char']
+                in ['b', 'i', 'n', 's', 'u']):
+
+                # formatting instruction was 3 characters long and is
+                # [b], [i], [n], [s] or [u]
+
+                # set formatting_instruction
+                if self.__buffer[INDEX_VALUE + 1]['char'] == 'n':
+                    formatting_instruction = '\n'
+                else:
+                    formatting_instruction = self.__buffer_toggle_formatting(
+                        self.__buffer[INDEX_VALUE + 1]['char'],
+                        self.__bold, self.__italics, self.__strikethrough,
+                        self.__underline, self.__color) 
+
+            elif (INDEX_VALUE + 4 == BUFFER_LENGTH
+                and self.__buffer[INDEX_VALUE + 1]['char'] in ['i', 't']
+                and self.__buffer[INDEX_VALUE + 2]['char'].isdigit()
+                and self.__buffer[INDEX_VALUE + 3]['char'].isdigit()):
+
+                # formatting instruction is 5 characters long and is in the
+                # format [ixx] or [txx] (where 'xx' is a number between 0 
+                # and 99)
+
+                # set formatting_instruction to initial text values in buffer
+                # plus ']' at the end
+                formatting_instruction = ('[' 
+                    + self.__buffer[INDEX_VALUE + 1]['char']
+                    + self.__buffer[INDEX_VALUE + 2]['char']
+                    + self.__buffer[INDEX_VALUE + 3]['char'] 
+                    + ']')
+                
+                # set formatting_instruction_type to 'special_formatting_char' 
+                # to signify that the characters in formatting_instruction
+                # require additional consideration by the UI rather than just
+                # being able to print them like the other formatting_char
+                # characters
+                formatting_instruction_type = 'special_formatting_char'
+
+            elif (INDEX_VALUE + 7 == BUFFER_LENGTH
+                and self.__buffer[INDEX_VALUE + 1]['char'] == 'c'
+                and self.__buffer[INDEX_VALUE + 2]['char'] == '-'
+                and self.__buffer[INDEX_VALUE + 3]['char'] == 'n'
+                and self.__buffer[INDEX_VALUE + 4]['char'] == 'o'
+                and self.__buffer[INDEX_VALUE + 5]['char'] == 'n'
+                and self.__buffer[INDEX_VALUE + 6]['char'] == 'e'):
+
+                # update __color value to 'none'
+                self.__color = 'none'
+
+                # append text to clear all styles to formatting_instruction
+                formatting_instruction += self.get_formatting_clear_formatting()
+
+                # append text to set all existing styles to formatting_instruction
+                formatting_instruction += self.get_formatting_start_formatting(
+                    self.__bold, self.__italics, self.__strikethrough,
+                    self.__underline, self.__color) 
+
+            elif (INDEX_VALUE + 5 < BUFFER_LENGTH
+                and self.__buffer[INDEX_VALUE + 1]['char'] == 'c'
+                and self.__buffer[INDEX_VALUE + 2]['char'] == '-'):
+
+                # formatting instruction is at least 7 characters long and 
+                # starts with '[c-'
+
+                # set string for new color
+                new_color = ''
+
+                # populate new_color
+                for i in range(INDEX_VALUE + 3, BUFFER_LENGTH):
+                    new_color += self.__buffer[i]['char']
+                
+                # check current_color is a valid code
+                color_code_text = self.get_formatting_color_code_text(new_color)
+
+                # if color_code was valid then append formatting code otherwise
+                # do not change return_text
+                if color_code_text:
+                    
+                    formatting_instruction += color_code_text
+
+                    # update __color value to 'none'
+                    self.__color = new_color
+
+            # update __buffer if formatting_instruction was created
+            if formatting_instruction:
+
+                # pop all elements from __starting_bracket_index_value,
+                # i.e. '[' onwards, from __buffer as they will be replaced
+                # with characters to implement the formatting instruction
+                while (len(self.__buffer)
+                    > INDEX_VALUE):
+
+                    # pop last element from __buffer
+                    self.__buffer.pop()
+
+                # __buffer is ready for formatting instruction characters
+
+                # append new formatting_instruction to buffer
+                for i in range(len(formatting_instruction)):
+                    self.__buffer.append({'char': formatting_instruction[i],
+                    'type': formatting_instruction_type})
+
+            else:
+
+                # ']' is a normal character so can be appended to __buffer
+                self.__buffer.append({'char': ']', 'type': 'standard_char'})
+
+            # update __starting_bracket_index_value to -1 as a closing 
+            # bracket, ']', was encountered
+            self.__starting_bracket_index_value = -1    
+
+        else:
+
+            # if new_char is a '[' then update __starting_bracket_index_value
+            # as the length of __buffer before adding the character (i.e. its
+            # index position)
+            if new_char == '[':
+                self.__starting_bracket_index_value = len(self.__buffer)
+
+            # append new_char details to __buffer
+            if new_char.isspace():
+
+                # new_char is a space
+
+                # append ' ' to __buffer
+                self.__buffer.append({'char': ' ', 'type': 'space_char'})
+            
+            else:
+
+                # new_char is a standard character
+
+                # append new_char to __buffer
+                self.__buffer.append({'char': new_char, 'type': 'standard_char'})
+
+        # new_char processed
+        return True
+    
+
+    def __buffer_is_empty(self) -> bool:
+
+        """
+        Returns True if self.__buffer is empty otherwise returns True
+        """
+
+        if self.__buffer:
+            return False
+        else:
+            return True
+        
+    def __buffer_load_message(self, message_to_convert) -> bool:
+
+        """
+        Receives a string which may have formatting instructions embedded within
+        it. This method converts the string to a format that will implement all
+        of the formatting instructions except tab and indent instructions which
+        will contain the original characters. The converted string will be loaded
+        into the buffer and can be retrieved using return_test_from_buffer().
+        """
+
+        # append each character into __buffer
+        for char in message_to_convert:
+            self.__buffer_add_char(char)
+
+        # check if there is any formatting in message stored in buffer and, 
+        # if so, then add characters to clear the formatting.
+        if (self.__bold or self.__italics or self.__strikethrough 
+            or self.__underline or self.__color):
+
+            # get text to clear formatting
+            clear_formatting_text = self.get_formatting_clear_formatting()
+
+            # append clear_formatting_text to __buffer
+            for char in clear_formatting_text:
+
+                self.__buffer.append({'char': char, 'type': 'formatting_char'})
+
+    def __buffer_return_text_portion(self, MAX_NUM_CHARACTERS=1000):
+
+        """
+        return tuples consisting of a string up to MAX_NUM_CHARACTERS in length 
+        and the number of characters of text (excluding formatting characters)
+        and the type of characters returned being 'standard_char', 'space_char',
+        'formatting_char' or 'special_formatting_char'. 
+        The default value for MAX_NUM_CHARACTERS is set to 1000 which is 
+        essentially unlimited as it is much longer than any word.
+        """
+
+        # check that there are entries in the buffer
+        if not self.__buffer:
+
+            # there are no entries in __buffer
+
+            return '', 0, ''
+
+        # set variable for type of characters to be returned in this block
+        block_type = self.__buffer[0]['type']
+        
+        # set list of types that will cause the method to stop appending
+        # characters from the buffer if encountered
+        stopping_type_list = ['formatting_char', 'space_char', 
+            'special_formatting_char', 'standard_char']
+        
+        # remove type of first character in buffer
+        stopping_type_list.remove(block_type)
+        
+        # set variable to count the number of non formatting_char characters
+        # being returned
+        num_non_formatting_chars = 0
+
+        
+
+        
+        """
+        # check first entry in buffer that is not of type 'formatting_char' and 
+        # update stopping_type_list to reflect current type of character
+        for i in range(len(self.__buffer)):
+            
+            # check that this 
+            if self.__buffer[i]['type'] in stopping_type_list:
+                
+                # remove this type from stopping_type_list so that other 
+                # characters with this type can be returned by this method
+                stopping_type_list.remove(self.__buffer[i]['type'])
+
+                # update block_type
+                block_type = self.__buffer[i]['type']
+
+                # break for i loop
+                break 
+        """           
+
+        # set string to be returned
+        return_string = '' 
+
+        # append characters into return_string until character in 
+        # stopping_type_list is reached, MAX_NUM_CHARACTERS is reached or 
+        # there are no more characters in the buffer
+        while (self.__buffer 
+            and self.__buffer[0]['type'] not in stopping_type_list
+            and num_non_formatting_chars < MAX_NUM_CHARACTERS):
+            
+            # pop first entry from buffer
+            buffer_entry = self.__buffer.pop(0)
+
+            # append popped character to return_string
+            return_string += buffer_entry['char']
+
+            # increment num_non_formatting_chars if not 'formatting_char' as type
+            if (buffer_entry['type'] 
+                not in ['formatting_char', 'special_formatting_char']):
+                
+                num_non_formatting_chars += 1
+
+        # return characters in return_string and number of non-formatting 
+        # characters
+        return return_string, num_non_formatting_chars, block_type 
+
+    def __buffer_toggle_formatting(self, formatting_type, current_bold, current_italics,
+        current_strikethrough, current_underline, current_color) -> str:
+
+        """
+        Receives a formatting type ('b', 'i', 's' or 'u') and, based on the 
+        currently toggled formatting styles, returns a string with the code 
+        required to set those formatting styles for printing
+        """   
+
+        # set text to be returned for inclusion in printable message
+        return_text = ''   
+
+        # check if toggling on or off
+        if ((formatting_type == 'b' and not current_bold)
+            or (formatting_type == 'i' and not current_italics)
+            or (formatting_type == 's' and not current_strikethrough)
+            or (formatting_type == 'u' and not current_underline)):
+
+            # toggling on
+
+            if formatting_type == 'b':
+
+                # update current_bold to True
+                self.__bold = True
+                
+                # append text to turn on bold formatting style
+                return_text += '\033[1m'
+
+            elif formatting_type == 'i':
+
+                # update current_italics to True
+                self.__italics = True
+
+                # append text to turn on italics formatting style
+                return_text += '\033[3m'
+            
+            elif formatting_type == 's':
+
+                # update current_strikethrough to True
+                self.__strikethrough = True
+
+                # append text to turn on italics formatting style
+                return_text += '\033[9m'
+            
+            else:
+
+                # update current_underline to True
+                self.__underline = True
+
+                # append text to turn on underline formatting style
+                return_text += '\033[4m'
+
+        else:
+
+            # toggling off  
+
+            # set chosen formatting style to False
+            if formatting_type == 'b':
+
+                self.__bold = False
+                current_bold = False
+
+            elif formatting_type == 'i':
+
+                self.__italics = False
+                current_italics = False
+
+            elif formatting_type == 's':
+
+                self.__strikethrough = False
+                current_strikethrough = False
+            
+            else:
+
+                self.__underline = False
+                current_underline = False
+
+            # append text to clear all styles
+            return_text += self.get_formatting_clear_formatting()
+
+            # append other formatting text
+            return_text += self.get_formatting_start_formatting(current_bold,
+                current_italics, current_strikethrough, current_underline, 
+                current_color)
+
+        return return_text
+
+    @staticmethod
+    def convert_message(message_to_convert, PARAGRAPH_WIDTH=80, 
+        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0) -> list:
+
+        """
+        Converts a string into a printable message by converting embedded
+        formatting instructions
+
+        Returns list of strings that can be printed by Python with the embedded 
+        formatting.
+
+        PARAGRAPH_WIDTH is the maximum number of characters that will be printed
+        on a row of text.\n
+        NEW_LINE is whether the curser should go to a new line after the end
+        of all of the text is printed.\n
+        TEXT_INDENT is the number of blank spaces that should appear before every
+        line of text. This amount will count towards the paragraph width, e.g.
+        if TEXT_INDENT is 10 and PARAGRAPH_WIDTH is 80 then the first 10 
+        characters of every line will be 10 blank spaces followed by up to 70
+        characters.\n
+        FOLLOWING_LINE_INDENT is the number of blank spaces (in additional to 
+        any blank spaces for TEXT_INDENT) that should appear before every line
+        of text after the first line of text. This amount will count towards the 
+        paragraph width.\n
+        There are additional formatting instructions that can appear in the 
+        message being converted and they will be between square brackets([]).
+        These are\n:
+        [txx] - tab of size xx. Use two digits. 05 is 5.\n
+        [n] - new line.\n
+        [ixx] - is an additional indent value for the next new line. Note that
+        [i00] will reset the indent value to the text_indent and 
+        following_line_indent values.\n
+        [b] - toggles bold text.\n
+        [i] - toggles italics text.\n
+        [u] - toggles underline text.\n
+        [s] - toggles strikethrough text.\n
+        There are various colors for text. They will be in square brackets with 
+        'c-' followed by the name of the color, the rgb color with 3 numbers 
+        between 0 and 255 each separated by ; or 'none' to clear the color.\n 
+        The color names include: gray, red, green, yellow, blue, purple, teal 
+        and white    
+        """
+
+        # check that message has characters otherwise return and empty string
+        if message_to_convert.isspace():
+
+            return []
+
+        # set variables
+        return_text_list = [] # list of strings to return with converted message
+        current_indent = max(TEXT_INDENT, 0) # set current indent value.
+        #ensures that current_indent is positive
+        current_line = ' ' * current_indent # string to store current line of 
+        # converted text
+        num_chars_current_line = current_indent # number of printable characters 
+        # on current line    
+        
+        # update current_indent to include FOLLOWING_LINE_INDENT
+        current_indent += FOLLOWING_LINE_INDENT   
+                
+        # create text buffer object
+        text_buffer = ReferenceConverter()
+
+        """
+        load message_to_convert into __buffer
+        """
+        
+        # load message_to_convert into text_buffer
+        text_buffer.__buffer_load_message(message_to_convert)
+
+        """
+        retrieve characters from __buffer
+        """
+
+        # set variable for whether a new line command was received
+        new_line_received = False
+
+        # retrieve blocks of text from text_buffer until text_buffer is empty
+        while True:
+
+            # get block of converted text from text_buffer
+            new_text, num_chars_new_text, new_text_type = (
+                text_buffer.__buffer_return_text_portion())
+
+            # process depending on new_text_type
+            if new_text_type == 'standard_char':
+
+                # check if new_text will fit on current_line
+                if (num_chars_new_text + num_chars_current_line 
+                    <= PARAGRAPH_WIDTH):
+
+                    # append new_text to current_lien
+                    current_line += new_text
+
+                    # update num_chars_current_line
+                    num_chars_current_line += num_chars_new_text
+
+                else:
+
+                    # new_text is too long to fit on the current_line
+
+                    # check if new_text is too large to fully fit on a single line
+                    if num_chars_new_text + current_indent > PARAGRAPH_WIDTH:
+
+                        # new_text will not fit on a line anyway so split over 
+                        # multiple lines
+
+                        # fill current_line with as much text from new_text as 
+                        # possible
+                        last_index_value = (PARAGRAPH_WIDTH 
+                            - num_chars_current_line) 
+                        current_line += new_text[:last_index_value]
+                        num_chars_current_line = (num_chars_current_line 
+                            + last_index_value)
+                        
+                        # remove characters appended to current_line from 
+                        # new_text
+                        new_text = new_text[last_index_value:]
+
+                        # append current_line to return_text_list
+                        return_text_list.append(current_line)
+
+                        # reset current_line and num_chars_current_line
+                        current_line = ''
+                        num_chars_current_line = 0
+                        
+                        # fill additional lines of text with remaining new_text
+                        while len(new_text):
+
+                            if (len(new_text) 
+                                > PARAGRAPH_WIDTH - current_indent):
+
+                                # append new line with as much of the text as 
+                                # will fit on a line to return_text_list
+                                return_text_list.append(' ' * current_indent
+                                    + new_text[:PARAGRAPH_WIDTH - current_indent])
+                                
+                                # remove appended characters from new_text
+                                new_text = new_text[PARAGRAPH_WIDTH 
+                                    - current_indent:]
+                                
+                            else:
+                                
+                                # new_text will fit on a new line
+
+                                # remaining characters in new_text will fit on 
+                                # one line
+
+                                # append current_indent spaces and remaining
+                                # new_text to current_line
+
+                                # update current_line
+                                current_line += (' ' * current_indent
+                                    + new_text) 
+                                
+                                # update current_line
+                                num_chars_current_line = (current_indent 
+                                    + len(new_text))
+                                
+                                # clear new_text as all characters appended
+                                new_text = ''
+                    
+                    else:
+
+                        # new_text can fit on a new line
+                        
+                        # append current_line to return_text_list
+                        return_text_list.append(current_line) 
+                        
+                        # update new current_line
+                        current_line = (' ' * current_indent
+                            + new_text) 
+                        
+                        # update current_line
+                        num_chars_current_line = (current_indent 
+                            + len(new_text))
+
+            elif new_text_type == 'space_char':
+
+                # spaces will not be added to the start of a line when there are 
+                # no other characters on that line already
+                
+                if (not len(return_text_list)
+                    or (len(current_line) and not current_line.isspace())):
+
+                    # Either this is the start of the text and spaces are required 
+                    # or there are characters in the current_line and the spaces 
+                    # will follow.
+
+                    # check if there is sufficient space for all spaces
+                    if (num_chars_current_line + num_chars_new_text 
+                        > PARAGRAPH_WIDTH):
+
+                        # too many spaces to fit on current_line
+
+                        # add enough spaces to fill current_line and discard the
+                        # additional spaces rather than putting them at the 
+                        # start of the next line
+                        current_line += (' ' * PARAGRAPH_WIDTH 
+                            - num_chars_new_text)
+                        
+                        # update num_chars_current_line
+                        num_chars_current_line = PARAGRAPH_WIDTH
+                         
+                    else:
+
+                        # all spaces can be added to current_line 
+                        
+                        # add spaces to current_line
+                        current_line += new_text
+
+                        # update num_chars_current_line
+                        num_chars_current_line += num_chars_new_text
+
+                # if there were no characters in the current_line then the 
+                # spaces are discarded rather than going at the start of the
+                # line
+            
+            elif new_text_type == 'formatting_char':
+
+                # update new_line_received, if applicable
+                if new_text == '\n':
+                    
+                    # do not append '\n' but instead finish the current line
+                    # by setting new_line_received to True
+                    new_line_received = True
+
+                else:
+                
+                    # append new_text to current_line
+                    current_line += new_text
+
+                
+
+            elif new_text_type == 'special_formatting_char':
+
+                formatting_integer = int(new_text[2:4])
+                
+                # process indent or tab formatting instruction
+                if new_text[1] == 'i':
+
+                    if formatting_integer == 0:
+
+                        # reset current_indent
+                        current_indent = TEXT_INDENT + FOLLOWING_LINE_INDENT
+                    
+                    else:
+
+                        # increase current_indent
+                        if current_indent + formatting_integer >= PARAGRAPH_WIDTH:
+
+                            # set current_indent to 1 character less than 
+                            # PARAGRAPH_WIDTH to allow at least 1 character to
+                            # be printed on each line
+                            current_indent = PARAGRAPH_WIDTH - 1
+
+                        else: 
+
+                            # increase current_indent by formatting_integer
+                            current_indent += formatting_integer
+                
+                if new_text[1] == 't':
+
+                    # apply tab
+
+                    if (num_chars_current_line + formatting_integer 
+                        >= PARAGRAPH_WIDTH):
+
+                        # tab fills the rest of the current_line
+                        current_line += (' ' 
+                            * (PARAGRAPH_WIDTH - num_chars_current_line))
+
+                        # update num_chars_current_line
+                        num_chars_current_line += (PARAGRAPH_WIDTH 
+                            - num_chars_current_line)
+                    
+                    else:
+
+                        # tab fits on current_line.
+                        # tabs are allowed at the beginning of a line even if 
+                        # there aren't any characters on the line
+                        current_line += ' ' * formatting_integer
+
+                        # update num_chars_current_line
+                        num_chars_current_line += formatting_integer
+
+            # update if current_line is full or new line command was received
+            if num_chars_current_line == PARAGRAPH_WIDTH or new_line_received:                
+                
+                # append current_line to return_text_list
+                return_text_list.append(current_line)
+
+                # reset current_line and num_chars_current_line
+                if text_buffer.__buffer_is_empty():
+
+                    # the is no more text in the buffer so set current_line
+                    # to an empty string
+                    
+                    # set current_line
+                    current_line = ''
+                    num_chars_current_line = 0 
+
+                else:
+
+                    # there is more text in the buffer
+
+                    # set up next current_line
+                    current_line = ' ' * current_indent
+                    num_chars_current_line = current_indent
+
+                # reset new_line_received
+                if new_line_received:
+                    new_line_received = False
+            
+            # check if __buffer is empty and go to next line if applicable
+            if text_buffer.__buffer_is_empty():
+
+                # text has been converted
+
+                # get last current_line, if applicable
+                if len(current_line):
+
+                    # append current_line to return_text_list
+                    return_text_list.append(current_line)
+                
+                # NOTE that NEW_LINE is not handled here. When the lines in 
+                # return_text_list are printed then that function will handle
+                # whether the cursor should move to another line after the text
+
+                # all text has been converted so break while True loop
+                break
+                
+        # return list of printable lines
+        return return_text_list
+
+    @staticmethod
+    def get_formatting_clear_formatting() -> str:
+
+        """
+        Returns string that will clear all existing formatting when passed to 
+        print()
+        """
+        return '\x1b[0m'
+    
+    @staticmethod
+    def get_formatting_start_formatting(bold, italics, strikethrough, underline, 
+            color_text) -> str:
+
+        """
+        Returns string that implements the chosen formatting styles\n
+
+        bold, italics, underline and strikethrough are to implement those 
+        formatting styles and are boolean values.\n
+        color_text is a string value and is either 'none' (if there is no text 
+        color), a color name or an rgb value formatted as three integers 
+        between 0 and 255 inclusive separated by ';'.\n 
+        Returns a string that can be passed to the print function to implement
+        the chosen formatting.
+        """
+
+        # set string to store all formatting text
+        return_text = ''
+
+        # prepare formatting text for bold, italics, underline and strikethrough
+        if bold:
+            return_text += '\033[1m'
+        if italics:
+            return_text += '\033[3m'
+        if strikethrough:
+            return_text += '\033[9m'
+        if underline:
+            return_text += '\033[4m'
+        
+        # prepare formatting text for text color
+        # NOTE 'none' will return an empty string when passed to 
+        # get_formatting_color_code_text so no need to check separately
+        color_code_text = ReferenceConverter.get_formatting_color_code_text(color_text)
+        if color_code_text:
+            return_text += color_code_text
+
+        # all formatting text has been added
+        return return_text
+    
+    @staticmethod
+    def get_formatting_color_code_text(color_text) -> str:
+
+        """
+        Receives a string for the color required. Checks that the string is 
+        valid and returns the code for that color.
+
+        returns color_code        
+        """
+
+        RGB_NUM_PARTS = 3
+
+        # set color_code to store result
+        color_code = ''
+
+        # check if color_text is a word or a rgb code
+        if color_text.isalpha():
+
+            # color_text is a word
+            
+            if color_text in ReferenceConverter.basic_color_codes:
+                color_code = ReferenceConverter.basic_color_codes[color_text] 
+            elif color_text in ReferenceConverter.color_codes:
+                color_code = '38;2;' + ReferenceConverter.color_codes[color_text]
+        
+        else:
+
+            # color_text is not a word. 
+
+            # check that color_text is in valid rgb format
+
+            # set variable for current_color being a valid code
+            current_color_valid = False
+
+            # split current_color using ';' as the separator. Should
+            # receive a list with 3 integers between 0 and 255
+            color_code_list = color_text.split(';')
+
+            # check color_code_list
+            if len(color_code_list) == RGB_NUM_PARTS:
+
+                # correct number of entries for rgb
+
+                # check that the 3 sections of code are valid
+                for i in range(RGB_NUM_PARTS):
+
+                    # check if entry is not an integer between 0 and 255,
+                    # i.e. it is not valid
+                    if (color_code_list[i].isnumeric() == False
+                        or int(color_code_list[i]) < 0
+                        or int(color_code_list[i]) > 255):
+
+                        # incorrect format for integer between 0 and 255
+                        # break for loop (and current_color_valid remains
+                        # false)
+                        break
+
+                    # correct format for this entry
+
+                    # if this is the last entry then all entries were 
+                    # correct and color_text is a valid string
+                    if i == len(color_code_list) - 1:
+
+                        # update current_color_valid to True
+                        current_color_valid = True
+            
+            # append text color details if current_color_valid
+            if current_color_valid:
+
+                # set color_code
+                color_code = '38;2;' + color_text
+
+        # combine color_code with formatting text, if valid color_text
+        if color_code:
+            
+            # set color_code_text to string for changing text color
+            color_code_text = '\x1b[' + color_code + 'm'
+        
+        else:
+
+            # color_text was invalid
+            
+            # set color_code_text to an empty string
+            color_code_text = ''
+
+        return color_code_text
+
+"""
+differential testing
+"""
+
+# pieces of text used to build random messages. Invalid formatting 
+# instructions are included so that text that only looks like an instruction
+# is also compared.
+MARKUP_WORDS = ['a', 'to', 'the', 'text', 'message', 'formatting', 
+    'supercalifragilisticexpialidocious', '0123456789012345678901234567890', 
+    'end.', 'comma,']
+MARKUP_SPACES = [' ', ' ', ' ', '  ', '     ', '\t', '\n']
+MARKUP_INSTRUCTIONS = ['[b]', '[i]', '[s]', '[u]', '[n]', '[t05]', '[t20]', 
+    '[t99]', '[i04]', '[i10]', '[i00]', '[c-red]', '[c-teal]', '[c-crimson]',
+    '[c-none]', '[c-0;255;255]', '[c-255;255;255]']
+MARKUP_INVALID_INSTRUCTIONS = ['[', ']', '[]', '[x]', '[b', 'b]', '[t5]', 
+    '[c-]', '[c-notacolor]', '[c-256;0;0]', '[c-1;2]', '[[b]]', '[n[n]]']
+
+def generate_random_markup(random_generator, max_num_pieces=60) -> str:
+
+    """
+    Returns a random string of words, spaces and formatting instructions.\n
+    random_generator is a random.Random object so that the text can be 
+    recreated from a seed.\n
+    max_num_pieces is the maximum number of words, spaces and instructions
+    in the text.
+    """
+
+    # set list to store portions of text
+    text_list = []
+
+    # populate text_list
+    for i in range(random_generator.randint(0, max_num_pieces)):
+
+        # choose the type of the next piece of text
+        piece_type = random_generator.random()
+
+        if piece_type < 0.4:
+            text_list.append(random_generator.choice(MARKUP_WORDS))
+        elif piece_type < 0.7:
+            text_list.append(random_generator.choice(MARKUP_SPACES))
+        elif piece_type < 0.9:
+            text_list.append(random_generator.choice(MARKUP_INSTRUCTIONS))
+        else:
+            text_list.append(random_generator.choice(
+                MARKUP_INVALID_INSTRUCTIONS))
+
+    return ''.join(text_list)
+
+def convert_with_engine(engine, message_to_convert, PARAGRAPH_WIDTH, 
+    TEXT_INDENT, FOLLOWING_LINE_INDENT):
+
+    """
+    Converts message_to_convert with engine and returns a tuple with the list
+    of lines (or None if an exception was raised), the name of the exception 
+    type (or an empty string) and the time in seconds taken by the engine.
+    """
+
+    start_time = time.perf_counter()
+
+    try:
+
+        lines = engine(message_to_convert, PARAGRAPH_WIDTH=PARAGRAPH_WIDTH,
+            TEXT_INDENT=TEXT_INDENT, 
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+        exception_name = ''
+
+    except Exception as e:
+
+        # an exception is part of the behaviour being compared
+        lines = None
+        exception_name = type(e).__name__
+
+    return lines, exception_name, time.perf_counter() - start_time
+
+def run_differential_test(engine=None, NUM_ITERATIONS=2000, SEED=0,
+    MAX_NUM_PIECES=60) -> dict:
+
+    """
+    Converts NUM_ITERATIONS random messages with ReferenceConverter and with
+    engine and compares the results.\n
+    engine is a function with the same parameters as 
+    TerminalPrinter.convert_message(). By default 
+    TerminalPrinter.convert_message() is used.\n
+    SEED is used to create the random messages so a failure can be repeated.\n
+    Returns a dictionary with:\n
+        'passed' - True if every message was converted identically\n
+        'num_iterations' - the number of messages compared\n
+        'message', 'parameters' - the first message that was different and 
+        the PARAGRAPH_WIDTH, TEXT_INDENT and FOLLOWING_LINE_INDENT used\n
+        'line_number', 'reference_line', 'engine_line' - the first line that
+        was different (a line is None when the other result has more lines)\n
+        'reference_exception', 'engine_exception' - the names of exceptions
+        raised for the message that was different\n
+        'reference_time', 'engine_time' - the total time in seconds taken by 
+        each engine\n
+        'speed_ratio' - reference_time divided by engine_time so a value 
+        greater than 1 means that engine is faster than the reference
+    """
+
+    # use the current TerminalPrinter conversion by default
+    if engine is None:
+        engine = terminal_printer.TerminalPrinter.convert_message
+
+    random_generator = random.Random(SEED)
+
+    result = {'passed': True, 'num_iterations': 0, 'message': '', 
+        'parameters': None, 'line_number': -1, 'reference_line': None,
+        'engine_line': None, 'reference_exception': '', 
+        'engine_exception': '', 'reference_time': 0.0, 'engine_time': 0.0,
+        'speed_ratio': 0.0}
+
+    for i in range(NUM_ITERATIONS):
+
+        # create random message and random widths. The widths always leave 
+        # space for text in the same way as print_formatted() requires
+        message = generate_random_markup(random_generator, MAX_NUM_PIECES)
+        PARAGRAPH_WIDTH = random_generator.randint(12, 100)
+        TEXT_INDENT = random_generator.randint(0, 5)
+        FOLLOWING_LINE_INDENT = random_generator.randint(0, 5)
+
+        # convert message with both engines. The order alternates so that 
+        # neither engine always benefits from a warm cache
+        if i % 2:
+            engine_lines, engine_exception, engine_time = convert_with_engine(
+                engine, message, PARAGRAPH_WIDTH, TEXT_INDENT, 
+                FOLLOWING_LINE_INDENT)
+            reference_lines, reference_exception, reference_time = (
+                convert_with_engine(ReferenceConverter.convert_message, 
+                message, PARAGRAPH_WIDTH, TEXT_INDENT, FOLLOWING_LINE_INDENT))
+        else:
+            reference_lines, reference_exception, reference_time = (
+                convert_with_engine(ReferenceConverter.convert_message, 
+                message, PARAGRAPH_WIDTH, TEXT_INDENT, FOLLOWING_LINE_INDENT))
+            engine_lines, engine_exception, engine_time = convert_with_engine(
+                engine, message, PARAGRAPH_WIDTH, TEXT_INDENT, 
+                FOLLOWING_LINE_INDENT)
+
+        result['num_iterations'] += 1
+        result['reference_time'] += reference_time
+        result['engine_time'] += engine_time
+
+        # compare results
+        if reference_lines == engine_lines and (reference_exception
+            == engine_exception):
+            continue
+
+        # results are different so record the first difference
+        result['passed'] = False
+        result['message'] = message
+        result['parameters'] = (PARAGRAPH_WIDTH, TEXT_INDENT, 
+            FOLLOWING_LINE_INDENT)
+        result['reference_exception'] = reference_exception
+        result['engine_exception'] = engine_exception
+
+        if reference_lines is not None and engine_lines is not None:
+
+            # find first line that is different
+            for line_number in range(max(len(reference_lines), 
+                len(engine_lines))):
+
+                reference_line = (reference_lines[line_number] 
+                    if line_number < len(reference_lines) else None)
+                engine_line = (engine_lines[line_number]
+                    if line_number < len(engine_lines) else None)
+
+                if reference_line != engine_line:
+
+                    result['line_number'] = line_number
+                    result['reference_line'] = reference_line
+                    result['engine_line'] = engine_line
+                    break
+
+        break
+
+    # record relative speed of the engines
+    if result['engine_time']:
+        result['speed_ratio'] = result['reference_time'] / result['engine_time']
+
+    return result
+
+def print_differential_report(result) -> bool:
+
+    """
+    Prints the dictionary returned by run_differential_test() and returns 
+    whether the test passed
+    """
+
+    if result['passed']:
+
+        print("{:<15}{}".format('CORRECT', '{} messages were converted'
+            ' identically.'.format(result['num_iterations'])))
+
+    else:
+
+        print("{:<15}{}".format('INCORRECT', 'Message {} was converted'
+            ' differently.'.format(result['num_iterations'])))
+        print("Message: {!r}".format(result['message']))
+        print("PARAGRAPH_WIDTH, TEXT_INDENT, FOLLOWING_LINE_INDENT: {}".format(
+            result['parameters']))
+
+        if result['reference_exception'] or result['engine_exception']:
+            print("Reference exception: {!r}".format(
+                result['reference_exception']))
+            print("Engine exception: {!r}".format(result['engine_exception']))
+        else:
+            print("First different line: {}".format(result['line_number']))
+            print("Reference: {!r}".format(result['reference_line']))
+            print("Engine:    {!r}".format(result['engine_line']))
+
+    print("Reference time: {:.4f} s, engine time: {:.4f} s, engine is {:.2f}"
+        " times the speed of the reference.".format(result['reference_time'],
+        result['engine_time'], result['speed_ratio']))
+
+    return result['passed']
+
+if __name__ == '__main__':
+
+    sys.exit(0 if print_differential_report(run_differential_test()) else 1)
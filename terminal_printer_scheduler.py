@@ -0,0 +1,176 @@
+"""
+Author: Luke Morris
+
+This class runs functions at chosen times using a single thread. It is used
+by TerminalPrinter so that all loading trackers and timed messages share one
+thread rather than each having a thread that wakes up to check the time.
+
+The times are stored in a heap so the thread only wakes up when the next 
+function is due, regardless of how many functions are waiting.
+
+The functionality includes:
+
+    - schedule() which runs a function after a delay in seconds and returns
+        a timer that can be passed to cancel().
+    - cancel() which stops a function from being run.
+    - get_default_scheduler() which returns the Scheduler shared by all 
+        TerminalPrinter objects. The thread is only started the first time a
+        function is scheduled.
+
+Functions are run by the scheduler thread so they should finish quickly. An
+exception raised by a function is reported with sys.excepthook, which prints
+the traceback to stderr by default, and the thread continues to run the 
+other functions.
+
+Last modified: 19 October 2026
+"""
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+
+class Scheduler:
+
+    # the heap is rebuilt without cancelled timers when more than this number
+    # of cancelled timers are waiting and they are more than half of the heap
+    MIN_CANCELLED_TO_REBUILD = 64
+
+    def __init__(self) -> None:
+
+        # all variables below are only used while holding __condition
+        self.__condition = threading.Condition()
+        self.__heap = [] # timers as [due time, sequence number, function]
+        self.__sequence = itertools.count() # keeps timers with the same due
+        # time in the order they were scheduled
+        self.__num_cancelled = 0
+        self.__thread = None # created the first time a function is scheduled
+
+    def schedule(self, delay: float, function) -> list:
+
+        """
+        Runs function with no arguments after delay seconds. Returns the 
+        timer, which can be passed to cancel()
+        """
+
+        timer = [time.monotonic() + max(delay, 0), next(self.__sequence), 
+            function]
+
+        with self.__condition:
+
+            # start thread the first time a function is scheduled
+            if self.__thread is None:
+
+                self.__thread = threading.Thread(target=self.__run, 
+                    name='TerminalPrinterScheduler', daemon=True)
+                self.__thread.start()
+
+            heapq.heappush(self.__heap, timer)
+
+            # wake the thread only if the new timer is due first
+            if self.__heap[0] is timer:
+                self.__condition.notify()
+
+        return timer
+
+    def cancel(self, timer) -> bool:
+
+        """
+        Stops the function for timer from being run. Returns False if the 
+        function has already been run or cancelled
+        """
+
+        with self.__condition:
+
+            if timer[2] is None:
+                return False
+
+            # the timer is left in the heap and skipped when it is due
+            timer[2] = None
+            self.__num_cancelled += 1
+
+            # remove cancelled timers if they are most of the heap
+            if (self.__num_cancelled > self.MIN_CANCELLED_TO_REBUILD
+                and self.__num_cancelled * 2 > len(self.__heap)):
+
+                self.__heap = [entry for entry in self.__heap 
+                    if entry[2] is not None]
+                heapq.heapify(self.__heap)
+                self.__num_cancelled = 0
+
+        return True
+
+    def get_num_waiting(self) -> int:
+
+        """
+        Returns the number of functions waiting to be run
+        """
+
+        with self.__condition:
+            return len(self.__heap) - self.__num_cancelled
+
+    def __run(self) -> None:
+
+        """
+        Runs functions when they are due
+        """
+
+        while True:
+
+            with self.__condition:
+
+                # wait until the first timer is due
+                while True:
+
+                    if not self.__heap:
+
+                        self.__condition.wait()
+                        continue
+
+                    time_remaining = self.__heap[0][0] - time.monotonic()
+
+                    if time_remaining <= 0:
+                        break
+
+                    self.__condition.wait(time_remaining)
+
+                timer = heapq.heappop(self.__heap)
+                function = timer[2]
+
+                if function is None:
+
+                    # timer was cancelled
+                    self.__num_cancelled -= 1
+                    continue
+
+                # mark timer as run so that it can not be cancelled
+                timer[2] = None
+
+            # run function without holding __condition so that it can 
+            # schedule other functions
+            try:
+                function()
+            except Exception:
+                # report the error and keep running the other functions
+                sys.excepthook(*sys.exc_info())
+
+# Scheduler shared by all TerminalPrinter objects
+default_scheduler = None
+default_scheduler_lock = threading.Lock()
+
+def get_default_scheduler() -> Scheduler:
+
+    """
+    Returns the Scheduler shared by all TerminalPrinter objects, creating it
+    the first time it is used
+    """
+
+    global default_scheduler
+
+    with default_scheduler_lock:
+
+        if default_scheduler is None:
+            default_scheduler = Scheduler()
+
+    return default_scheduler
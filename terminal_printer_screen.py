@@ -0,0 +1,397 @@
+"""
+Author: Luke Morris
+
+This class controls the terminal screen by printing ANSI escape sequences,
+rather than starting a new process with os.system('cls'). All text is
+printed through a TerminalOutput object (by default TerminalPrinter.output)
+so that it is never printed in the middle of other text.
+
+The functionality includes:
+
+    - clear_screen() which clears the screen and moves the cursor to the top
+        left corner.
+    - clear_region() which clears a range of rows, clear_line() which
+        clears the row of the cursor and clear_to_end_of_line().
+    - move_cursor() which moves the cursor to a row and column, counted from
+        1 at the top left corner, and move_cursor_up(), move_cursor_down()
+        and move_cursor_to_column().
+    - save_cursor() and restore_cursor() which remember the position of the
+        cursor and return to it.
+    - hide_cursor() and show_cursor().
+    - enter_alternate_screen() and leave_alternate_screen() which switch to
+        a separate screen, for example for a full screen display, and back
+        to the original screen with its text unchanged.
+    - set_scroll_region() and reset_scroll_region() which choose the rows
+        that scroll when text reaches the bottom of the region.
+    - write() which adds text to print with the escape sequences.
+    - batch() which returns a context manager. The escape sequences and text
+        added inside the 'with' block are printed with a single write when
+        the block finishes:
+
+            with TerminalPrinter.screen.batch():
+                TerminalPrinter.screen.save_cursor()
+                TerminalPrinter.screen.move_cursor(1, 1)
+                TerminalPrinter.screen.write('Status: ok')
+                TerminalPrinter.screen.restore_cursor()
+
+        Outside of a batch each method prints its escape sequence straight
+        away. Each thread has its own batches, so text added by one thread
+        is never printed by, or in the middle of, another thread's batch.
+
+On Windows the console is asked to process escape sequences the first time
+anything is printed.
+
+Last modified: 19 October 2026
+"""
+
+import os
+# _thread._local is the class used by threading.local, without importing
+# threading, which would add to the time taken to import this module
+import _thread
+
+class ScreenControl:
+
+    # escape sequences
+    CLEAR_SCREEN = '\x1b[H\x1b[2J'
+    CLEAR_LINE = '\x1b[2K'
+    CLEAR_TO_END_OF_LINE = '\x1b[K'
+    SAVE_CURSOR = '\x1b7'
+    RESTORE_CURSOR = '\x1b8'
+    HIDE_CURSOR = '\x1b[?25l'
+    SHOW_CURSOR = '\x1b[?25h'
+    ENTER_ALTERNATE_SCREEN = '\x1b[?1049h'
+    LEAVE_ALTERNATE_SCREEN = '\x1b[?1049l'
+    RESET_SCROLL_REGION = '\x1b[r'
+
+    # whether the Windows console has been asked to process escape sequences
+    windows_console_ready = False
+
+    def __init__(self, output=None) -> None:
+
+        # TerminalOutput to print through. None means TerminalPrinter.output
+        self.__output = output
+
+        # batch state of each thread. pending_list holds the text waiting to
+        # be printed by the thread's batch and batch_depth the number of its
+        # batches that have not finished
+        self.__thread_state = _thread._local()
+
+    def get_output(self):
+
+        """
+        Returns the TerminalOutput that text is printed through
+        """
+
+        if self.__output is None:
+
+            import terminal_printer
+
+            return terminal_printer.TerminalPrinter.output
+
+        return self.__output
+
+    def batch(self):
+
+        """
+        Returns a context manager that prints all of the text added inside
+        its 'with' block with a single write when the block finishes
+        """
+
+        return ScreenBatch(self)
+
+    def batch_start(self) -> bool:
+
+        """
+        Called by ScreenBatch when a batch starts. Batches can be nested and
+        the text is printed when the outer batch finishes
+        """
+
+        state = self.__get_thread_state()
+        state.batch_depth += 1
+
+        return True
+
+    def batch_finish(self) -> bool:
+
+        """
+        Called by ScreenBatch when a batch finishes. Prints the text added
+        during the batch if this was the outer batch
+        """
+
+        state = self.__get_thread_state()
+        state.batch_depth -= 1
+
+        if state.batch_depth == 0:
+            self.flush()
+
+        return True
+
+    def flush(self) -> bool:
+
+        """
+        Prints all text waiting to be printed by this thread with a single
+        write
+        """
+
+        state = self.__get_thread_state()
+
+        if not state.pending_list:
+            return True
+
+        text = ''.join(state.pending_list)
+        state.pending_list = []
+
+        if os.name == 'nt' and not ScreenControl.windows_console_ready:
+            self.__prepare_windows_console()
+
+        return self.get_output().write(text)
+
+    def write(self, text: str) -> bool:
+
+        """
+        Prints text, or adds it to this thread's batch if there is one
+        """
+
+        state = self.__get_thread_state()
+
+        if not state.batch_depth:
+
+            if os.name == 'nt' and not ScreenControl.windows_console_ready:
+                self.__prepare_windows_console()
+
+            return self.get_output().write(text)
+
+        state.pending_list.append(text)
+
+        return True
+
+    def clear_screen(self) -> bool:
+
+        """
+        Clears the screen and moves the cursor to the top left corner
+        """
+
+        return self.write(self.CLEAR_SCREEN)
+
+    def clear_region(self, top_row: int, bottom_row: int) -> bool:
+
+        """
+        Clears the rows from top_row to bottom_row inclusive and leaves the
+        cursor at the start of top_row
+        """
+
+        text_list = []
+
+        for row in range(top_row, bottom_row + 1):
+            text_list.append('\x1b[{};1H'.format(row) + self.CLEAR_LINE)
+
+        text_list.append('\x1b[{};1H'.format(top_row))
+
+        return self.write(''.join(text_list))
+
+    def clear_line(self) -> bool:
+
+        """
+        Clears the row of the cursor and moves the cursor to its start
+        """
+
+        return self.write('\r' + self.CLEAR_LINE)
+
+    def clear_to_end_of_line(self) -> bool:
+
+        """
+        Clears the row of the cursor from the cursor to the end of the row
+        """
+
+        return self.write(self.CLEAR_TO_END_OF_LINE)
+
+    def move_cursor(self, row: int, column: int = 1) -> bool:
+
+        """
+        Moves the cursor to row and column. The top left corner is row 1,
+        column 1
+        """
+
+        return self.write('\x1b[{};{}H'.format(row, column))
+
+    def move_cursor_up(self, num_rows: int = 1) -> bool:
+
+        """
+        Moves the cursor up num_rows rows
+        """
+
+        if num_rows <= 0:
+            return True
+
+        return self.write('\x1b[{}A'.format(num_rows))
+
+    def move_cursor_down(self, num_rows: int = 1) -> bool:
+
+        """
+        Moves the cursor down num_rows rows
+        """
+
+        if num_rows <= 0:
+            return True
+
+        return self.write('\x1b[{}B'.format(num_rows))
+
+    def move_cursor_to_column(self, column: int = 1) -> bool:
+
+        """
+        Moves the cursor to column of the current row
+        """
+
+        return self.write('\x1b[{}G'.format(column))
+
+    def save_cursor(self) -> bool:
+
+        """
+        Remembers the position of the cursor for restore_cursor()
+        """
+
+        return self.write(self.SAVE_CURSOR)
+
+    def restore_cursor(self) -> bool:
+
+        """
+        Moves the cursor back to the position remembered by save_cursor()
+        """
+
+        return self.write(self.RESTORE_CURSOR)
+
+    def hide_cursor(self) -> bool:
+
+        """
+        Hides the cursor
+        """
+
+        return self.write(self.HIDE_CURSOR)
+
+    def show_cursor(self) -> bool:
+
+        """
+        Shows the cursor
+        """
+
+        return self.write(self.SHOW_CURSOR)
+
+    def enter_alternate_screen(self) -> bool:
+
+        """
+        Switches to the alternate screen. The original screen is shown again
+        by leave_alternate_screen()
+        """
+
+        return self.write(self.ENTER_ALTERNATE_SCREEN)
+
+    def leave_alternate_screen(self) -> bool:
+
+        """
+        Switches back from the alternate screen to the original screen
+        """
+
+        return self.write(self.LEAVE_ALTERNATE_SCREEN)
+
+    def set_scroll_region(self, top_row: int, bottom_row: int) -> bool:
+
+        """
+        Sets the rows from top_row to bottom_row inclusive as the only rows
+        that scroll. The terminal moves the cursor to the top left corner
+        """
+
+        return self.write('\x1b[{};{}r'.format(top_row, bottom_row))
+
+    def reset_scroll_region(self) -> bool:
+
+        """
+        Sets the whole screen to scroll again
+        """
+
+        return self.write(self.RESET_SCROLL_REGION)
+
+    @staticmethod
+    def get_size() -> tuple:
+
+        """
+        Returns the size of the terminal as a tuple (columns, rows). 80 by 24
+        is returned if the size can not be found
+        """
+
+        import shutil
+
+        size = shutil.get_terminal_size((80, 24))
+
+        return size.columns, size.lines
+
+    def __get_thread_state(self):
+
+        """
+        Returns the batch state of the calling thread, creating it the first
+        time the thread uses this ScreenControl
+        """
+
+        state = self.__thread_state
+
+        if not hasattr(state, 'batch_depth'):
+            state.pending_list = []
+            state.batch_depth = 0
+
+        return state
+
+    @staticmethod
+    def __prepare_windows_console() -> None:
+
+        """
+        Asks the Windows console to process escape sequences rather than
+        printing them
+        """
+
+        ScreenControl.windows_console_ready = True
+
+        try:
+
+            import ctypes
+
+            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+            STD_OUTPUT_HANDLE = -11
+
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+            mode = ctypes.c_uint32()
+
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                kernel32.SetConsoleMode(handle,
+                    mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+
+        except (AttributeError, OSError):
+
+            # not a console that can be changed
+            pass
+
+class ScreenBatch:
+
+    """
+    Context manager returned by ScreenControl.batch()
+    """
+
+    def __init__(self, screen: ScreenControl) -> None:
+
+        self.__screen = screen
+
+    def __enter__(self):
+
+        self.__screen.batch_start()
+
+        return self.__screen
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+
+        self.__screen.batch_finish()
+
+        # exceptions are not suppressed
+        return False
+
+# ScreenControl used by TerminalPrinter.screen, printing through
+# TerminalPrinter.output
+default_screen = ScreenControl()
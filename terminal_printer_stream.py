@@ -0,0 +1,152 @@
+"""
+Author: Luke Morris
+
+This module converts text with the formatting commands of print_formatted()
+while it is read from a file or pipe, so that a file of any size can be
+printed without reading all of it into memory first.
+
+The file is read in blocks of BLOCK_SIZE bytes. Each block is decoded and
+passed to a MessageConverter with feed() in parts of FEED_SIZE characters,
+and the lines that were finished are written to the sink with a single
+writelines() call. The converter keeps the formatting, the line being filled
+and its indent between the blocks, so the lines printed are the same as
+print_formatted() would print for the whole file as one message.
+
+The functionality includes:
+
+    - format_stream() which converts a file, or a file object such as
+        sys.stdin.buffer, and writes the lines to a sink. It returns the
+        number of bytes read and lines written, the time taken and the
+        throughput in MB per second.
+    - feed_converter() which passes text to a MessageConverter in short
+        parts and writes the lines that were finished.
+
+TerminalPrinter.print_formatted_file() prints a file through
+TerminalPrinter.output or another sink.
+
+Last modified: 19 October 2026
+"""
+
+import codecs
+import os
+import time
+import terminal_printer
+
+# number of bytes read from the file at a time
+BLOCK_SIZE = 1048576
+
+# number of characters passed to the converter at a time. The buffer of the
+# converter is emptied from the front so it is kept short
+FEED_SIZE = 2048
+
+def format_stream(input_file, sink=None, PARAGRAPH_WIDTH=80, TEXT_INDENT=0,
+    FOLLOWING_LINE_INDENT=0, ENCODING='utf-8') -> dict:
+
+    """
+    Converts the text of input_file, a file path or a file object opened for
+    reading, and writes the printable lines to sink, which is any object
+    with a writelines() method. None means TerminalPrinter.output. See
+    TerminalPrinter.print_formatted() for details of the other parameters.
+    ENCODING is used for files read as bytes.\n
+    Returns a dictionary with 'num_bytes' read, 'num_lines' written,
+    'seconds' taken and 'mb_per_second'. Raises ValueError if the indents
+    leave no space for text.
+    """
+
+    if PARAGRAPH_WIDTH <= TEXT_INDENT + max(FOLLOWING_LINE_INDENT, 0):
+        raise ValueError('TEXT_INDENT plus FOLLOWING_LINE_INDENT must be less'
+            ' than PARAGRAPH_WIDTH.')
+
+    if sink is None:
+        write_lines = write_to_output
+    else:
+        write_lines = sink.writelines
+
+    # open a file path, which is closed when finished
+    if isinstance(input_file, (str, bytes, os.PathLike)):
+        file = open(input_file, 'rb')
+    else:
+        file = input_file
+
+    decoder = codecs.getincrementaldecoder(ENCODING)(errors='replace')
+    converter = terminal_printer.MessageConverter.acquire()
+
+    num_bytes = 0
+    num_lines = 0
+    only_spaces = True # whether all text read so far was spaces
+    start_time = time.perf_counter()
+
+    try:
+
+        converter.start_lines(PARAGRAPH_WIDTH=PARAGRAPH_WIDTH,
+            TEXT_INDENT=TEXT_INDENT,
+            FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT)
+
+        while True:
+
+            block = file.read(BLOCK_SIZE)
+
+            if not block:
+                break
+
+            num_bytes += len(block)
+
+            # files opened in text mode are already decoded
+            if isinstance(block, bytes):
+                text = decoder.decode(block)
+            else:
+                text = block
+
+            only_spaces = only_spaces and (not text or text.isspace())
+
+            num_lines += feed_converter(converter, text, write_lines)
+
+        num_lines += feed_converter(converter, decoder.decode(b'', True),
+            write_lines)
+
+        # print_formatted() does not print a message that is only spaces
+        line_list = converter.finish()
+
+        if line_list and not (only_spaces and num_bytes):
+
+            write_lines([line + '\n' for line in line_list])
+            num_lines += len(line_list)
+
+    finally:
+
+        terminal_printer.MessageConverter.release(converter)
+
+        if file is not input_file:
+            file.close()
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return {'num_bytes': num_bytes, 'num_lines': num_lines,
+        'seconds': elapsed_time,
+        'mb_per_second': num_bytes / 1000000 / max(elapsed_time, 1e-9)}
+
+def feed_converter(converter, text: str, write_lines) -> int:
+
+    """
+    Passes text to converter in parts of FEED_SIZE characters, writes the
+    lines that were finished with write_lines and returns the number of
+    lines written
+    """
+
+    line_list = []
+
+    for position in range(0, len(text), FEED_SIZE):
+        line_list.extend(converter.feed(text[position:position + FEED_SIZE]))
+
+    if line_list:
+        write_lines([line + '\n' for line in line_list])
+
+    return len(line_list)
+
+def write_to_output(line_list: list) -> None:
+
+    """
+    Writes line_list to TerminalPrinter.output with a single write
+    """
+
+    terminal_printer.TerminalPrinter.output.write(''.join(line_list))
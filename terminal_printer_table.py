@@ -0,0 +1,293 @@
+"""
+Author: Luke Morris
+
+This class prints tables of formatted text. Each cell can include the
+formatting commands of print_formatted() and cells that are wider than their
+column are wrapped onto more lines with the same rules as
+TerminalPrinter.convert_message().
+
+The width of each column is the widest visible text in the column, with the
+formatting commands not counted, up to MAX_COLUMN_WIDTH. The widths can be
+found in two ways:
+
+    - 'streaming' mode, the default, which measures the first SAMPLE_SIZE
+        rows. Only those rows are kept in memory so any number of rows can be
+        printed, including rows read from a generator. Cells in later rows
+        that are wider than their column are wrapped.
+    - 'exact' mode which measures every row before printing. The rows are
+        read twice so they must be a list or a function that returns an
+        iterator of the rows each time it is called.
+
+The functionality includes:
+
+    - render() which returns a generator of the printable lines of the table.
+        Lines are created as they are needed.
+    - get_visible_width() which returns the number of characters of text
+        printed for a string with formatting commands.
+
+TerminalPrinter.print_table() prints a table, writing the lines in groups so
+that memory use does not grow with the number of rows.
+
+Last modified: 19 October 2026
+"""
+
+import itertools
+import re
+import terminal_printer
+
+# escape sequence that changes the formatting of text
+FORMATTING_PATTERN = re.compile('\x1b\\[[0-9;]*m')
+
+# formatting that clears all formatting
+CLEAR_FORMATTING = '\x1b[0m'
+
+# characters that convert_message() changes: the start of a formatting 
+# command and whitespace other than spaces, such as tabs, which are printed 
+# as spaces. Text containing them must be converted
+CONVERTED_CHARACTER_PATTERN = re.compile('[\\[\n\t\r\x0b\x0c]')
+
+def get_visible_width(text: str) -> int:
+
+    """
+    Returns the number of characters printed for text, which can include the
+    formatting commands of print_formatted(). For text over several lines the
+    width of the widest line is returned
+    """
+
+    text = str(text)
+
+    # text without formatting commands is printed as it is
+    if CONVERTED_CHARACTER_PATTERN.search(text) is None:
+        return len(text)
+
+    # convert with a width that no line can reach so that nothing is wrapped.
+    # A tab can add up to 99 spaces
+    line_list = terminal_printer.TerminalPrinter.convert_message(text,
+        PARAGRAPH_WIDTH=100 * len(text) + 1)
+
+    return max((len(FORMATTING_PATTERN.sub('', line)) for line in
+        '\n'.join(line_list).split('\n')), default=0)
+
+class TableRenderer:
+
+    # choices for MODE
+    MODES = ('streaming', 'exact')
+
+    # maximum number of wrapped cells kept so that cells that are repeated,
+    # such as a status, are only wrapped once
+    WRAP_CACHE_MAX_SIZE = 1024
+
+    def __init__(self, header_list=None, MODE='streaming', SAMPLE_SIZE=100,
+        MAX_COLUMN_WIDTH=40, PARAGRAPH_WIDTH=80, SEPARATOR=' | ',
+        HEADER_LINE_CHARACTER='-') -> None:
+
+        """
+        header_list is a list with the heading of each column, or None for no
+        headings. MODE is 'streaming' or 'exact' (see above). SAMPLE_SIZE is
+        the number of rows measured in 'streaming' mode. MAX_COLUMN_WIDTH is
+        the maximum width of a column. Columns are made narrower if the table
+        would be wider than PARAGRAPH_WIDTH. SEPARATOR is printed between
+        columns and HEADER_LINE_CHARACTER is used for the line below the
+        headings.
+        """
+
+        if MODE not in self.MODES:
+            raise ValueError('MODE must be one of ' + ', '.join(self.MODES)
+                + '.')
+
+        self.header_list = header_list
+        self.mode = MODE
+        self.sample_size = SAMPLE_SIZE
+        self.max_column_width = MAX_COLUMN_WIDTH
+        self.paragraph_width = PARAGRAPH_WIDTH
+        self.separator = SEPARATOR
+        self.header_line_character = HEADER_LINE_CHARACTER
+        self.__wrap_cache = {} # (cell, width): list of lines
+
+    def render(self, rows):
+
+        """
+        Returns a generator of the printable lines of the table. rows is an
+        iterable of rows, each a list of cells. In 'exact' mode rows must be
+        a list (or other sequence) or a function that returns an iterator of
+        the rows.
+        """
+
+        if self.mode == 'exact':
+
+            if callable(rows):
+                row_source = rows
+            elif iter(rows) is rows:
+                raise ValueError("'exact' mode reads the rows twice so rows "
+                    'must be a list or a function that returns the rows.')
+            else:
+                row_source = lambda: rows
+
+            # measure every row, then read the rows again to print them
+            width_list = self.__measure(row_source())
+
+            return self.__render_rows(width_list, row_source())
+
+        # measure the first rows and keep them to print first
+        row_iterator = iter(rows)
+        sample_list = list(itertools.islice(row_iterator, self.sample_size))
+        width_list = self.__measure(sample_list)
+
+        return self.__render_rows(width_list,
+            itertools.chain(sample_list, row_iterator))
+
+    def __measure(self, row_iterable) -> list:
+
+        """
+        Returns a list with the width of each column for the rows in
+        row_iterable and the headings
+        """
+
+        width_list = []
+
+        if self.header_list:
+            row_iterable = itertools.chain([self.header_list], row_iterable)
+
+        for row in row_iterable:
+
+            # add columns that are not in the earlier rows
+            if len(row) > len(width_list):
+                width_list.extend([0] * (len(row) - len(width_list)))
+
+            for column, cell in enumerate(row):
+
+                # cells already at the maximum width do not need measuring
+                if width_list[column] < self.max_column_width:
+                    width_list[column] = max(width_list[column],
+                        get_visible_width(cell))
+
+        width_list = [max(min(width, self.max_column_width), 1)
+            for width in width_list]
+
+        # make the widest columns narrower until the table fits
+        available_width = (self.paragraph_width
+            - len(self.separator) * (len(width_list) - 1))
+
+        while width_list and sum(width_list) > available_width:
+
+            widest_column = width_list.index(max(width_list))
+
+            if width_list[widest_column] == 1:
+                break
+
+            width_list[widest_column] -= 1
+
+        return width_list
+
+    def __render_rows(self, width_list: list, row_iterable):
+
+        """
+        Generator of the printable lines of the headings and the rows in
+        row_iterable
+        """
+
+        if self.header_list:
+
+            yield from self.__render_row(width_list, self.header_list)
+
+            yield (self.separator.replace('|', '+').replace(' ',
+                self.header_line_character)).join(
+                self.header_line_character * width for width in width_list)
+
+        for row in row_iterable:
+            yield from self.__render_row(width_list, row)
+
+    def __render_row(self, width_list: list, row):
+
+        """
+        Returns a list of the printable lines of row, with each cell wrapped
+        to the width of its column
+        """
+
+        cell_line_list = []
+
+        for column, width in enumerate(width_list):
+
+            cell = str(row[column]) if column < len(row) else ''
+
+            # text without formatting commands or tabs that fits does not 
+            # need wrapping
+            if (len(cell) <= width
+                and CONVERTED_CHARACTER_PATTERN.search(cell) is None):
+
+                cell_line_list.append([cell + ' ' * (width - len(cell))])
+                continue
+
+            wrapped_line_list = self.__wrap_cache.get((cell, width))
+
+            if wrapped_line_list is None:
+
+                wrapped_line_list = self.__wrap_cell(cell, width)
+
+                # empty the cache when it is full so that memory use does not
+                # grow with the number of rows
+                if len(self.__wrap_cache) >= self.WRAP_CACHE_MAX_SIZE:
+                    self.__wrap_cache.clear()
+
+                self.__wrap_cache[(cell, width)] = wrapped_line_list
+
+            cell_line_list.append(wrapped_line_list)
+
+        # a row without cells in a table without columns is a blank line
+        num_lines = max((len(line_list) for line_list in cell_line_list),
+            default=1)
+
+        line_list = []
+
+        for line_number in range(num_lines):
+
+            line_list.append(self.separator.join(
+                cell_lines[line_number] if line_number < len(cell_lines)
+                else ' ' * width_list[column]
+                for column, cell_lines in enumerate(cell_line_list)).rstrip())
+
+        return line_list
+
+    @staticmethod
+    def __wrap_cell(cell: str, width: int) -> list:
+
+        """
+        Returns a list of the lines of cell wrapped to width, each padded
+        with spaces to width. Formatting is cleared at the end of each line
+        and started again on the next line
+        """
+
+        converted_line_list = '\n'.join(
+            terminal_printer.TerminalPrinter.convert_message(cell,
+            PARAGRAPH_WIDTH=width)).split('\n')
+
+        # a line that only clears formatting is added when the text fills the
+        # last line so it is removed
+        while (len(converted_line_list) > 1 
+            and not FORMATTING_PATTERN.sub('', converted_line_list[-1])):
+            converted_line_list.pop()
+
+        line_list = []
+        style = ''
+
+        for converted_line in converted_line_list:
+
+            visible_width = len(FORMATTING_PATTERN.sub('', converted_line))
+
+            # line starts with the formatting at the end of the previous line
+            line = style + converted_line
+
+            # find formatting at the end of the line
+            for match in FORMATTING_PATTERN.finditer(converted_line):
+
+                if match.group() == CLEAR_FORMATTING:
+                    style = ''
+                else:
+                    style += match.group()
+
+            if '\x1b' in line:
+                line += CLEAR_FORMATTING
+
+            line_list.append(line + ' ' * (width - visible_width))
+
+        return line_list
@@ -0,0 +1,204 @@
+"""
+Author: Luke Morris
+
+This class limits how often status messages are printed, for loops that
+print a status message many thousands of times per second. Only the latest
+message for each channel is kept until it is printed and messages are
+printed at most MAX_RATE times per second. Messages replaced before they are
+printed are never converted, so the cost of a message that is not printed is
+only storing it.
+
+The functionality includes:
+
+    - set_status() which stores the latest message for a channel. The message
+        is printed straight away if nothing has been printed for
+        1 / MAX_RATE seconds, otherwise it is printed by the Scheduler (see
+        terminal_printer_scheduler) when that time has passed.
+    - flush() which prints the waiting messages straight away. It is called
+        when the program exits so that the last status is always printed.
+    - set_max_rate() which changes the maximum number of times per second
+        that messages are printed.
+    - get_num_dropped() which returns the number of messages that were
+        replaced before they were printed.
+
+Messages are converted with TerminalPrinter.convert_message() and the
+waiting messages of all channels are written to TerminalPrinter.output 
+together with a single write. The channels are passed to the write so that,
+when the background writer uses the 'collapse' policy and its queue is full,
+older statuses for the same channels are discarded.
+
+Last modified: 19 October 2026
+"""
+
+# _thread.allocate_lock() gives the same lock as threading.Lock() without
+# importing threading, which would add to the time taken to import this module
+import _thread
+import time
+import terminal_printer
+
+class StatusThrottle:
+
+    def __init__(self, MAX_RATE: float = 10, scheduler=None) -> None:
+
+        """
+        MAX_RATE is the maximum number of times per second that messages are
+        printed. scheduler is the Scheduler used, by default the shared
+        Scheduler. Raises ValueError if MAX_RATE is not greater than 0
+        """
+
+        self.__time_between_prints = self.__get_time_between_prints(MAX_RATE)
+        self.__scheduler = scheduler
+
+        # all variables below are only used while holding __lock
+        self.__lock = _thread.allocate_lock()
+        self.__pending_dict = {} # channel: (message, PARAGRAPH_WIDTH,
+        # TEXT_INDENT, FOLLOWING_LINE_INDENT)
+        self.__timer = None # timer for printing the waiting messages
+        self.__last_print_time = 0.0
+        self.__num_dropped = 0
+        self.__exit_registered = False
+
+    def set_max_rate(self, MAX_RATE: float) -> bool:
+
+        """
+        Sets the maximum number of times per second that messages are 
+        printed. Raises ValueError if MAX_RATE is not greater than 0
+        """
+
+        self.__time_between_prints = self.__get_time_between_prints(MAX_RATE)
+
+        return True
+
+    @staticmethod
+    def __get_time_between_prints(MAX_RATE: float) -> float:
+
+        """
+        Returns the minimum time in seconds between prints for MAX_RATE
+        """
+
+        # NaN is also rejected as it is not greater than 0
+        if not MAX_RATE > 0:
+            raise ValueError('MAX_RATE must be greater than 0.')
+
+        return 1 / MAX_RATE
+
+    def get_num_dropped(self) -> int:
+
+        """
+        Returns the number of messages that were replaced by a newer message
+        for the same channel before they were printed
+        """
+
+        return self.__num_dropped
+
+    def set_status(self, message: str, channel='status', PARAGRAPH_WIDTH=80,
+        TEXT_INDENT=0, FOLLOWING_LINE_INDENT=0) -> bool:
+
+        """
+        Stores message as the latest message for channel. See
+        TerminalPrinter.print_formatted() for details of the other
+        parameters
+        """
+
+        with self.__lock:
+
+            if channel in self.__pending_dict:
+                self.__num_dropped += 1
+
+            self.__pending_dict[channel] = (message, PARAGRAPH_WIDTH,
+                TEXT_INDENT, FOLLOWING_LINE_INDENT)
+
+            # a print is already waiting so message will be included
+            if self.__timer is not None:
+                return True
+
+            # make sure the last messages are printed when the program exits
+            if not self.__exit_registered:
+
+                import atexit
+
+                atexit.register(self.flush)
+                self.__exit_registered = True
+
+            delay = (self.__last_print_time + self.__time_between_prints
+                - time.monotonic())
+
+            if delay <= 0:
+
+                self.__print_pending()
+
+            else:
+
+                if self.__scheduler is None:
+
+                    import terminal_printer_scheduler
+
+                    self.__scheduler = \
+                        terminal_printer_scheduler.get_default_scheduler()
+
+                self.__timer = self.__scheduler.schedule(delay,
+                    self.__print_from_timer)
+
+        return True
+
+    def flush(self) -> bool:
+
+        """
+        Prints the waiting messages straight away
+        """
+
+        with self.__lock:
+
+            if self.__timer is not None:
+
+                self.__scheduler.cancel(self.__timer)
+                self.__timer = None
+
+            self.__print_pending()
+
+        return True
+
+    def __print_from_timer(self) -> None:
+
+        """
+        Prints the waiting messages. Called by the scheduler
+        """
+
+        with self.__lock:
+
+            self.__timer = None
+            self.__print_pending()
+
+    def __print_pending(self) -> None:
+
+        """
+        Converts and prints the waiting messages with a single write. Must be
+        called while holding __lock
+        """
+
+        if not self.__pending_dict:
+            return
+
+        self.__last_print_time = time.monotonic()
+
+        line_list = []
+        channel = tuple(self.__pending_dict)
+
+        for (message, PARAGRAPH_WIDTH, TEXT_INDENT,
+            FOLLOWING_LINE_INDENT) in self.__pending_dict.values():
+
+            line_list.extend(terminal_printer.TerminalPrinter.convert_message(
+                message, PARAGRAPH_WIDTH=PARAGRAPH_WIDTH,
+                TEXT_INDENT=TEXT_INDENT,
+                FOLLOWING_LINE_INDENT=FOLLOWING_LINE_INDENT))
+
+        self.__pending_dict.clear()
+
+        if line_list:
+
+            line_list.append('')
+            terminal_printer.TerminalPrinter.output.write('\n'.join(line_list),
+                channel=channel)
+
+# StatusThrottle used by TerminalPrinter.print_status()
+default_throttle = StatusThrottle()